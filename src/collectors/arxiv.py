@@ -0,0 +1,331 @@
+"""arXiv論文メタデータ Collector。"""
+
+import logging
+import os
+import re
+import sqlite3
+import time
+import xml.etree.ElementTree as ET
+from datetime import UTC, datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+import httpx
+from dotenv import load_dotenv
+
+from src.errors import CollectionError
+from src.models.blog_post import CollectedData
+from src.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# arXiv APIの利用規約で求められるリクエスト間隔（秒）
+ARXIV_REQUEST_INTERVAL = 3.0
+# 1リクエストのid_listに含める最大ID数
+ARXIV_BATCH_SIZE = 100
+# バージョン指定のないIDについて、キャッシュの最新版を使う期間（秒）
+LATEST_VERSION_TTL = 24 * 60 * 60
+
+# 新形式（2401.12345）と旧形式（cs/0112017, math.GT/0309136）のarXiv ID
+_ARXIV_ID = re.compile(
+    r"^(?:arxiv:)?(?P<id>\d{4}\.\d{4,5}|[a-z][a-z\-]*(?:\.[A-Z]{2})?/\d{7})(?:v(?P<version>\d+))?$",
+    re.IGNORECASE,
+)
+_ARXIV_HOSTS = frozenset({"arxiv.org", "www.arxiv.org", "export.arxiv.org"})
+# 論文を指すURLのパスの先頭部分
+_ARXIV_PATH_PREFIXES = ("/abs/", "/pdf/", "/html/")
+_NS = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+_ENTRY_TAG = f"{{{_NS['atom']}}}entry"
+
+
+def parse_arxiv_id(value: str) -> str | None:
+    """arXiv ID・arXivのURLから、バージョン付きのIDを取り出す。
+
+    Args:
+        value: ``2401.12345``, ``arXiv:2401.12345v2``, ``https://arxiv.org/abs/2401.12345`` 等
+
+    Returns:
+        ID（バージョン指定があれば ``v2`` 等を含む）。arXivの論文を指さない場合はNone
+    """
+    value = value.strip()
+    if value.startswith(("http://", "https://")):
+        parsed = urlparse(value)
+        if (parsed.hostname or "").lower() not in _ARXIV_HOSTS:
+            return None
+        prefix = next((p for p in _ARXIV_PATH_PREFIXES if parsed.path.startswith(p)), None)
+        if prefix is None:
+            return None
+        value = parsed.path[len(prefix) :].removesuffix("/").removesuffix(".pdf")
+    match = _ARXIV_ID.match(value)
+    if match is None:
+        return None
+    version = match.group("version")
+    return f"{match.group('id')}v{version}" if version else match.group("id")
+
+
+def split_version(arxiv_id: str) -> tuple[str, int | None]:
+    """バージョン付きのarXiv IDを、IDとバージョン番号に分ける。"""
+    match = _ARXIV_ID.match(arxiv_id)
+    if match is None:
+        return arxiv_id, None
+    version = match.group("version")
+    return match.group("id"), int(version) if version else None
+
+
+def _text(element: ET.Element, path: str) -> str:
+    """子要素のテキストを空白を整理して返す。"""
+    child = element.find(path, _NS)
+    return " ".join((child.text or "").split()) if child is not None else ""
+
+
+def parse_entry(entry: ET.Element) -> CollectedData | None:
+    """Atomフィードのentry要素をCollectedDataに変換する。エラーのentryはNone。"""
+    entry_id = _text(entry, "atom:id")
+    if not entry_id or "/api/errors" in entry_id:
+        return None
+    title = _text(entry, "atom:title")
+    authors = [_text(author, "atom:name") for author in entry.findall("atom:author", _NS)]
+    categories = [category.get("term", "") for category in entry.findall("atom:category", _NS)]
+    published = _text(entry, "atom:published")
+    parts = [
+        f"# {title}",
+        f"\nAuthors: {', '.join(authors)}",
+        f"Published: {published[:10]} | Categories: {', '.join(categories)}",
+    ]
+    comment = _text(entry, "arxiv:comment")
+    if comment:
+        parts.append(f"Comment: {comment}")
+    parts.append(f"\n## Abstract\n{_text(entry, 'atom:summary')}")
+    return CollectedData(
+        source="arxiv",
+        title=title,
+        url=entry_id.replace("http://", "https://", 1),
+        content="\n".join(parts),
+        collected_at=datetime.now(UTC),
+        published_date=published[:10] or None,
+    )
+
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    kind TEXT NOT NULL,
+    arxiv_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (kind, arxiv_id, version)
+);
+"""
+
+
+class ArxivCache:
+    """arXiv論文の取得結果をIDとバージョンごとに保存するキャッシュ（SQLite）。
+
+    arXivの各バージョンは公開後に変更されないため、バージョン指定の取得結果は
+    期限なしで再利用する。バージョン指定のない取得には、保存済みの最新版を
+    ``latest_ttl`` 秒の間だけ使う。
+
+    Args:
+        path: SQLiteファイルのパス（``:memory:`` でメモリ上）
+        latest_ttl: バージョン指定のない取得に最新版を使う期間（秒）
+    """
+
+    def __init__(self, path: Path | str, latest_ttl: float = LATEST_VERSION_TTL) -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(_CACHE_SCHEMA)
+        self._latest_ttl = latest_ttl
+
+    def close(self) -> None:
+        """DB接続をクローズする。"""
+        self._conn.close()
+
+    def get(self, arxiv_id: str, kind: str = "metadata") -> str | None:
+        """保存済みのデータを返す。
+
+        Args:
+            arxiv_id: arXiv ID（バージョン指定可）
+            kind: データの種類
+
+        Returns:
+            保存したデータ。ない場合、またはバージョン指定がなく最新版が古い場合はNone
+        """
+        base_id, version = split_version(arxiv_id)
+        if version is not None:
+            row = self._conn.execute(
+                "SELECT data FROM papers WHERE kind = ? AND arxiv_id = ? AND version = ?",
+                (kind, base_id, version),
+            ).fetchone()
+        else:
+            row = self._conn.execute(
+                "SELECT data FROM papers WHERE kind = ? AND arxiv_id = ? AND stored_at >= ? "
+                "ORDER BY version DESC LIMIT 1",
+                (kind, base_id, time.time() - self._latest_ttl),
+            ).fetchone()
+        return str(row[0]) if row else None
+
+    def put(self, arxiv_id: str, data: str, kind: str = "metadata") -> None:
+        """バージョン付きのarXiv IDでデータを保存する。バージョンのないIDは保存しない。"""
+        base_id, version = split_version(arxiv_id)
+        if version is None:
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO papers (kind, arxiv_id, version, data, stored_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (kind, base_id, version, data, time.time()),
+            )
+
+
+class ArxivCollector:
+    """arXiv APIで論文のメタデータ（タイトル・著者・アブストラクト等）を取得するCollector。
+
+    複数の論文は ``id_list`` にまとめて1リクエストで取得し、Atomフィードは受信しながら
+    逐次解析する。リクエストはarXiv APIの利用規約に従い3秒間隔に制限する。
+    ``cache`` （または環境変数 ``ARXIV_CACHE_PATH``）を指定すると、取得結果を
+    IDとバージョンごとに保存し、再取得しない。
+
+    Args:
+        timeout: タイムアウト（秒）
+        cache: 取得結果のキャッシュ
+        rate_limiter: リクエスト間隔を制御するレートリミッター（省略時は3秒に1回）
+        api_url: APIのURL（テスト用のスタブサーバー等に差し替える場合に指定）
+    """
+
+    API_URL = "https://export.arxiv.org/api/query"
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        cache: ArxivCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        api_url: str | None = None,
+    ) -> None:
+        load_dotenv()
+        cache_path = os.environ.get("ARXIV_CACHE_PATH", "")
+        self._cache = cache or (ArxivCache(cache_path) if cache_path else None)
+        self._rate_limiter = rate_limiter or TokenBucket(rate=1 / ARXIV_REQUEST_INTERVAL)
+        self._timeout = timeout
+        self._api_url = api_url or self.API_URL
+
+    async def collect(self, query: str, **kwargs: object) -> list[CollectedData]:
+        """arXiv論文のメタデータを取得する。
+
+        Args:
+            query: arXiv ID（``2401.12345``, ``2401.12345v2``）またはarXivのURL
+            **kwargs: 未使用
+
+        Returns:
+            論文メタデータのリスト（見つからない場合は空）
+
+        Raises:
+            CollectionError: IDが不正な場合、またはAPI呼び出しに失敗した場合
+        """
+        if parse_arxiv_id(query) is None:
+            raise CollectionError(source="arxiv", message=f"arXiv IDを解釈できません: {query}")
+        return await self.collect_many([query])
+
+    async def collect_many(self, queries: list[str], **kwargs: object) -> list[CollectedData]:
+        """複数のarXiv論文のメタデータをまとめて取得する。
+
+        キャッシュにない論文のみを ``batch_size`` 件ずつ ``id_list`` で問い合わせる。
+
+        Args:
+            queries: arXiv IDまたはarXivのURLのリスト
+            **kwargs:
+                batch_size: 1リクエストあたりのID数（デフォルト: 100）
+
+        Returns:
+            取得できた論文メタデータのリスト（入力順）。解釈できないID・存在しない論文は除く
+
+        Raises:
+            CollectionError: API呼び出しに失敗した場合
+        """
+        batch_val = kwargs.get("batch_size", ARXIV_BATCH_SIZE)
+        batch_size = int(batch_val) if isinstance(batch_val, (int, str)) else ARXIV_BATCH_SIZE
+
+        ids: list[str] = []
+        for query in queries:
+            arxiv_id = parse_arxiv_id(query)
+            if arxiv_id is None:
+                logger.warning("arXiv IDを解釈できません: %s", query)
+            elif arxiv_id not in ids:
+                ids.append(arxiv_id)
+
+        found: dict[str, CollectedData] = {}
+        missing: list[str] = []
+        for arxiv_id in ids:
+            cached = self._cache.get(arxiv_id) if self._cache else None
+            if cached is not None:
+                found[arxiv_id] = CollectedData.model_validate_json(cached)
+            else:
+                missing.append(arxiv_id)
+
+        if missing:
+            try:
+                async with httpx.AsyncClient(
+                    timeout=self._timeout, follow_redirects=True
+                ) as client:
+                    for start in range(0, len(missing), batch_size):
+                        batch = missing[start : start + batch_size]
+                        found.update(await self._fetch_batch(client, batch))
+            except httpx.HTTPError as e:
+                raise CollectionError(source="arxiv", message=str(e)) from e
+
+        results: list[CollectedData] = []
+        for arxiv_id in ids:
+            if arxiv_id in found:
+                results.append(found[arxiv_id])
+            else:
+                logger.warning("arXiv論文が見つかりません: %s", arxiv_id)
+        return results
+
+    async def _fetch_batch(
+        self, client: httpx.AsyncClient, ids: list[str]
+    ) -> dict[str, CollectedData]:
+        """id_listで論文をまとめて取得し、要求したIDごとの結果を返す。"""
+        requested: dict[str, list[str]] = {}
+        for arxiv_id in ids:
+            requested.setdefault(split_version(arxiv_id)[0], []).append(arxiv_id)
+        results: dict[str, CollectedData] = {}
+        await self._rate_limiter.acquire()
+        async with client.stream(
+            "GET",
+            self._api_url,
+            params={"id_list": ",".join(ids), "max_results": str(len(ids))},
+        ) as response:
+            response.raise_for_status()
+            parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("end",))
+            try:
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+                    for data in self._parsed_entries(parser):
+                        versioned = parse_arxiv_id(data.url or "")
+                        if versioned is None:
+                            continue
+                        if self._cache is not None:
+                            self._cache.put(versioned, data.model_dump_json())
+                        base_id, version = split_version(versioned)
+                        for requested_id in requested.get(base_id, []):
+                            # バージョン指定のないIDには、返された最新版を対応づける
+                            if split_version(requested_id)[1] in (None, version):
+                                results[requested_id] = data
+                parser.close()
+            except ET.ParseError as e:
+                raise CollectionError(source="arxiv", message=f"XMLパースエラー: {e}") from e
+        return results
+
+    @staticmethod
+    def _parsed_entries(parser: "ET.XMLPullParser[ET.Element]") -> list[CollectedData]:
+        """解析済みのentry要素を変換し、メモリから解放する。"""
+        entries: list[CollectedData] = []
+        for event in parser.read_events():
+            element = event[-1]
+            if not isinstance(element, ET.Element) or element.tag != _ENTRY_TAG:
+                continue
+            data = parse_entry(element)
+            element.clear()
+            if data is not None:
+                entries.append(data)
+        return entries
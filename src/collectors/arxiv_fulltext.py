@@ -0,0 +1,343 @@
+"""arXiv論文本文 Collector。
+
+arXivのHTML版（LaTeXMLによる変換）を取得し、見出しの位置（バイトオフセット）で
+章に分割する。テンプレートが必要とする章（手法・実験等）の本文のみを抽出し、
+文字数の予算内に収めて返す。
+"""
+
+import html
+import json
+import logging
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+
+import httpx
+from dotenv import load_dotenv
+
+from src.collectors.arxiv import (
+    ARXIV_REQUEST_INTERVAL,
+    ArxivCache,
+    parse_arxiv_id,
+    split_version,
+)
+from src.collectors.html_text import extract_html
+from src.errors import CollectionError
+from src.models.blog_post import CollectedData
+from src.utils.rate_limit import TokenBucket
+from src.utils.streaming import read_capped
+
+logger = logging.getLogger(__name__)
+
+# 本文HTMLの最大サイズ（バイト）。図表の多い論文でも本文が収まる大きさ
+FULLTEXT_MAX_BYTES = 16 * 1024 * 1024
+# 返す章の合計文字数の既定値
+DEFAULT_CHAR_BUDGET = 8000
+# キャッシュに保存するデータの種類
+CACHE_KIND = "fulltext"
+# テンプレートごとに必要な章の種類
+TEMPLATE_SECTIONS: dict[str, tuple[str, ...]] = {
+    "paper-review": ("abstract", "method", "experiments", "conclusion"),
+    "cv": ("abstract", "method", "experiments"),
+}
+DEFAULT_SECTIONS = ("abstract", "method", "experiments", "conclusion")
+
+# 見出しの語句による章の分類（上から順に判定する）
+_SECTION_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("references", ("reference", "bibliograph", "acknowledg", "appendix")),
+    ("abstract", ("abstract",)),
+    ("conclusion", ("conclusion", "discussion", "limitation", "future work", "summary")),
+    ("experiments", ("experiment", "evaluation", "result", "ablation", "benchmark", "empirical")),
+    ("related_work", ("related work", "background", "preliminar", "prior work")),
+    ("introduction", ("introduction", "overview")),
+    (
+        "method",
+        ("method", "approach", "model", "architecture", "framework", "proposed", "algorithm"),
+    ),
+)
+_TITLE = re.compile(rb"<h1\b[^>]*>(.*?)</h1>", re.IGNORECASE | re.DOTALL)
+_PAGE_TITLE = re.compile(rb"<title\b[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_ABSTRACT = re.compile(rb"<div\b[^>]*\bclass=\"[^\"]*\bltx_abstract\b", re.IGNORECASE)
+_SECTION_HEADING = re.compile(rb"<h2\b[^>]*>(.*?)</h2>", re.IGNORECASE | re.DOTALL)
+_DOCUMENT_END = re.compile(
+    rb"<section\b[^>]*\bclass=\"[^\"]*\bltx_bibliography\b|</article>", re.IGNORECASE
+)
+# MathMLの数式はLaTeXの代替テキストに置き換える
+_MATH = re.compile(
+    rb"<math\b[^>]*?\balttext=\"([^\"]*)\"[^>]*>.*?</math>", re.IGNORECASE | re.DOTALL
+)
+_TAG = re.compile(r"<[^>]+>")
+_SECTION_NUMBER = re.compile(r"^(?:[A-Z]|\d+)(?:\.\d+)*\.?\s+")
+
+
+@dataclass(frozen=True)
+class PaperSection:
+    """論文の章。
+
+    Attributes:
+        kind: 章の種類（abstract, introduction, related_work, method, experiments,
+            conclusion, references, other）
+        title: 見出し（章番号を除く）
+        start: HTML中の開始位置（バイト）
+        end: HTML中の終了位置（バイト）
+        text: 本文テキスト（referencesは抽出しない）
+    """
+
+    kind: str
+    title: str
+    start: int
+    end: int
+    text: str = ""
+
+
+@dataclass(frozen=True)
+class PaperDocument:
+    """章に分割した論文。
+
+    Attributes:
+        arxiv_id: arXiv ID（取得できた場合はバージョン付き）
+        title: 論文タイトル
+        url: HTML版のURL
+        sections: 文書順の章
+    """
+
+    arxiv_id: str
+    title: str
+    url: str
+    sections: list[PaperSection] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, data: str) -> "PaperDocument":
+        raw = json.loads(data)
+        return cls(
+            arxiv_id=raw["arxiv_id"],
+            title=raw["title"],
+            url=raw["url"],
+            sections=[PaperSection(**section) for section in raw["sections"]],
+        )
+
+
+def _markup_to_text(markup: bytes) -> str:
+    """見出し等の短いマークアップからテキストを取り出す。"""
+    text = html.unescape(_TAG.sub(" ", markup.decode("utf-8", errors="replace")))
+    return " ".join(text.split())
+
+
+def classify_heading(title: str) -> str:
+    """見出しから章の種類を判定する。該当しない場合は ``other``。"""
+    lowered = title.lower()
+    for kind, keywords in _SECTION_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return kind
+    return "other"
+
+
+def split_sections(body: bytes) -> tuple[str, list[PaperSection]]:
+    """HTML版の論文を、見出しのバイトオフセットで章に分割する。
+
+    章の本文はreferences以外について抽出する。手法の章の見出しは論文ごとに
+    異なる（提案手法の名前等）ため、導入・関連研究と実験の間にある未分類の章は
+    手法とみなす。
+
+    Args:
+        body: HTMLのバイト列
+
+    Returns:
+        論文タイトルと文書順の章のリスト
+    """
+    title_match = _TITLE.search(body) or _PAGE_TITLE.search(body)
+    title = _markup_to_text(title_match.group(1)) if title_match else ""
+    end_match = _DOCUMENT_END.search(body)
+    document_end = end_match.start() if end_match else len(body)
+
+    # (種類, 見出し, 章の開始位置, 本文の開始位置)
+    bounds: list[tuple[str, str, int, int]] = []
+    abstract = _ABSTRACT.search(body)
+    if abstract is not None:
+        bounds.append(("abstract", "Abstract", abstract.start(), abstract.start()))
+    for heading in _SECTION_HEADING.finditer(body, 0, document_end):
+        heading_title = _SECTION_NUMBER.sub("", _markup_to_text(heading.group(1)))
+        bounds.append(
+            (classify_heading(heading_title), heading_title, heading.start(), heading.end())
+        )
+    bounds.sort(key=lambda bound: bound[2])
+
+    kinds = [bound[0] for bound in bounds]
+    first_experiment = kinds.index("experiments") if "experiments" in kinds else len(kinds)
+    preamble = {"abstract", "introduction", "related_work"}
+    after_intro = next((i + 1 for i in range(len(kinds) - 1, -1, -1) if kinds[i] in preamble), 0)
+    for i in range(after_intro, first_experiment):
+        if kinds[i] == "other":
+            kinds[i] = "method"
+
+    sections: list[PaperSection] = []
+    for i, (_, heading_title, start, body_start) in enumerate(bounds):
+        end = bounds[i + 1][2] if i + 1 < len(bounds) else max(document_end, start)
+        kind = kinds[i]
+        text = ""
+        if kind != "references":
+            chunk = _MATH.sub(lambda m: b" $" + m.group(1) + b"$ ", body[body_start:end])
+            text = extract_html(chunk.decode("utf-8", errors="replace")).text
+            if kind == "abstract":
+                text = text.removeprefix("Abstract").strip()
+        sections.append(PaperSection(kind, heading_title, start, end, text))
+    return title, sections
+
+
+def allocate_budget(lengths: list[int], budget: int) -> list[int]:
+    """章ごとの文字数を、予算を均等に配分しつつ短い章の余りを長い章に回して決める。"""
+    allocation = [0] * len(lengths)
+    remaining = budget
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    for position, i in enumerate(order):
+        share = remaining // (len(order) - position)
+        allocation[i] = min(lengths[i], share)
+        remaining -= allocation[i]
+    return allocation
+
+
+class ArxivFullTextCollector:
+    """arXiv論文のHTML版を取得し、テンプレートに必要な章の本文を返すCollector。
+
+    章に分割した論文をIDとバージョンごとにキャッシュ（``cache`` または環境変数
+    ``ARXIV_CACHE_PATH``）し、同じ論文の再取得・再解析を行わない。
+
+    Args:
+        timeout: タイムアウト（秒）
+        cache: 分割済みの論文のキャッシュ
+        rate_limiter: リクエスト間隔を制御するレートリミッター（省略時は3秒に1回）
+        html_url: HTML版のベースURL（テスト用のスタブサーバー等に差し替える場合に指定）
+    """
+
+    HTML_URL = "https://arxiv.org/html/"
+
+    def __init__(
+        self,
+        timeout: float = 60.0,
+        cache: ArxivCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        html_url: str | None = None,
+    ) -> None:
+        load_dotenv()
+        cache_path = os.environ.get("ARXIV_CACHE_PATH", "")
+        self._cache = cache or (ArxivCache(cache_path) if cache_path else None)
+        self._rate_limiter = rate_limiter or TokenBucket(rate=1 / ARXIV_REQUEST_INTERVAL)
+        self._timeout = timeout
+        self._html_url = html_url or self.HTML_URL
+
+    async def collect(self, query: str, **kwargs: object) -> list[CollectedData]:
+        """論文から必要な章の本文を取得する。
+
+        Args:
+            query: arXiv ID（``2401.12345``, ``2401.12345v2``）またはarXivのURL
+            **kwargs:
+                content_type: テンプレートのコンテンツタイプ。必要な章の種類を決める
+                sections: 取得する章の種類（カンマ区切りまたはリスト）。content_typeより優先
+                char_budget: 返す章の合計文字数（デフォルト: 8000）
+
+        Returns:
+            取得結果のリスト（1件）。章は ``## 章題`` の見出しを付けて文書順に連結する。
+            予算に収めるため切り詰めた章がある場合は ``truncated`` がTrue。
+            必要な章が見つからない場合は空のリスト
+
+        Raises:
+            CollectionError: IDが不正な場合、または取得に失敗した場合
+        """
+        kinds = self._requested_kinds(kwargs)
+        budget_val = kwargs.get("char_budget", DEFAULT_CHAR_BUDGET)
+        budget = int(budget_val) if isinstance(budget_val, (int, str)) else DEFAULT_CHAR_BUDGET
+
+        document = await self.fetch_document(query)
+        selected = [
+            section for section in document.sections if section.kind in kinds and section.text
+        ]
+        if not selected:
+            logger.warning("必要な章が見つかりません: %s: %s", document.arxiv_id, kinds)
+            return []
+
+        # 章ごとに分けると同じURL・似たタイトルの項目として重複除去でまとめられるため、1件にする
+        allocation = allocate_budget([len(section.text) for section in selected], budget)
+        blocks: list[str] = []
+        truncated = False
+        for section, limit in zip(selected, allocation, strict=True):
+            if limit <= 0:
+                continue
+            truncated = truncated or len(section.text) > limit
+            blocks.append(f"## {section.title}\n{section.text[:limit]}")
+        if not blocks:
+            return []
+        return [
+            CollectedData(
+                source="arxiv_fulltext",
+                title=document.title,
+                url=document.url,
+                content="\n\n".join(blocks),
+                collected_at=datetime.now(UTC),
+                truncated=truncated,
+            )
+        ]
+
+    @staticmethod
+    def _requested_kinds(kwargs: dict[str, object]) -> tuple[str, ...]:
+        sections = kwargs.get("sections")
+        if isinstance(sections, str):
+            return tuple(kind.strip() for kind in sections.split(",") if kind.strip())
+        if isinstance(sections, (list, tuple)):
+            return tuple(str(kind) for kind in sections)
+        content_type = kwargs.get("content_type")
+        if isinstance(content_type, str) and content_type in TEMPLATE_SECTIONS:
+            return TEMPLATE_SECTIONS[content_type]
+        return DEFAULT_SECTIONS
+
+    async def fetch_document(self, query: str) -> PaperDocument:
+        """論文のHTML版を取得し、章に分割する。キャッシュがあれば通信しない。
+
+        Args:
+            query: arXiv IDまたはarXivのURL
+
+        Returns:
+            章に分割した論文
+
+        Raises:
+            CollectionError: IDが不正な場合、または取得に失敗した場合
+        """
+        arxiv_id = parse_arxiv_id(query)
+        if arxiv_id is None:
+            raise CollectionError(
+                source="arxiv_fulltext", message=f"arXiv IDを解釈できません: {query}"
+            )
+        cached = self._cache.get(arxiv_id, kind=CACHE_KIND) if self._cache else None
+        if cached is not None:
+            return PaperDocument.from_json(cached)
+
+        await self._rate_limiter.acquire()
+        try:
+            async with (
+                httpx.AsyncClient(timeout=self._timeout, follow_redirects=True) as client,
+                client.stream("GET", f"{self._html_url}{arxiv_id}") as response,
+            ):
+                response.raise_for_status()
+                body = await read_capped(response, FULLTEXT_MAX_BYTES)
+        except httpx.HTTPError as e:
+            raise CollectionError(source="arxiv_fulltext", message=str(e)) from e
+        if body.truncated:
+            logger.warning("論文のHTMLが上限サイズを超えたため途中まで解析します: %s", arxiv_id)
+
+        # バージョン指定がない場合、リダイレクト先のURLから最新版のバージョンを得る
+        resolved = parse_arxiv_id(str(response.url)) or arxiv_id
+        if split_version(resolved)[0] != split_version(arxiv_id)[0]:
+            resolved = arxiv_id
+        title, sections = split_sections(body.content)
+        document = PaperDocument(
+            arxiv_id=resolved,
+            title=title or resolved,
+            url=str(response.url),
+            sections=sections,
+        )
+        if self._cache is not None:
+            self._cache.put(resolved, document.to_json(), kind=CACHE_KIND)
+        return document
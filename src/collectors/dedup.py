@@ -0,0 +1,263 @@
+"""収集データの重複・類似記事の検出。
+
+同じニュースがGoogle Alert・Medium・Web検索など複数のソースから届くため、
+URLの正規化とMinHash LSHによる類似度判定で重複をまとめる。
+"""
+
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from collections.abc import Callable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.models.blog_post import CollectedData
+
+# 除去するトラッキング用クエリパラメータ
+TRACKING_PARAM_PREFIXES = ("utm_", "mc_", "_hs", "pk_")
+TRACKING_PARAMS = frozenset(
+    {"fbclid", "gclid", "dclid", "yclid", "msclkid", "igshid", "ref", "ref_src", "ocid"}
+)
+# 転送用URLとして元のURLをクエリに含むホストとパラメータ名（Google Alert等）
+_REDIRECT_PARAMS = {"www.google.com": "url", "google.com": "url"}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# MinHashのビン数と、LSHのバンド数（バンド数×行数=ビン数）
+MINHASH_BINS = 64
+LSH_BANDS = 16
+# 重複とみなすシングル集合のJaccard係数の下限
+DEFAULT_THRESHOLD = 0.7
+# 比較に使う本文の最大文字数。要旨と全文のように長さの大きく異なる本文は一致しないよう、
+# 収集データの本文がほぼ収まる長さにする
+_CONTENT_PREFIX_CHARS = 10000
+_SHINGLE_SIZE = 3
+# これより短いテキストは偶然の一致が多いため類似判定に使わない
+_MIN_SHINGLES = 5
+# 本文の類似で重複とみなす場合に、あわせて必要なタイトルのJaccard係数の下限
+_CONTENT_TITLE_THRESHOLD = 0.3
+# 本文の比較から除く「Source: …」「Tags: …」「Author: …」形式の構造化行
+_METADATA_LINE = re.compile(r"^[A-Z][A-Za-z]*: ")
+# タイトルが取得できなかった項目に付く仮のタイトル（類似判定に使わない）
+_PLACEHOLDER_TITLES = frozenset({"untitled", "no title", "(no title)", "無題"})
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def canonicalize_url(url: str) -> str:
+    """URLを比較用に正規化する。
+
+    転送用URLの展開、スキーム・ホストの小文字化、既定ポート・フラグメント・
+    トラッキングパラメータ・末尾スラッシュの除去、クエリの並べ替えを行う。
+
+    Args:
+        url: 正規化するURL
+
+    Returns:
+        正規化したURL。解釈できない場合は前後の空白を除いた元の文字列
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if not parts.scheme or not parts.netloc:
+        return url
+
+    host = (parts.hostname or "").lower()
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    redirect_param = _REDIRECT_PARAMS.get(host)
+    if redirect_param and parts.path == "/url":
+        target = next((value for key, value in query if key == redirect_param), "")
+        if target.startswith(("http://", "https://")):
+            return canonicalize_url(target)
+
+    scheme = parts.scheme.lower()
+    netloc = host
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/")
+    kept = sorted(
+        (key, value)
+        for key, value in query
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(kept), ""))
+
+
+def shingles(text: str) -> set[str]:
+    """テキストを正規化し、文字3-gramの集合に変換する。
+
+    分かち書きのない日本語にも対応するため、単語ではなく文字単位で分割する。
+    """
+    normalized = _NON_WORD.sub(" ", unicodedata.normalize("NFKC", text).lower()).strip()
+    if len(normalized) <= _SHINGLE_SIZE:
+        return {normalized} if normalized else set()
+    return {normalized[i : i + _SHINGLE_SIZE] for i in range(len(normalized) - _SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(shingle_set: set[str]) -> tuple[int, ...]:
+    """One Permutation HashingによるMinHashシグネチャを計算する。
+
+    各シングルを1回だけハッシュしてビンに振り分け、ビンごとの最小値をとる。
+    空のビンは右隣の値で埋める（densification）ため、短いテキストでも比較できる。
+
+    Args:
+        shingle_set: シングルの集合
+
+    Returns:
+        長さ ``MINHASH_BINS`` のシグネチャ。集合が空の場合は空のタプル
+    """
+    bins: list[int | None] = [None] * MINHASH_BINS
+    for shingle in shingle_set:
+        hashed = zlib.crc32(shingle.encode("utf-8"))
+        index, rest = hashed % MINHASH_BINS, hashed // MINHASH_BINS
+        current = bins[index]
+        if current is None or rest < current:
+            bins[index] = rest
+    if all(slot is None for slot in bins):
+        return ()
+
+    signature = [0] * MINHASH_BINS
+    for index in range(MINHASH_BINS):
+        offset = 0
+        value = bins[index]
+        while value is None:
+            offset += 1
+            value = bins[(index + offset) % MINHASH_BINS]
+        # 借用したビンと区別するため、距離に応じて値をずらす
+        signature[index] = value + offset * (1 << 32)
+    return tuple(signature)
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    """2つの集合のJaccard係数を返す。"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class _UnionFind:
+    """クラスタリング用のUnion-Find。"""
+
+    def __init__(self, size: int) -> None:
+        self._parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self._parent[i] != i:
+            self._parent[i] = self._parent[self._parent[i]]
+            i = self._parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # 入力順で先頭の要素を代表にする
+            self._parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def _body_text(content: str) -> str:
+    """本文から構造化行を除き、比較に使う先頭部分を返す。"""
+    lines = [line for line in content.splitlines() if not _METADATA_LINE.match(line.strip())]
+    return "\n".join(lines).strip()[:_CONTENT_PREFIX_CHARS]
+
+
+def _link_similar(
+    union_find: _UnionFind,
+    shingle_sets: list[set[str]],
+    threshold: float,
+    confirm: Callable[[int, int], bool] | None = None,
+) -> None:
+    """MinHash LSHで候補ペアを絞り込み、Jaccard係数がthreshold以上のペアを結合する。
+
+    confirmを指定した場合は、それが真を返すペアのみ結合する。
+    """
+    rows = MINHASH_BINS // LSH_BANDS
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = defaultdict(list)
+    for i, shingle_set in enumerate(shingle_sets):
+        if len(shingle_set) < _MIN_SHINGLES:
+            continue
+        signature = minhash_signature(shingle_set)
+        for band in range(LSH_BANDS):
+            buckets[(band, signature[band * rows : (band + 1) * rows])].append(i)
+
+    for members in buckets.values():
+        for pos, i in enumerate(members):
+            for j in members[pos + 1 :]:
+                if union_find.find(i) == union_find.find(j):
+                    continue
+                if jaccard(shingle_sets[i], shingle_sets[j]) < threshold:
+                    continue
+                if confirm is None or confirm(i, j):
+                    union_find.union(i, j)
+
+
+def cluster_duplicates(
+    items: list[CollectedData], threshold: float = DEFAULT_THRESHOLD
+) -> list[list[int]]:
+    """正規化URLの一致、またはタイトル・本文の類似で重複する項目をクラスタリングする。
+
+    タイトルと本文の先頭それぞれについて、MinHash LSHで候補ペアを絞り込んでから
+    Jaccard係数を確認するため、件数に対してほぼ線形の計算量で動作する。
+    本文はSource・Tags等の構造化行を除いて比較し、本文が類似するペアはタイトルも
+    ある程度類似する場合のみ重複とみなす。タイトルのみの類似は、どちらかの項目に
+    URLがない場合に限って重複とみなす（``owner/repo`` と ``owner/repo.cpp`` や
+    モデルのバージョン違いのように、URLの異なる別の項目はタイトルが似やすいため）。
+    ``Untitled`` 等の仮のタイトルは比較しない。
+
+    Args:
+        items: 収集データ
+        threshold: 重複とみなすJaccard係数の下限
+
+    Returns:
+        インデックスのクラスタのリスト。各クラスタとクラスタの並びは入力順
+    """
+    union_find = _UnionFind(len(items))
+
+    by_url: dict[str, int] = {}
+    for i, item in enumerate(items):
+        if not item.url:
+            continue
+        key = canonicalize_url(item.url)
+        if key in by_url:
+            union_find.union(by_url[key], i)
+        else:
+            by_url[key] = i
+
+    title_sets = [
+        set() if item.title.strip().lower() in _PLACEHOLDER_TITLES else shingles(item.title)
+        for item in items
+    ]
+    _link_similar(
+        union_find, title_sets, threshold, confirm=lambda i, j: not (items[i].url and items[j].url)
+    )
+    _link_similar(
+        union_find,
+        [shingles(_body_text(item.content)) for item in items],
+        threshold,
+        confirm=lambda i, j: jaccard(title_sets[i], title_sets[j]) >= _CONTENT_TITLE_THRESHOLD,
+    )
+
+    clusters: dict[int, list[int]] = defaultdict(list)
+    for i in range(len(items)):
+        clusters[union_find.find(i)].append(i)
+    return sorted(clusters.values(), key=lambda cluster: cluster[0])
+
+
+def deduplicate(
+    items: list[CollectedData], threshold: float = DEFAULT_THRESHOLD
+) -> list[CollectedData]:
+    """重複・類似する収集データを1件にまとめる。
+
+    各クラスタから最も本文の長い項目を代表として残し、クラスタの先頭の位置に並べる。
+
+    Args:
+        items: 収集データ
+        threshold: 重複とみなすJaccard係数の下限
+
+    Returns:
+        重複を除いた収集データ
+    """
+    return [
+        items[max(cluster, key=lambda i: len(items[i].content))]
+        for cluster in cluster_duplicates(items, threshold)
+    ]
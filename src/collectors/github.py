@@ -1,25 +1,108 @@
 """GitHub情報収集Collector。"""
 
+import asyncio
+import json
 import logging
 import os
 from datetime import UTC, datetime
+from typing import Any
 
 import httpx
 from dotenv import load_dotenv
 
 from src.errors import CollectionError
 from src.models.blog_post import CollectedData
+from src.utils.fast_json import response_json
+from src.utils.http_cache import (
+    BYPASS_CACHE,
+    CachedResponse,
+    CachingTransport,
+    HTTPCache,
+    cache_key,
+    is_storable,
+)
+from src.utils.streaming import CappedText, read_capped
 
 logger = logging.getLogger(__name__)
 
+# GraphQL 1クエリあたりのノード数の既定の予算
+GRAPHQL_NODE_BUDGET = 200
+# トークン未設定時にREST APIで同時に収集するリポジトリ数
+REST_CONCURRENCY = 4
+_RECENT_COMMITS = 5
+# 1リポジトリあたりの概算ノード数（リポジトリ・ブランチ・コミット・README候補・ツリー）
+_GRAPHQL_NODES_PER_REPO = 2 + _RECENT_COMMITS + 4 + 1
+# ディレクトリ構造に含める最大エントリ数
+TREE_MAX_ENTRIES = 200
+# 段階取得モードで、子を列挙せず件数のみ表示するディレクトリのエントリ数
+TREE_SUMMARY_THRESHOLD = 50
+# 段階取得モードで同時に取得するディレクトリ数
+TREE_CONCURRENCY = 4
+# 本文に含めるREADMEの最大文字数
+README_MAX_CHARS = 3000
+# READMEのダウンロードを打ち切るバイト数（UTF-8で最大文字数を確実に含む長さ）
+README_MAX_BYTES = README_MAX_CHARS * 4
+# READMEのファイル名候補ごとのエイリアス
+_README_ALIASES = ("readmeMd", "readmeLowerMd", "readmeRst", "readmePlain")
+
+_GRAPHQL_REPOSITORY_FIELDS = f"""
+    nameWithOwner
+    description
+    url
+    stargazerCount
+    forkCount
+    primaryLanguage {{ name }}
+    defaultBranchRef {{
+      name
+      target {{
+        ... on Commit {{ history(first: {_RECENT_COMMITS}) {{ nodes {{ messageHeadline }} }} }}
+      }}
+    }}
+    readmeMd: object(expression: "HEAD:README.md") {{ ... on Blob {{ text }} }}
+    readmeLowerMd: object(expression: "HEAD:readme.md") {{ ... on Blob {{ text }} }}
+    readmeRst: object(expression: "HEAD:README.rst") {{ ... on Blob {{ text }} }}
+    readmePlain: object(expression: "HEAD:README") {{ ... on Blob {{ text }} }}
+    tree: object(expression: "HEAD:") {{ ... on Tree {{ entries {{ name type }} }} }}
+"""
+
+
+def _build_graphql_query(repos: list[str]) -> tuple[str, dict[str, str]]:
+    """複数リポジトリをエイリアスで取得するGraphQLクエリと変数を構築する。"""
+    params: list[str] = []
+    selections: list[str] = []
+    variables: dict[str, str] = {}
+    for index, repo in enumerate(repos):
+        owner, _, name = repo.partition("/")
+        variables[f"owner{index}"] = owner
+        variables[f"name{index}"] = name
+        params.append(f"$owner{index}: String!, $name{index}: String!")
+        selections.append(
+            f"r{index}: repository(owner: $owner{index}, name: $name{index}) "
+            f"{{{_GRAPHQL_REPOSITORY_FIELDS}}}"
+        )
+    query = (
+        f"query({', '.join(params)}) {{\n"
+        + "\n".join(selections)
+        + "\nrateLimit { cost remaining }\n}"
+    )
+    return query, variables
+
 
 class GitHubCollector:
-    """GitHub APIでリポジトリ情報を取得するCollector。"""
+    """GitHub APIでリポジトリ情報を取得するCollector。
+
+    ``cache`` （または環境変数 ``GITHUB_CACHE_PATH``）を指定すると、レスポンスを
+    ETag/Last-Modifiedとともにディスクに保存し、次回以降は条件付きリクエストで
+    再検証する。GitHub APIは304応答をレート制限に数えないため、未認証でも
+    繰り返し実行しやすくなる。
+    """
 
     API_BASE = "https://api.github.com"
 
-    def __init__(self, token: str | None = None) -> None:
+    def __init__(self, token: str | None = None, cache: HTTPCache | None = None) -> None:
         load_dotenv()
+        cache_path = os.environ.get("GITHUB_CACHE_PATH", "")
+        self._cache = cache or (HTTPCache(cache_path) if cache_path else None)
         self._token = token or os.environ.get("GITHUB_TOKEN", "")
         if not self._token:
             logger.warning(
@@ -36,82 +119,334 @@ class GitHubCollector:
     async def collect(self, query: str, **kwargs: object) -> list[CollectedData]:
         """GitHubリポジトリの情報を収集する。
 
+        README・コミットはリポジトリ情報と並行に取得し、ディレクトリ構造は
+        デフォルトブランチが判明した時点で取得する。README・コミット・ディレクトリ構造の
+        取得失敗は無視し、得られた情報のみで結果を構築する。
+
         Args:
             query: リポジトリのフルネーム（owner/repo形式）
-            **kwargs: 未使用
+            **kwargs:
+                tree_depth: 指定時はディレクトリ構造をこの深さまで階層ごとに取得する。
+                    未指定の場合は再帰ツリーを一括で取得する
+                tree_max_entries: ディレクトリ構造の最大エントリ数（デフォルト: 200）
 
         Returns:
             リポジトリ情報のリスト
 
         Raises:
-            CollectionError: API呼び出しに失敗した場合
+            CollectionError: リポジトリ情報の取得に失敗した場合
         """
         repo = query.strip("/")
+        depth_val = kwargs.get("tree_depth")
+        tree_depth = int(depth_val) if isinstance(depth_val, (int, str)) else None
+        entries_val = kwargs.get("tree_max_entries", TREE_MAX_ENTRIES)
+        max_entries = int(entries_val) if isinstance(entries_val, (int, str)) else TREE_MAX_ENTRIES
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                repo_data = await self._fetch_repo(client, repo)
+            async with httpx.AsyncClient(
+                timeout=30.0,
+                follow_redirects=True,
+                transport=CachingTransport(self._cache) if self._cache is not None else None,
+            ) as client:
+                readme_task = asyncio.create_task(self._fetch_readme(client, repo))
+                commits_task = asyncio.create_task(self._fetch_recent_commits(client, repo))
+                try:
+                    repo_data = await self._fetch_repo(client, repo)
+                except BaseException:
+                    readme_task.cancel()
+                    commits_task.cancel()
+                    await asyncio.gather(readme_task, commits_task, return_exceptions=True)
+                    raise
                 default_branch = str(repo_data.get("default_branch", "main"))
-                readme_content = await self._fetch_readme(client, repo)
-                recent_commits = await self._fetch_recent_commits(client, repo)
-                directory_tree = await self._fetch_directory_tree(client, repo, default_branch)
+                if tree_depth is not None:
+                    tree_fetch = self._fetch_bounded_tree(
+                        client, repo, default_branch, tree_depth, max_entries
+                    )
+                else:
+                    tree_fetch = self._fetch_directory_tree(
+                        client, repo, default_branch, max_entries
+                    )
+                readme, recent_commits, directory_tree = await asyncio.gather(
+                    readme_task, commits_task, tree_fetch
+                )
         except httpx.HTTPError as e:
             raise CollectionError(source="github", message=str(e)) from e
 
+        commit_messages: list[str] = []
+        for commit in recent_commits[:5]:
+            commit_data = commit.get("commit", {})
+            if isinstance(commit_data, dict):
+                commit_messages.append(str(commit_data.get("message", "")).split("\n")[0])
+            else:
+                commit_messages.append("")
+
+        return [
+            self._build_collected(
+                full_name=str(repo_data.get("full_name", repo)),
+                url=str(repo_data.get("html_url", f"https://github.com/{repo}")),
+                description=repo_data.get("description", "No description"),
+                stars=repo_data.get("stargazers_count", 0),
+                forks=repo_data.get("forks_count", 0),
+                language=repo_data.get("language", "N/A"),
+                readme=readme.text,
+                directory_tree=directory_tree,
+                commit_messages=commit_messages,
+                readme_truncated=readme.truncated,
+            )
+        ]
+
+    async def collect_many(self, repos: list[str], **kwargs: object) -> list[CollectedData]:
+        """複数のGitHubリポジトリの情報をまとめて収集する。
+
+        トークンが設定されている場合はGraphQL APIでリポジトリ情報・README・最新コミット・
+        トップレベルのディレクトリ構造を1クエリで取得し、クエリのノード数が予算を
+        超えないようにバッチに分割する。トークンがない場合（GraphQLは認証必須）は
+        REST APIの ``collect`` を並行に実行する。
+
+        Args:
+            repos: リポジトリのフルネーム（owner/repo形式）のリスト
+            **kwargs:
+                node_budget: 1クエリあたりのノード数の予算（デフォルト: 200）
+                tree_max_entries: ディレクトリ構造の最大エントリ数（デフォルト: 200）
+
+        Returns:
+            取得できたリポジトリ情報のリスト（入力順）。存在しないリポジトリは除く
+
+        Raises:
+            CollectionError: API呼び出しに失敗した場合
+        """
+        names = [repo.strip("/") for repo in repos if repo.strip("/")]
+        if not names:
+            return []
+        entries_val = kwargs.get("tree_max_entries", TREE_MAX_ENTRIES)
+        max_entries = int(entries_val) if isinstance(entries_val, (int, str)) else TREE_MAX_ENTRIES
+        if not self._token:
+            return await self._collect_many_rest(names, max_entries)
+
+        budget_val = kwargs.get("node_budget", GRAPHQL_NODE_BUDGET)
+        node_budget = int(budget_val) if isinstance(budget_val, (int, str)) else GRAPHQL_NODE_BUDGET
+        batch_size = max(1, node_budget // _GRAPHQL_NODES_PER_REPO)
+        results: list[CollectedData] = []
+        try:
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                for start in range(0, len(names), batch_size):
+                    results.extend(
+                        await self._fetch_graphql_batch(
+                            client, names[start : start + batch_size], max_entries
+                        )
+                    )
+        except httpx.HTTPError as e:
+            raise CollectionError(source="github", message=str(e)) from e
+        return results
+
+    async def _collect_many_rest(
+        self, repos: list[str], max_entries: int = TREE_MAX_ENTRIES
+    ) -> list[CollectedData]:
+        """REST APIで複数リポジトリを並行に収集する。取得に失敗したリポジトリは除く。"""
+        semaphore = asyncio.Semaphore(REST_CONCURRENCY)
+
+        async def collect_one(repo: str) -> list[CollectedData]:
+            async with semaphore:
+                try:
+                    return await self.collect(repo, tree_max_entries=max_entries)
+                except CollectionError as e:
+                    logger.warning("リポジトリ情報の取得に失敗しました: %s: %s", repo, e)
+                    return []
+
+        batches = await asyncio.gather(*(collect_one(repo) for repo in repos))
+        return [item for batch in batches for item in batch]
+
+    async def _fetch_graphql_batch(
+        self, client: httpx.AsyncClient, repos: list[str], max_entries: int = TREE_MAX_ENTRIES
+    ) -> list[CollectedData]:
+        """1回のGraphQLクエリで複数リポジトリの情報を取得する。"""
+        query, variables = _build_graphql_query(repos)
+        response = await client.post(
+            f"{self.API_BASE}/graphql",
+            headers={"Authorization": f"Bearer {self._token}"},
+            json={"query": query, "variables": variables},
+        )
+        response.raise_for_status()
+        try:
+            payload: dict[str, Any] = response_json(response)
+        except ValueError as e:
+            raise CollectionError(source="github", message=f"JSONパースエラー: {e}") from e
+
+        data = payload.get("data") or {}
+        if not data and payload.get("errors"):
+            raise CollectionError(
+                source="github", message=f"GraphQLエラー: {payload['errors'][0].get('message')}"
+            )
+        rate_limit = data.get("rateLimit") or {}
+        logger.debug(
+            "GitHub GraphQL: repos=%d, cost=%s, remaining=%s",
+            len(repos),
+            rate_limit.get("cost"),
+            rate_limit.get("remaining"),
+        )
+
+        results: list[CollectedData] = []
+        for index, repo in enumerate(repos):
+            node = data.get(f"r{index}")
+            if not node:
+                logger.warning("リポジトリが見つかりません: %s", repo)
+                continue
+            results.append(self._graphql_node_to_collected(node, repo, max_entries))
+        return results
+
+    def _graphql_node_to_collected(
+        self, node: dict[str, Any], repo: str, max_entries: int = TREE_MAX_ENTRIES
+    ) -> CollectedData:
+        """GraphQLのrepositoryノードをCollectedDataに変換する。"""
+        readme = next(
+            (
+                str(blob["text"])
+                for alias in _README_ALIASES
+                if isinstance(blob := node.get(alias), dict) and blob.get("text")
+            ),
+            "",
+        )
+        entries = (node.get("tree") or {}).get("entries") or []
+        directory_tree = "\n".join(
+            f"{entry.get('name', '')}/" if entry.get("type") == "tree" else entry.get("name", "")
+            for entry in entries[:max_entries]
+        )
+        branch = node.get("defaultBranchRef") or {}
+        history = ((branch.get("target") or {}).get("history") or {}).get("nodes") or []
+        language = node.get("primaryLanguage") or {}
+        return self._build_collected(
+            full_name=str(node.get("nameWithOwner") or repo),
+            url=str(node.get("url") or f"https://github.com/{repo}"),
+            description=node.get("description") or "No description",
+            stars=node.get("stargazerCount", 0),
+            forks=node.get("forkCount", 0),
+            language=language.get("name") or "N/A",
+            readme=readme,
+            directory_tree=directory_tree,
+            commit_messages=[str(commit.get("messageHeadline", "")) for commit in history],
+        )
+
+    @staticmethod
+    def _build_collected(
+        full_name: str,
+        url: str,
+        description: object,
+        stars: object,
+        forks: object,
+        language: object,
+        readme: str,
+        directory_tree: str,
+        commit_messages: list[str],
+        readme_truncated: bool = False,
+    ) -> CollectedData:
+        """リポジトリ情報をCollectedDataの本文形式にまとめる。
+
+        READMEが最大文字数を超える、またはダウンロードを打ち切った場合は切り詰めとして扱う。
+        """
         parts = [
-            f"# {repo_data.get('full_name', repo)}",
-            f"\n{repo_data.get('description', 'No description')}",
-            f"\nStars: {repo_data.get('stargazers_count', 0)} | "
-            f"Forks: {repo_data.get('forks_count', 0)} | "
-            f"Language: {repo_data.get('language', 'N/A')}",
+            f"# {full_name}",
+            f"\n{description}",
+            f"\nStars: {stars} | Forks: {forks} | Language: {language}",
         ]
-        if readme_content:
-            parts.append(f"\n## README\n{readme_content[:3000]}")
+        if readme:
+            parts.append(f"\n## README\n{readme[:README_MAX_CHARS]}")
         if directory_tree:
             parts.append(f"\n## Directory Structure\n```\n{directory_tree}\n```")
-        if recent_commits:
+        if commit_messages:
             parts.append("\n## Recent Commits")
-            for commit in recent_commits[:5]:
-                commit_data = commit.get("commit", {})
-                if isinstance(commit_data, dict):
-                    msg = str(commit_data.get("message", "")).split("\n")[0]
-                else:
-                    msg = ""
+            for msg in commit_messages[:5]:
                 parts.append(f"- {msg}")
 
-        return [
-            CollectedData(
-                source="github",
-                title=str(repo_data.get("full_name", repo)),
-                url=str(repo_data.get("html_url", f"https://github.com/{repo}")),
-                content="\n".join(parts),
-                collected_at=datetime.now(UTC),
-            )
-        ]
+        return CollectedData(
+            source="github",
+            title=full_name,
+            url=url,
+            content="\n".join(parts),
+            collected_at=datetime.now(UTC),
+            truncated=readme_truncated or len(readme) > README_MAX_CHARS,
+        )
 
     async def _fetch_repo(self, client: httpx.AsyncClient, repo: str) -> dict[str, object]:
         """リポジトリ情報を取得する。"""
         response = await client.get(f"{self.API_BASE}/repos/{repo}", headers=self._headers())
         response.raise_for_status()
         try:
-            result: dict[str, object] = response.json()
+            result: dict[str, object] = response_json(response)
         except ValueError as e:
             raise CollectionError(source="github", message=f"JSONパースエラー: {e}") from e
         return result
 
-    async def _fetch_readme(self, client: httpx.AsyncClient, repo: str) -> str:
-        """READMEの内容を取得する。"""
+    async def _fetch_readme(self, client: httpx.AsyncClient, repo: str) -> CappedText:
+        """READMEの内容を取得する。本文に含める長さを読み込んだ時点で受信を打ち切る。
+
+        ボディ全体を読み込む ``CachingTransport`` は通さず、キャッシュが有効な場合は
+        打ち切ったボディと切り詰めの有無を保存して、鮮度の判定と再検証に使う。
+        """
+        url = f"{self.API_BASE}/repos/{repo}/readme"
+        headers = {**self._headers(), "Accept": "application/vnd.github.v3.raw"}
+        key = cache_key(httpx.Request("GET", url, headers=headers))
+        cached = self._cached_readme(key)
+        if cached is not None and cached.is_fresh():
+            return self._readme_from_cache(cached)
+
         try:
-            response = await client.get(
-                f"{self.API_BASE}/repos/{repo}/readme",
-                headers={**self._headers(), "Accept": "application/vnd.github.v3.raw"},
-            )
-            response.raise_for_status()
-            return response.text
+            async with client.stream(
+                "GET",
+                url,
+                headers={**headers, **(cached.conditional_headers() if cached else {})},
+                extensions={BYPASS_CACHE: True},
+            ) as response:
+                if response.status_code == 304 and cached is not None and self._cache:
+                    refreshed = self._cache.refresh(key, response.headers) or cached
+                    return self._readme_from_cache(refreshed)
+                response.raise_for_status()
+                readme = await read_capped(response, README_MAX_BYTES)
         except httpx.HTTPStatusError:
-            return ""
+            return CappedText(text="", truncated=False)
+        except httpx.HTTPError as e:
+            logger.warning("READMEの取得に失敗しました: %s: %s", repo, e)
+            return CappedText(text="", truncated=False)
+
+        if self._cache is not None and is_storable(response.status_code, response.headers):
+            extracted = {"text": readme.text, "truncated": readme.truncated}
+            self._cache.put(
+                key,
+                url,
+                response.status_code,
+                response.headers,
+                readme.content,
+                extracted=json.dumps(extracted, ensure_ascii=False),
+            )
+        return readme
+
+    def _cached_readme(self, key: str) -> CachedResponse | None:
+        """打ち切った長さでREADMEを保存したキャッシュを取得する。"""
+        if self._cache is None:
+            return None
+        cached = self._cache.get(key)
+        if cached is None or cached.extracted is None:
+            return None
+        truncated = bool(json.loads(cached.extracted).get("truncated"))
+        size = len(cached.body)
+        if (truncated and size != README_MAX_BYTES) or (not truncated and size > README_MAX_BYTES):
+            return None
+        return cached
+
+    @staticmethod
+    def _readme_from_cache(cached: CachedResponse) -> CappedText:
+        """キャッシュに保存したREADMEを復元する。"""
+        extracted = json.loads(cached.extracted or "{}")
+        return CappedText(
+            text=str(extracted.get("text", "")),
+            truncated=bool(extracted.get("truncated")),
+            content=cached.body,
+        )
 
     async def _fetch_directory_tree(
-        self, client: httpx.AsyncClient, repo: str, default_branch: str
+        self,
+        client: httpx.AsyncClient,
+        repo: str,
+        default_branch: str,
+        max_entries: int = TREE_MAX_ENTRIES,
     ) -> str:
         """リポジトリのディレクトリ構造を取得する。"""
         try:
@@ -122,7 +457,7 @@ class GitHubCollector:
             )
             response.raise_for_status()
             try:
-                data: dict[str, object] = response.json()
+                data: dict[str, object] = response_json(response)
             except ValueError:
                 return ""
             tree = data.get("tree", [])
@@ -137,9 +472,84 @@ class GitHubCollector:
                         lines.append(f"{path}/")
                     else:
                         lines.append(path)
-            return "\n".join(lines[:200])
+            return "\n".join(lines[:max_entries])
         except httpx.HTTPStatusError:
             return ""
+        except httpx.HTTPError as e:
+            logger.warning("ディレクトリ構造の取得に失敗しました: %s: %s", repo, e)
+            return ""
+
+    async def _fetch_bounded_tree(
+        self,
+        client: httpx.AsyncClient,
+        repo: str,
+        default_branch: str,
+        max_depth: int,
+        max_entries: int = TREE_MAX_ENTRIES,
+    ) -> str:
+        """ディレクトリ構造を階層ごとに、深さとエントリ数の上限まで取得する。
+
+        再帰ツリーはモノレポでは数MBになるため、非再帰のツリーを幅優先で
+        ``TREE_CONCURRENCY`` 件ずつ取得し、上限に達した時点で以降は取得しない。
+        エントリ数が多いディレクトリは子を列挙せず、ファイル数・ディレクトリ数のみを表示する。
+
+        Args:
+            client: HTTPクライアント
+            repo: リポジトリのフルネーム
+            default_branch: デフォルトブランチ名
+            max_depth: 取得する階層数（1でトップレベルのみ）
+            max_entries: 最大エントリ数
+
+        Returns:
+            パス順に並べたディレクトリ構造
+        """
+
+        async def fetch_entries(tree_sha: str) -> list[dict[str, object]] | None:
+            try:
+                response = await client.get(
+                    f"{self.API_BASE}/repos/{repo}/git/trees/{tree_sha}",
+                    headers=self._headers(),
+                )
+                response.raise_for_status()
+                tree = response_json(response).get("tree", [])
+            except (httpx.HTTPError, ValueError) as e:
+                logger.warning("ディレクトリ構造の取得に失敗しました: %s: %s", repo, e)
+                return None
+            if not isinstance(tree, list):
+                return None
+            return [item for item in tree if isinstance(item, dict)]
+
+        # パス -> 表示行。ディレクトリの行は子の件数で要約する場合に置き換える
+        lines: dict[str, str] = {}
+        level: list[tuple[str, str]] = [("", default_branch)]
+        depth = 0
+        while level and depth < max(1, max_depth) and len(lines) < max_entries:
+            depth += 1
+            next_level: list[tuple[str, str]] = []
+            pending = level
+            while pending and len(lines) < max_entries:
+                # 1つのディレクトリで予算を使い切ることがあるため、少数ずつ取得して都度確認する
+                size = min(TREE_CONCURRENCY, max_entries - len(lines))
+                batch, pending = pending[:size], pending[size:]
+                results = await asyncio.gather(*(fetch_entries(sha) for _, sha in batch))
+                for (prefix, _), entries in zip(batch, results, strict=True):
+                    if entries is None:
+                        continue
+                    if prefix and len(entries) > TREE_SUMMARY_THRESHOLD:
+                        dirs = sum(1 for item in entries if item.get("type") == "tree")
+                        lines[prefix] = f"{prefix} ({len(entries) - dirs} files, {dirs} dirs)"
+                        continue
+                    for item in entries:
+                        if len(lines) >= max_entries:
+                            break
+                        path = f"{prefix}{item.get('path', '')}"
+                        if item.get("type") == "tree":
+                            lines[f"{path}/"] = f"{path}/"
+                            next_level.append((f"{path}/", str(item.get("sha", ""))))
+                        else:
+                            lines[path] = path
+            level = next_level
+        return "\n".join(lines[path] for path in sorted(lines))
 
     async def _fetch_recent_commits(
         self, client: httpx.AsyncClient, repo: str
@@ -153,9 +563,12 @@ class GitHubCollector:
             )
             response.raise_for_status()
             try:
-                result: list[dict[str, object]] = response.json()
+                result: list[dict[str, object]] = response_json(response)
             except ValueError:
                 return []
             return result
         except httpx.HTTPStatusError:
             return []
+        except httpx.HTTPError as e:
+            logger.warning("コミット履歴の取得に失敗しました: %s: %s", repo, e)
+            return []
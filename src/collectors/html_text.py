@@ -0,0 +1,345 @@
+"""HTMLからのテキスト抽出。
+
+``html.parser`` によるイベント駆動の1パス処理で、本文テキストとタイトルを同時に取り出す。
+チャンク単位で入力できるため、受信しながら抽出できる。``HTMLTextExtractor`` は
+ページ全体のテキストを、``MainContentExtractor`` は記事本文と判定したブロックのみを返す。
+"""
+
+import re
+from html.parser import HTMLParser
+
+# 内容をテキストに含めない要素
+SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template", "nav", "footer"})
+
+
+class HTMLTextExtractor(HTMLParser):
+    """HTMLを逐次解析し、本文テキストとtitleを抽出する。
+
+    ``feed()`` でチャンクを渡し、``close()`` の後に ``text`` と ``title`` を参照する。
+    script・style・nav・footer等の内容は除外する。
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._parts: list[str] = []
+        self._title_parts: list[str] = []
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        # テキストはチャンクの境界で分割されて届くため、区切りはタグの位置にのみ入れる
+        self._parts.append(" ")
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+
+    def handle_endtag(self, tag: str) -> None:
+        self._parts.append(" ")
+        if tag in SKIPPED_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._in_title:
+            self._title_parts.append(data)
+        self._parts.append(data)
+
+    @property
+    def text(self) -> str:
+        """連続する空白を1つにまとめた本文テキスト。"""
+        return " ".join("".join(self._parts).split())
+
+    @property
+    def title(self) -> str | None:
+        """titleタグの内容。存在しない場合はNone。"""
+        title = " ".join("".join(self._title_parts).split())
+        return title or None
+
+
+def extract_html(html: str) -> HTMLTextExtractor:
+    """HTML文字列全体を解析した抽出器を返す。"""
+    extractor = HTMLTextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor
+
+
+# 本文の候補となるブロック要素（このほかの要素はインラインとして扱う）
+_BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "blockquote", "body", "dd", "div", "dl", "dt", "figcaption",
+        "figure", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "li", "main", "ol", "p",
+        "pre", "section", "table", "td", "th", "tr", "ul",
+    }
+)  # fmt: skip
+# 本文抽出で内容ごと除外する要素。formはページ全体を包むサイトがあるため、除外せず減点する
+_BOILERPLATE_TAGS = SKIPPED_TAGS | {"aside", "button", "select", "iframe", "svg"}
+# 閉じタグを持たない要素
+_VOID_TAGS = frozenset({"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta"})
+# 段落として親要素にスコアを与える要素
+_PARAGRAPH_TAGS = frozenset({"p", "li", "pre", "blockquote", "td", "dd", "figcaption"})
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+# タグごとの初期スコア（Readabilityの重み付けに準拠）
+_TAG_WEIGHTS = {
+    "article": 10, "main": 10, "div": 5, "section": 3, "pre": 3, "td": 3, "blockquote": 3,
+    "address": -3, "form": -3, "ol": -3, "ul": -3, "dl": -3, "dd": -3, "dt": -3, "li": -3,
+    "h1": -5, "h2": -5, "h3": -5, "h4": -5, "h5": -5, "h6": -5, "th": -5,
+}  # fmt: skip
+# class・idに含まれると本文らしさを加点・減点する語
+_POSITIVE_HINTS = re.compile(r"article|body|content|entry|main|post|text|blog|story", re.I)
+_NEGATIVE_HINTS = re.compile(
+    r"comment|meta|footer|footnote|sidebar|sponsor|share|related|nav|menu|cookie|consent"
+    r"|banner|promo|social|widget|breadcrumb|popup|newsletter|subscribe|\bads?\b",
+    re.I,
+)
+_CLASS_WEIGHT = 25
+# スコアを与える段落の最小文字数
+_MIN_PARAGRAPH_CHARS = 25
+# 出力から除外する段落のリンク密度
+_MAX_PARAGRAPH_LINK_DENSITY = 0.5
+# 最上位候補と並べて出力する兄弟要素のスコアの割合
+_SIBLING_SCORE_RATIO = 0.2
+_COMMAS = re.compile(r"[,，、]")
+
+
+class _Node:
+    """本文抽出用のブロック要素。"""
+
+    __slots__ = (
+        "tag", "parent", "weight", "negative", "text_len", "link_len", "score", "scored", "units",
+    )  # fmt: skip
+
+    def __init__(self, tag: str, parent: "_Node | None", weight: int, negative: bool) -> None:
+        self.tag = tag
+        self.parent = parent
+        self.weight = weight
+        # class・idが関連記事・共有ボタン等を示すか
+        self.negative = negative
+        self.text_len = 0
+        self.link_len = 0
+        self.score = 0.0
+        self.scored = False
+        # 子孫を含む段落の範囲（開始・終了のインデックス）
+        self.units = [0, 0]
+
+    def link_density(self) -> float:
+        return self.link_len / self.text_len if self.text_len else 0.0
+
+
+class MainContentExtractor(HTMLParser):
+    """Readability方式で本文ブロックを選び、見出し付きの段落として抽出する。
+
+    ブロック要素ごとに段落の文字数・読点の数からスコアを積み上げ、タグ・class/idの
+    重みとリンク密度で補正して最もスコアの高い要素を本文とする。メニュー・
+    Cookieバナー・フッター・関連記事一覧等を除いたテキストが得られる。
+    ``feed()`` でチャンクを渡し、``close()`` の後に ``text`` と ``title`` を参照する。
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._root = _Node("#root", None, 0, False)
+        self._stack: list[_Node] = [self._root]
+        self._units: list[tuple[_Node, str, int]] = []
+        self._buffer: list[str] = []
+        self._link_chars = 0
+        self._link_depth = 0
+        self._skip_depth = 0
+        self._in_title = False
+        self._title_parts: list[str] = []
+        self._text = ""
+
+    @staticmethod
+    def _class_hints(attrs: list[tuple[str, str | None]]) -> tuple[bool, bool]:
+        """class・idが本文らしさを示すか、付属要素らしさを示すかを返す。"""
+        hints = " ".join(value or "" for name, value in attrs if name in ("class", "id"))
+        return bool(_POSITIVE_HINTS.search(hints)), bool(_NEGATIVE_HINTS.search(hints))
+
+    def _flush(self) -> None:
+        """溜まったテキストを直近のブロック要素の段落として確定する。"""
+        text = " ".join("".join(self._buffer).split())
+        link_chars = self._link_chars
+        self._buffer.clear()
+        self._link_chars = 0
+        if not text:
+            return
+        node = self._stack[-1]
+        self._units.append((node, text, min(link_chars, len(text))))
+        ancestor: _Node | None = node
+        while ancestor is not None:
+            ancestor.text_len += len(text)
+            ancestor.link_len += min(link_chars, len(text))
+            ancestor = ancestor.parent
+
+    def _pop_to(self, tag: str) -> None:
+        """tagの要素まで開いているブロック要素を閉じる。"""
+        if all(node.tag != tag for node in self._stack[1:]):
+            return
+        while True:
+            node = self._stack.pop()
+            node.units[1] = len(self._units)
+            if node.tag == tag:
+                return
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _BOILERPLATE_TAGS:
+            self._flush()
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        if tag == "title":
+            self._in_title = True
+        elif tag == "a":
+            self._link_depth += 1
+        elif tag == "br":
+            self._buffer.append(" ")
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+            # 閉じタグを省略した段落・リスト項目は、次の同種の要素の開始で閉じる
+            if tag in ("p", "li") and self._stack[-1].tag == tag:
+                self._pop_to(tag)
+            positive, negative = self._class_hints(attrs)
+            weight = _TAG_WEIGHTS.get(tag, 0) + _CLASS_WEIGHT * (positive - negative)
+            node = _Node(tag, self._stack[-1], weight, negative and not positive)
+            node.units[0] = len(self._units)
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        # <div/> のような空要素の自己終了タグは無視する
+        if tag in _VOID_TAGS:
+            self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _BOILERPLATE_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+            return
+        if self._skip_depth or tag in _VOID_TAGS:
+            return
+        if tag == "title":
+            self._in_title = False
+        elif tag == "a":
+            self._link_depth = max(self._link_depth - 1, 0)
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+            self._pop_to(tag)
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._in_title:
+            self._title_parts.append(data)
+            return
+        self._buffer.append(data)
+        if self._link_depth:
+            self._link_chars += len(data.strip())
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+        while len(self._stack) > 1:
+            self._stack.pop().units[1] = len(self._units)
+        self._root.units[1] = len(self._units)
+        self._text = self._select_text()
+
+    @property
+    def title(self) -> str | None:
+        """titleタグの内容。存在しない場合はNone。"""
+        title = " ".join("".join(self._title_parts).split())
+        return title or None
+
+    def _score_candidates(self) -> list[_Node]:
+        """段落のスコアを親・祖父母要素に加算し、候補要素を返す。"""
+        candidates: list[_Node] = []
+        for node, text, _ in self._units:
+            if len(text) < _MIN_PARAGRAPH_CHARS or node.tag in _HEADING_TAGS:
+                continue
+            target = node.parent if node.tag in _PARAGRAPH_TAGS else node
+            score = 1 + len(_COMMAS.findall(text)) + min(len(text) // 100, 3)
+            for candidate, share in ((target, 1.0), (target.parent if target else None, 0.5)):
+                if candidate is None or candidate is self._root:
+                    continue
+                if not candidate.scored:
+                    candidate.scored = True
+                    candidate.score = candidate.weight
+                    candidates.append(candidate)
+                candidate.score += score * share
+        return candidates
+
+    def _unit_line(self, node: _Node, text: str) -> str:
+        if node.tag in _HEADING_TAGS:
+            return f"{'#' * int(node.tag[1])} {text}"
+        if node.tag == "li":
+            return f"- {text}"
+        return text
+
+    @property
+    def text(self) -> str:
+        """本文の段落を空行区切りで連結したテキスト。見出しはMarkdown形式で残す。
+
+        ``close()`` の後に確定する。本文を特定できない場合、または選んだ要素に
+        出力する段落がない場合は、除外要素以外のすべての段落を返す。
+        """
+        return self._text
+
+    def _select_text(self) -> str:
+        """最もスコアの高い要素と、スコアの近い兄弟要素の段落を出力する。"""
+        candidates = self._score_candidates()
+        if candidates:
+            best = max(candidates, key=lambda node: node.score * (1 - node.link_density()))
+            best_score = best.score * (1 - best.link_density())
+            threshold = max(10.0, best_score * _SIBLING_SCORE_RATIO)
+            selected = [
+                node
+                for node in candidates
+                if node is best
+                or (
+                    node.parent is best.parent
+                    and node.score * (1 - node.link_density()) >= threshold
+                )
+            ]
+            selected.sort(key=lambda node: node.units[0])
+            text = self._render(selected)
+            if text:
+                return text
+        return self._render([self._root])
+
+    def _render(self, selected: list[_Node]) -> str:
+        """選んだ要素の段落を、リンクの多い段落・付属要素を除いて連結する。"""
+        parts: list[str] = []
+        previous: _Node | None = None
+        for container in selected:
+            start, end = container.units
+            for node, text, link_chars in self._units[start:end]:
+                if link_chars / len(text) > _MAX_PARAGRAPH_LINK_DENSITY or self._in_negative(
+                    node, container
+                ):
+                    continue
+                if parts:
+                    # 連続するリスト項目は空行を挟まない
+                    both_items = previous is not None and previous.tag == node.tag == "li"
+                    parts.append("\n" if both_items else "\n\n")
+                parts.append(self._unit_line(node, text))
+                previous = node
+        return "".join(parts)
+
+    @staticmethod
+    def _in_negative(node: _Node, container: _Node) -> bool:
+        """本文要素の内側で、関連記事・共有ボタン等を示す要素に含まれるか判定する。"""
+        current: _Node | None = node
+        while current is not None and current is not container:
+            if current.negative:
+                return True
+            current = current.parent
+        return False
+
+
+def extract_main_content(html: str) -> MainContentExtractor:
+    """HTML文字列全体を解析した本文抽出器を返す。"""
+    extractor = MainContentExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor
@@ -0,0 +1,271 @@
+"""AND/OR/NOTを含むキーワード検索式のマッチャー。
+
+検索式の構文:
+    - 連続する単語は1つのフレーズとして部分一致で検索する（``machine learning``）
+    - ``"..."`` で囲むと演算子を含むフレーズも指定できる
+    - ``AND`` / ``OR`` / ``NOT`` （大文字）と括弧で条件を組み合わせる
+    - 優先順位は NOT > AND > OR。フレーズ・括弧が並ぶ場合は AND とみなす
+
+複数の検索式に含まれる語句は1つの正規表現にまとめてコンパイルするため、
+検索式の数によらずテキストの走査は1回で済む。
+"""
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+
+_TOKEN = re.compile(r'\s*(?:"([^"]*)"|(\()|(\))|([^\s()"]+))')
+_OPERATORS = frozenset({"AND", "OR", "NOT"})
+
+
+@dataclass(frozen=True)
+class Term:
+    """部分一致で検索する語句。"""
+
+    text: str
+
+
+@dataclass(frozen=True)
+class Not:
+    """否定条件。"""
+
+    operand: "Node"
+
+
+@dataclass(frozen=True)
+class And:
+    """すべての条件を満たす。"""
+
+    operands: tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    """いずれかの条件を満たす。"""
+
+    operands: tuple["Node", ...]
+
+
+type Node = Term | Not | And | Or
+
+
+def _tokenize(query: str) -> list[tuple[str, str]]:
+    """検索式を (種別, 値) のトークン列に分割する。"""
+    tokens: list[tuple[str, str]] = []
+    pos = 0
+    query = query.strip()
+    while pos < len(query):
+        match = _TOKEN.match(query, pos)
+        if match is None:
+            raise ValueError(f"閉じていない引用符があります: {query[pos:]}")
+        quoted, lparen, rparen, word = match.groups()
+        if quoted is not None:
+            tokens.append(("phrase", quoted))
+        elif lparen:
+            tokens.append(("(", lparen))
+        elif rparen:
+            tokens.append((")", rparen))
+        elif word in _OPERATORS:
+            tokens.append((word, word))
+        else:
+            tokens.append(("word", word))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """再帰下降パーサー。"""
+
+    def __init__(self, tokens: list[tuple[str, str]]) -> None:
+        self._tokens = tokens
+        self._pos = 0
+
+    def _peek(self) -> str | None:
+        return self._tokens[self._pos][0] if self._pos < len(self._tokens) else None
+
+    def parse(self) -> Node:
+        node = self._parse_or()
+        if self._peek() is not None:
+            raise ValueError(f"予期しないトークンです: {self._tokens[self._pos][1]}")
+        return node
+
+    def _parse_or(self) -> Node:
+        operands = [self._parse_and()]
+        while self._peek() == "OR":
+            self._pos += 1
+            operands.append(self._parse_and())
+        return operands[0] if len(operands) == 1 else Or(tuple(operands))
+
+    def _parse_and(self) -> Node:
+        operands = [self._parse_not()]
+        while self._peek() in ("AND", "NOT", "(", "phrase", "word"):
+            if self._peek() == "AND":
+                self._pos += 1
+            operands.append(self._parse_not())
+        return operands[0] if len(operands) == 1 else And(tuple(operands))
+
+    def _parse_not(self) -> Node:
+        if self._peek() == "NOT":
+            self._pos += 1
+            return Not(self._parse_not())
+        return self._parse_primary()
+
+    def _parse_primary(self) -> Node:
+        kind = self._peek()
+        if kind == "(":
+            self._pos += 1
+            node = self._parse_or()
+            if self._peek() != ")":
+                raise ValueError("括弧が閉じられていません")
+            self._pos += 1
+            return node
+        if kind == "phrase":
+            self._pos += 1
+            return Term(self._tokens[self._pos - 1][1])
+        if kind == "word":
+            words: list[str] = []
+            while self._peek() == "word":
+                words.append(self._tokens[self._pos][1])
+                self._pos += 1
+            return Term(" ".join(words))
+        raise ValueError("演算子の後に検索語がありません")
+
+
+def parse_query(query: str) -> Node | None:
+    """検索式を構文木に変換する。
+
+    Args:
+        query: 検索式
+
+    Returns:
+        構文木。空の検索式の場合はNone
+
+    Raises:
+        ValueError: 検索式が不正な場合
+    """
+    tokens = _tokenize(query)
+    if not tokens:
+        return None
+    return _Parser(tokens).parse()
+
+
+def _terms(node: Node) -> set[str]:
+    """構文木に含まれる語句（小文字化済み）を返す。"""
+    match node:
+        case Term(text):
+            return {text.lower()}
+        case Not(operand):
+            return _terms(operand)
+        case And(operands) | Or(operands):
+            return set().union(*(_terms(operand) for operand in operands))
+
+
+def _evaluate(node: Node, found: set[str]) -> bool:
+    """テキスト中に見つかった語句の集合に対して構文木を評価する。"""
+    match node:
+        case Term(text):
+            return text.lower() in found
+        case Not(operand):
+            return not _evaluate(operand, found)
+        case And(operands):
+            return all(_evaluate(operand, found) for operand in operands)
+        case Or(operands):
+            return any(_evaluate(operand, found) for operand in operands)
+
+
+def required_terms(node: Node) -> set[str] | None:
+    """一致するテキストが必ずいずれかを含む語句の集合を返す。
+
+    サーバー側のcontainsフィルタに使う。NOTのみの条件など、絞り込めない場合はNone。
+    """
+    match node:
+        case Term(text):
+            return {text}
+        case Not():
+            return None
+        case And(operands):
+            candidates = [terms for operand in operands if (terms := required_terms(operand))]
+            return min(candidates, key=len) if candidates else None
+        case Or(operands):
+            result: set[str] = set()
+            for operand in operands:
+                terms = required_terms(operand)
+                if terms is None:
+                    return None
+                result |= terms
+            return result
+
+
+class KeywordMatcher:
+    """名前付きの検索式をまとめてコンパイルし、テキストごとに一致する検索式を判定する。
+
+    Args:
+        expressions: 名前と検索式の対応。空の検索式はすべてのテキストに一致する
+
+    Raises:
+        ValueError: 検索式が不正な場合
+    """
+
+    def __init__(self, expressions: Mapping[str, str]) -> None:
+        self._nodes = {name: parse_query(query) for name, query in expressions.items()}
+        terms = sorted(
+            set().union(*(_terms(node) for node in self._nodes.values() if node is not None)),
+            key=len,
+            reverse=True,
+        )
+        # 先読みにより、重なり合う位置の語句も含めて各位置で最長の語句を検出する
+        self._pattern = (
+            re.compile("(?=(" + "|".join(re.escape(term) for term in terms) + "))")
+            if terms
+            else None
+        )
+        # 同じ位置から始まる短い語句は最長の語句に含まれるため、包含関係で補う
+        self._implied = {term: {other for other in terms if other in term} for term in terms}
+
+    @property
+    def names(self) -> list[str]:
+        """検索式の名前のリスト。"""
+        return list(self._nodes)
+
+    def found_terms(self, text: str) -> set[str]:
+        """テキストに含まれる語句（小文字化済み）を1回の走査で求める。"""
+        if self._pattern is None:
+            return set()
+        found: set[str] = set()
+        for match in self._pattern.finditer(text.lower()):
+            found |= self._implied[match.group(1)]
+        return found
+
+    def match(self, text: str) -> list[str]:
+        """テキストに一致する検索式の名前を返す。"""
+        found = self.found_terms(text)
+        return [
+            name for name, node in self._nodes.items() if node is None or _evaluate(node, found)
+        ]
+
+    def matches(self, text: str) -> bool:
+        """テキストがいずれかの検索式に一致するか判定する。"""
+        return bool(self.match(text))
+
+    def required_terms(self) -> list[str] | None:
+        """いずれかの検索式に一致するテキストが必ず含む語句のいずれかを返す。
+
+        Returns:
+            語句のリスト（元の大文字・小文字を保持）。絞り込めない場合はNone
+        """
+        result: set[str] = set()
+        for node in self._nodes.values():
+            if node is None:
+                return None
+            terms = required_terms(node)
+            if terms is None:
+                return None
+            result |= terms
+        return sorted(result)
+
+
+@lru_cache(maxsize=128)
+def compile_query(query: str) -> KeywordMatcher:
+    """単一の検索式をコンパイルする。同じ検索式はキャッシュを再利用する。"""
+    return KeywordMatcher({query: query})
@@ -0,0 +1,119 @@
+"""複数Notionデータベースの並行収集Collector。"""
+
+import asyncio
+import logging
+from types import TracebackType
+from typing import Self
+
+import httpx
+
+from src.collectors.notion_base import (
+    NOTION_RATE_LIMIT,
+    NotionBaseCollector,
+    create_notion_client,
+)
+from src.collectors.notion_medium import NotionMediumCollector
+from src.collectors.notion_news import NotionNewsCollector
+from src.collectors.notion_paper import NotionPaperCollector
+from src.errors import CollectionError
+from src.models.blog_post import CollectedData
+from src.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class NotionAggregateCollector:
+    """複数のNotion Collectorを共有レートリミッターの下で並行実行するCollector。
+
+    Notion APIのレート制限はインテグレーション単位のため、全Collectorで1つの
+    トークンバケットを共有し、並行実行しても429が発生しにくいようにする。
+
+    Args:
+        collectors: 並行実行するNotion Collector
+        rate_limiter: 共有するレートリミッター（省略時はNotionの制限値で生成）
+        client: Collector間で共有しているHTTPクライアント。指定時は ``aclose()`` で
+            クローズする
+    """
+
+    def __init__(
+        self,
+        collectors: list[NotionBaseCollector],
+        rate_limiter: TokenBucket | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._collectors = collectors
+        self._rate_limiter = rate_limiter or TokenBucket(
+            rate=NOTION_RATE_LIMIT, capacity=int(NOTION_RATE_LIMIT)
+        )
+        self._client = client
+        for collector in collectors:
+            collector.set_rate_limiter(self._rate_limiter)
+
+    @classmethod
+    def from_env(cls, token: str | None = None) -> Self:
+        """環境変数でDB IDが設定されているNotion Collectorをまとめて生成する。
+
+        全Collectorで1つのHTTPクライアントを共有する。
+
+        Args:
+            token: Notion APIトークン（省略時は環境変数NOTION_TOKEN）
+
+        Returns:
+            設定済みのCollectorを束ねたNotionAggregateCollector
+        """
+        collector_classes: list[type[NotionBaseCollector]] = [
+            NotionNewsCollector,
+            NotionPaperCollector,
+            NotionMediumCollector,
+        ]
+        collectors: list[NotionBaseCollector] = []
+        for collector_class in collector_classes:
+            try:
+                collectors.append(collector_class(token=token))
+            except CollectionError as e:
+                # トークン未設定は全DB共通の設定ミスのため、スキップせずに通知する
+                if e.source == "notion":
+                    raise
+                logger.info("Notion Collectorをスキップします: %s", e)
+        # 生成に失敗した場合にクローズされないクライアントが残らないよう、最後に生成する
+        client = create_notion_client()
+        for collector in collectors:
+            collector.set_client(client)
+        return cls(collectors, client=client)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """全Collectorと共有HTTPクライアントをクローズする。"""
+        for collector in self._collectors:
+            await collector.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def collect(self, query: str, **kwargs: object) -> list[CollectedData]:
+        """全Collectorを並行実行し、結果をCollectorの登録順に連結して返す。
+
+        Args:
+            query: フィルタキーワード（空文字で全件）
+            **kwargs: 各Collectorの ``collect`` にそのまま渡すパラメータ
+
+        Returns:
+            全Collectorの収集結果
+
+        Raises:
+            CollectionError: いずれかのCollectorで収集に失敗した場合
+        """
+        results = await asyncio.gather(
+            *(collector.collect(query, **kwargs) for collector in self._collectors)
+        )
+        return [item for result in results for item in result]
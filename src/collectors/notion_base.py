@@ -1,24 +1,153 @@
 """Notion API共通基底クラス。"""
 
+import asyncio
+import importlib.util
 import logging
 import os
-from typing import Any
+from collections.abc import AsyncGenerator, AsyncIterator, Mapping
+from contextlib import aclosing
+from datetime import UTC, date, datetime, timedelta
+from types import TracebackType
+from typing import Any, Self
+from urllib.parse import unquote
 
 import httpx
 from dotenv import load_dotenv
 
+from src.collectors.keyword_matcher import KeywordMatcher, compile_query
+from src.collectors.notion_blocks import (
+    CHILDREN_KEY,
+    block_plain_text,
+    blocks_to_markdown,
+    truncate_utf8,
+)
+from src.collectors.notion_mirror import NotionMirror
+from src.collectors.notion_schema import (
+    NotionSchema,
+    extract_checkbox,
+    extract_date,
+    extract_multi_select,
+    extract_number,
+    extract_rich_text,
+    extract_select,
+    extract_title,
+    extract_url,
+)
 from src.errors import CollectionError
+from src.models.blog_post import CollectedData
+from src.utils.fast_json import response_json
+from src.utils.rate_limit import TokenBucket
+from src.utils.retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
 NOTION_API_BASE = "https://api.notion.com/v1"
 NOTION_VERSION = "2022-06-28"
+# Notion APIのインテグレーション単位の平均レート制限（リクエスト/秒）
+NOTION_RATE_LIMIT = 3.0
+# Database Queryの1ページあたりの最大件数
+NOTION_MAX_PAGE_SIZE = 100
+# 1つの複合フィルタに含められる条件数の上限
+NOTION_MAX_FILTER_CONDITIONS = 100
+# 日付シャードを同時にページネーションする既定の数
+DEFAULT_SHARD_CONCURRENCY = 3
+# ページ本文取得の既定値（ブロックの再帰深さ、1ページあたりの最大バイト数、同時取得数）
+DEFAULT_BODY_MAX_DEPTH = 3
+DEFAULT_BODY_MAX_BYTES = 20_000
+DEFAULT_BODY_CONCURRENCY = 3
+# 別ページとして扱われ、本文として展開しないブロック型
+_SEPARATE_PAGE_BLOCK_TYPES = frozenset({"child_page", "child_database"})
+
+
+def create_notion_client(timeout: float = 30.0) -> httpx.AsyncClient:
+    """Notion API用のkeep-alive対応AsyncClientを生成する。
+
+    h2パッケージがインストールされている場合はHTTP/2を有効にする。
+    複数のCollectorに同じクライアントを渡すことで、接続を共有できる。
+
+    Args:
+        timeout: リクエストタイムアウト（秒）
+
+    Returns:
+        接続プール付きのAsyncClient
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60.0),
+    )
+
+
+def split_date_range(start: date, end: date, shards: int) -> list[tuple[date, date]]:
+    """[start, end) を日単位で重複のないshards個の連続した区間に分割する。
+
+    Args:
+        start: 開始日（含む）
+        end: 終了日（含まない）
+        shards: 分割数。日数を超える場合は1日ずつに分割する
+
+    Returns:
+        古い順の (開始日, 終了日) のリスト
+    """
+    total_days = (end - start).days
+    if total_days <= 1 or shards <= 1:
+        return [(start, end)]
+    shards = min(shards, total_days)
+    bounds = [start + timedelta(days=total_days * i // shards) for i in range(shards + 1)]
+    return list(zip(bounds, bounds[1:], strict=False))
 
 
 class NotionBaseCollector:
-    """Notion Database Query APIの共通ロジックを提供する基底クラス。"""
+    """Notion Database Query APIの共通ロジックを提供する基底クラス。
+
+    サブクラスは ``_SOURCE`` ・ ``_DATE_PROPERTY`` ・ ``_SCHEMA`` と ``_db_id`` を定義する。
+    ページは ``_SCHEMA`` で抽出したフィールドから ``_TITLE_FIELDS`` ・ ``_CONTENT_FIELDS``
+    に従ってCollectedDataへ変換されるため、新しいデータベースは宣言のみで追加できる。
+    変換を変えたい場合は ``_to_collected`` をオーバーライドする。
+
+    HTTPクライアントはインスタンスが保持し、collect呼び出し間で接続を再利用する。
+    ``async with`` または ``aclose()`` でクローズする。外部から渡されたクライアントは
+    呼び出し側の所有とし、``aclose()`` ではクローズしない。
+
+    ``mirror`` を指定すると、クエリ前に差分同期を行い、フィルタ・ソートはローカルの
+    ミラーに対して評価する。
+
+    カーソルごとのリクエストは ``retry_policy`` に従ってリトライするため、途中の
+    429や5xxでも取得済みのページを捨てずにページネーションを継続できる。
+
+    ``project_properties`` を有効にすると、スキーマのプロパティIDを一度だけ解決し、
+    ``filter_properties`` で使用する列のみをレスポンスに含める。
+
+    ``shards`` を指定すると、日付範囲を重複のない区間に分割して並行にページネーション
+    するため、長期間のバックフィルでもカーソルの逐次往復が区間数分に分散される。
+
+    ``fetch_body`` を指定すると、先頭N件のページ本文（ブロック）を並行に取得し、
+    Markdownに変換してcontentの末尾に追加する。
 
-    def __init__(self, token: str | None = None) -> None:
+    ``query`` はAND/OR/NOTを含む検索式を受け付ける（``keyword_matcher`` 参照）。
+    ``collect_topics`` は複数の検索式を1回の取得で判定し、トピックごとに振り分ける。
+    """
+
+    _SOURCE = "notion"
+    # 日付フィルタ・ソートに使うdateプロパティ名
+    _DATE_PROPERTY = "Date"
+    # プロパティ名・型と出力フィールドの対応
+    _SCHEMA = NotionSchema()
+    # 表示タイトルに使うフィールド（先頭から順に空でないものを採用）
+    _TITLE_FIELDS: tuple[str, ...] = ("title",)
+    # contentに含めるフィールドとラベル（ラベルがNoneの場合は値のみ）
+    _CONTENT_FIELDS: tuple[tuple[str, str | None], ...] = ()
+
+    _db_id: str
+
+    def __init__(
+        self,
+        token: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        mirror: NotionMirror | None = None,
+        retry_policy: RetryPolicy | None = None,
+        project_properties: bool = False,
+    ) -> None:
         load_dotenv()
         self._token = token or os.environ.get("NOTION_TOKEN", "")
         if not self._token:
@@ -26,6 +155,53 @@ class NotionBaseCollector:
                 source="notion",
                 message="NOTION_TOKENが未設定です。.envにNOTION_TOKENを設定してください。",
             )
+        self._client = client
+        self._owns_client = client is None
+        self._mirror = mirror
+        self._rate_limiter: TokenBucket | None = None
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._project_properties = project_properties
+        self._property_ids: dict[str, list[str]] = {}
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """自身が生成したHTTPクライアントをクローズする。"""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def set_client(self, client: httpx.AsyncClient) -> None:
+        """複数のCollectorで共有するHTTPクライアントを設定する。
+
+        渡したクライアントは呼び出し側の所有とし、``aclose()`` ではクローズしない。
+        """
+        self._client = client
+        self._owns_client = False
+
+    def set_rate_limiter(self, rate_limiter: TokenBucket | None) -> None:
+        """Notion APIリクエスト前に取得するレートリミッターを設定する。
+
+        複数のCollectorで同じリミッターを共有すると、インテグレーション全体の
+        リクエストレートを制限できる。
+        """
+        self._rate_limiter = rate_limiter
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """共有HTTPクライアントを返す。未生成・クローズ済みの場合は生成する。"""
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            self._client = create_notion_client()
+            self._owns_client = True
+        return self._client
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -34,16 +210,461 @@ class NotionBaseCollector:
             "Content-Type": "application/json",
         }
 
+    async def collect(self, query: str, **kwargs: object) -> list[CollectedData]:
+        """データベースからデータを収集する。
+
+        Args:
+            query: フィルタキーワード（空文字で全件）
+            **kwargs: ``collect_stream`` と同じパラメータ
+
+        Returns:
+            変換されたCollectedDataのリスト
+        """
+        return [item async for item in self.collect_stream(query, **kwargs)]
+
+    async def collect_stream(self, query: str, **kwargs: object) -> AsyncIterator[CollectedData]:
+        """データベースからデータを収集し、ページの到着ごとに逐次返す。
+
+        Args:
+            query: 検索式（AND/OR/NOT・括弧・引用符を使用可、空文字で全件）
+            **kwargs:
+                days: 過去何日間のデータを対象にするか（デフォルト: 7）
+                date_from: 開始日（YYYY-MM-DD文字列、指定時はdaysより優先）
+                date_to: 終了日（YYYY-MM-DD文字列、指定時はdaysより優先）
+                shards: 日付範囲の分割数（デフォルト: 1）。2以上で区間ごとに並行取得する
+                shard_concurrency: 同時にページネーションする区間数（デフォルト: 3）
+                max_items: 返す最大件数。指定時はpage_sizeを合わせ、件数に達した時点で
+                    以降のページを取得しない
+                fetch_body: 本文を取得する先頭の件数（デフォルト: 0）
+                body_max_depth: 本文ブロックを再帰取得する深さ（デフォルト: 3）
+                body_max_bytes: 1ページの本文の最大バイト数（デフォルト: 20000）
+                body_concurrency: 本文を同時に取得するページ数（デフォルト: 3）
+
+        Yields:
+            変換されたCollectedData
+
+        Raises:
+            CollectionError: 検索式が不正な場合、またはAPIエラー
+        """
+        matcher = self._compile_matcher({query: query})
+        max_items = self._int_option(kwargs, "max_items", 0)
+        page_size = min(NOTION_MAX_PAGE_SIZE, max_items) if max_items > 0 else None
+        pages = self._iter_query_pages(
+            self._build_terms_filter(matcher.required_terms(), self._SCHEMA.search_properties),
+            kwargs,
+            page_size=page_size,
+        )
+        body_count = self._int_option(kwargs, "fetch_body", 0)
+        # 本文を取得する先頭N件は揃ってから一括で並行取得する
+        head: list[tuple[str | None, CollectedData]] = []
+        count = 0
+        try:
+            # 件数に達して抜けた場合も、取得中のページネーションを確実に終了させる
+            async with aclosing(pages):
+                async for page in pages:
+                    item = self._to_collected(page, query)
+                    if item is None:
+                        continue
+                    count += 1
+                    if count <= body_count:
+                        head.append((page.get("id"), item))
+                        if count == body_count:
+                            for enriched in await self._attach_bodies(head, kwargs):
+                                yield enriched
+                            head = []
+                    else:
+                        yield item
+                    if max_items > 0 and count >= max_items:
+                        break
+            if head:
+                for enriched in await self._attach_bodies(head, kwargs):
+                    yield enriched
+        except CollectionError:
+            raise
+        except httpx.HTTPError as e:
+            raise CollectionError(source=self._SOURCE, message=str(e)) from e
+
+    async def collect_topics(
+        self, topics: Mapping[str, str], **kwargs: object
+    ) -> dict[str, list[CollectedData]]:
+        """複数の検索式を1回の取得で評価し、トピックごとに振り分ける。
+
+        サーバー側には全トピックの検索語のいずれかを含む条件で問い合わせ、取得した
+        ページを1回の走査で各トピックの検索式と照合する。1件が複数のトピックに
+        一致した場合は、それぞれのトピックに含める。
+
+        Args:
+            topics: トピック名と検索式の対応
+            **kwargs: days, date_from, date_to, shards, shard_concurrency
+
+        Returns:
+            トピック名をキーとする収集データ。一致しないトピックは空リスト
+
+        Raises:
+            CollectionError: 検索式が不正な場合、またはAPIエラー
+        """
+        matcher = self._compile_matcher(topics)
+        buckets: dict[str, list[CollectedData]] = {name: [] for name in topics}
+        pages = self._iter_query_pages(
+            self._build_terms_filter(matcher.required_terms(), self._SCHEMA.search_properties),
+            kwargs,
+        )
+        try:
+            async with aclosing(pages):
+                async for page in pages:
+                    fields = self._SCHEMA.extract(page)
+                    names = matcher.match(self._searchable_text(fields))
+                    if not names:
+                        continue
+                    item = self._fields_to_collected(fields)
+                    for name in names:
+                        buckets[name].append(item)
+        except CollectionError:
+            raise
+        except httpx.HTTPError as e:
+            raise CollectionError(source=self._SOURCE, message=str(e)) from e
+        return buckets
+
+    def _compile_matcher(self, expressions: Mapping[str, str]) -> KeywordMatcher:
+        """検索式をコンパイルする。不正な検索式はCollectionErrorに変換する。"""
+        try:
+            if len(expressions) == 1:
+                return compile_query(next(iter(expressions.values())))
+            return KeywordMatcher(expressions)
+        except ValueError as e:
+            raise CollectionError(source=self._SOURCE, message=f"検索式が不正です: {e}") from e
+
+    def _iter_query_pages(
+        self,
+        keyword_filter: dict[str, Any] | None,
+        kwargs: dict[str, object],
+        page_size: int | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """日付範囲・シャード指定に応じて、日付の降順にページを返すイテレーターを作る。"""
+        on_or_after, before = self._resolve_date_range(kwargs)
+        shards = self._int_option(kwargs, "shards", 1)
+        if shards > 1 and self._mirror is None:
+            return self.iter_sharded_pages(
+                self._db_id,
+                date_from=on_or_after,
+                date_to=before,
+                shards=shards,
+                filter_obj=keyword_filter,
+                concurrency=self._int_option(
+                    kwargs, "shard_concurrency", DEFAULT_SHARD_CONCURRENCY
+                ),
+                page_size=page_size,
+            )
+        # ミラーはローカル評価のため分割の効果がなく、通常のクエリで十分
+        return self.iter_pages(
+            self._db_id,
+            filter_obj=self._combine_filters(
+                self._date_window_filter(on_or_after, before), keyword_filter
+            ),
+            sorts=[{"property": self._DATE_PROPERTY, "direction": "descending"}],
+            page_size=page_size,
+        )
+
+    async def _attach_bodies(
+        self, items: list[tuple[str | None, CollectedData]], kwargs: dict[str, object]
+    ) -> list[CollectedData]:
+        """ページ本文を並行に取得し、contentに追加したCollectedDataを元の順序で返す。
+
+        本文の取得に失敗したページは、プロパティのみのcontentのまま返す。
+        """
+        max_depth = self._int_option(kwargs, "body_max_depth", DEFAULT_BODY_MAX_DEPTH)
+        max_bytes = self._int_option(kwargs, "body_max_bytes", DEFAULT_BODY_MAX_BYTES)
+        concurrency = self._int_option(kwargs, "body_concurrency", DEFAULT_BODY_CONCURRENCY)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def attach(page_id: str | None, item: CollectedData) -> CollectedData:
+            if not page_id:
+                return item
+            try:
+                async with semaphore:
+                    body = await self.fetch_page_body(page_id, max_depth, max_bytes)
+            except (CollectionError, httpx.HTTPError) as e:
+                logger.warning("Notionページ本文の取得に失敗しました: page=%s, %s", page_id, e)
+                return item
+            if not body:
+                return item
+            content = f"{item.content}\n\n{body}" if item.content else body
+            return item.model_copy(update={"content": content})
+
+        return list(await asyncio.gather(*(attach(page_id, item) for page_id, item in items)))
+
+    async def fetch_page_body(
+        self,
+        page_id: str,
+        max_depth: int = DEFAULT_BODY_MAX_DEPTH,
+        max_bytes: int = DEFAULT_BODY_MAX_BYTES,
+    ) -> str:
+        """ページ本文のブロックを取得し、Markdownに変換して返す。
+
+        子ブロックはmax_depth階層まで再帰的に取得する。テキスト量がmax_bytesに
+        達した時点で以降のブロックは取得しない。
+
+        Args:
+            page_id: ページID
+            max_depth: 取得するブロックの階層数（1でページ直下のみ）
+            max_bytes: 本文の最大バイト数（UTF-8）
+
+        Returns:
+            Markdown形式の本文
+        """
+        client = self._get_client()
+        remaining = max_bytes
+
+        async def fetch_children(block_id: str, depth: int) -> list[dict[str, Any]]:
+            nonlocal remaining
+            url = f"{NOTION_API_BASE}/blocks/{block_id}/children"
+            blocks: list[dict[str, Any]] = []
+            start_cursor: str | None = None
+            while remaining > 0:
+                params: dict[str, Any] = {"page_size": NOTION_MAX_PAGE_SIZE}
+                if start_cursor:
+                    params["start_cursor"] = start_cursor
+                response = await self._request_with_retry(client, "GET", url, params=params)
+                data = response_json(response)
+                for block in data.get("results", []):
+                    if remaining <= 0:
+                        break
+                    remaining -= len(block_plain_text(block).encode("utf-8"))
+                    blocks.append(block)
+                    if (
+                        block.get("has_children")
+                        and depth > 1
+                        and block.get("type") not in _SEPARATE_PAGE_BLOCK_TYPES
+                    ):
+                        block[CHILDREN_KEY] = await fetch_children(block["id"], depth - 1)
+                if data.get("has_more") and data.get("next_cursor"):
+                    start_cursor = data["next_cursor"]
+                else:
+                    break
+            return blocks
+
+        blocks = await fetch_children(page_id, max(1, max_depth))
+        return truncate_utf8(blocks_to_markdown(blocks), max_bytes)
+
+    def _to_collected(self, page: dict[str, Any], query: str) -> CollectedData | None:
+        """ページをCollectedDataに変換する。queryに一致しない場合はNoneを返す。"""
+        fields = self._SCHEMA.extract(page)
+
+        # サーバー側のcontainsフィルタは必要条件のみのため、NOTや語句の組み合わせを
+        # 含む検索式はクライアント側で評価する
+        if query and not compile_query(query).matches(self._searchable_text(fields)):
+            return None
+        return self._fields_to_collected(fields)
+
+    def _searchable_text(self, fields: dict[str, Any]) -> str:
+        """検索対象フィールドを連結したテキストを返す。"""
+        return " ".join(str(fields.get(field) or "") for field in self._SCHEMA.searchable_fields)
+
+    def _fields_to_collected(self, fields: dict[str, Any]) -> CollectedData:
+        """スキーマで抽出したフィールドからCollectedDataを構築する。"""
+        display_title = next(
+            (str(fields[field]) for field in self._TITLE_FIELDS if fields.get(field)),
+            "Untitled",
+        )
+        content_parts: list[str] = []
+        for field, label in self._CONTENT_FIELDS:
+            value = fields.get(field)
+            if not value:
+                continue
+            text = ", ".join(value) if isinstance(value, list) else str(value)
+            content_parts.append(f"{label}: {text}" if label else text)
+
+        return CollectedData(
+            source=self._SOURCE,
+            title=display_title,
+            url=fields.get("url") or None,
+            content="\n".join(content_parts),
+            collected_at=datetime.now(UTC),
+            published_date=fields.get("published_date") or None,
+        )
+
+    @staticmethod
+    def _resolve_date_range(kwargs: dict[str, object]) -> tuple[str, str | None]:
+        """days / date_from / date_to から (開始日, 終了日) を求める。終了日は排他的。"""
+        date_from = kwargs.get("date_from")
+        date_to = kwargs.get("date_to")
+
+        if isinstance(date_from, str) and date_from:
+            on_or_after = date_from
+        else:
+            days = NotionBaseCollector._int_option(kwargs, "days", 7)
+            cutoff = datetime.now(UTC) - timedelta(days=days)
+            on_or_after = cutoff.strftime("%Y-%m-%d")
+
+        before = date_to if isinstance(date_to, str) and date_to else None
+        return on_or_after, before
+
+    def _date_window_filter(self, on_or_after: str, before: str | None) -> dict[str, Any]:
+        """日付プロパティが [on_or_after, before) に含まれるページのフィルタを構築する。"""
+        on_or_after_filter: dict[str, Any] = {
+            "property": self._DATE_PROPERTY,
+            "date": {"on_or_after": on_or_after},
+        }
+        if before is None:
+            return on_or_after_filter
+
+        before_filter: dict[str, Any] = {
+            "property": self._DATE_PROPERTY,
+            "date": {"before": before},
+        }
+        return {"and": [on_or_after_filter, before_filter]}
+
+    @staticmethod
+    def _int_option(kwargs: dict[str, object], key: str, default: int) -> int:
+        """kwargsから整数オプションを取り出す。未指定・不正な型の場合はdefault。"""
+        value = kwargs.get(key, default)
+        return int(value) if isinstance(value, (int, str)) else default
+
     async def _query_database(
         self,
-        client: httpx.AsyncClient,
         db_id: str,
         filter_obj: dict[str, Any] | None = None,
         sorts: list[dict[str, Any]] | None = None,
     ) -> list[dict[str, Any]]:
         """ページネーション対応のDatabase Queryを実行する。"""
+        return [page async for page in self.iter_pages(db_id, filter_obj=filter_obj, sorts=sorts)]
+
+    async def iter_pages(
+        self,
+        db_id: str,
+        filter_obj: dict[str, Any] | None = None,
+        sorts: list[dict[str, Any]] | None = None,
+        page_size: int | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Database Queryの結果をカーソルページの到着ごとに1件ずつ返す。
+
+        ミラーが設定されている場合は差分同期後、ミラーに対してクエリを評価する。
+
+        Args:
+            db_id: データベースID
+            filter_obj: Notion Database Queryのfilterオブジェクト
+            sorts: Notion Database Queryのsortsリスト
+            page_size: 1リクエストあたりの取得件数（最大100、Noneの場合はAPIの既定値）
+
+        Yields:
+            Notion APIのページオブジェクト
+        """
+        if self._mirror is not None:
+            await self._sync_mirror(self._mirror, db_id)
+            for page in self._mirror.query(db_id, filter_obj=filter_obj, sorts=sorts):
+                yield page
+            return
+        async for page in self._iter_remote_pages(
+            db_id, filter_obj=filter_obj, sorts=sorts, page_size=page_size
+        ):
+            yield page
+
+    async def iter_sharded_pages(
+        self,
+        db_id: str,
+        date_from: str,
+        date_to: str | None = None,
+        shards: int = 2,
+        filter_obj: dict[str, Any] | None = None,
+        descending: bool = True,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        page_size: int | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """日付範囲を分割し、区間ごとに並行してページネーションした結果を返す。
+
+        各区間は ``_DATE_PROPERTY`` でソートしてクエリし、区間自体もソート順に並べて
+        連結するため、全体としてソート順が保たれる。区間の境界は重複しないが、
+        ページIDで重複を除いてから返す。
+
+        Args:
+            db_id: データベースID
+            date_from: 開始日（YYYY-MM-DD、含む）
+            date_to: 終了日（YYYY-MM-DD、含まない）。Noneの場合は上限なし
+            shards: 分割数
+            filter_obj: 日付条件に加えて適用するfilterオブジェクト
+            descending: 日付の降順で返すか
+            concurrency: 同時にページネーションする区間数
+            page_size: 1リクエストあたりの取得件数
+
+        Yields:
+            Notion APIのページオブジェクト
+        """
+        start = date.fromisoformat(date_from)
+        # 上限なしの場合は今日までを分割し、最新の区間のみ上限を外す
+        if date_to:
+            end = date.fromisoformat(date_to)
+        else:
+            end = datetime.now(UTC).date() + timedelta(days=1)
+        windows = split_date_range(start, end, shards)
+        last_index = len(windows) - 1
+        direction = "descending" if descending else "ascending"
+        sorts = [{"property": self._DATE_PROPERTY, "direction": direction}]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch_window(index: int) -> list[dict[str, Any]]:
+            window_start, window_end = windows[index]
+            before = None if index == last_index and not date_to else window_end.isoformat()
+            window_filter = self._combine_filters(
+                self._date_window_filter(window_start.isoformat(), before), filter_obj
+            )
+            async with semaphore:
+                return [
+                    page
+                    async for page in self._iter_remote_pages(
+                        db_id, filter_obj=window_filter, sorts=sorts, page_size=page_size
+                    )
+                ]
+
+        # 各区間が同時にプロパティ定義を取得しないよう、先にキャッシュしておく
+        await self._filter_properties(db_id)
+        order = range(last_index, -1, -1) if descending else range(last_index + 1)
+        tasks = [asyncio.create_task(fetch_window(index)) for index in order]
+        seen: set[str] = set()
+        try:
+            for task in tasks:
+                for page in await task:
+                    page_id = page.get("id")
+                    if page_id is not None:
+                        if page_id in seen:
+                            continue
+                        seen.add(page_id)
+                    yield page
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _sync_mirror(self, mirror: NotionMirror, db_id: str) -> None:
+        """前回の同期以降に編集されたページのみを取得し、ミラーへupsertする。"""
+        high_water_mark = mirror.high_water_mark(db_id)
+        filter_obj: dict[str, Any] | None = None
+        if high_water_mark:
+            # last_edited_timeは分単位で丸められるため、境界を含めて取得する
+            filter_obj = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": high_water_mark},
+            }
+        pages = [
+            page
+            async for page in self._iter_remote_pages(
+                db_id,
+                filter_obj=filter_obj,
+                sorts=[{"timestamp": "last_edited_time", "direction": "ascending"}],
+            )
+        ]
+        mirror.upsert(db_id, pages)
+        logger.debug("Notionミラーを同期しました: db=%s, pages=%d", db_id, len(pages))
+
+    async def _iter_remote_pages(
+        self,
+        db_id: str,
+        filter_obj: dict[str, Any] | None = None,
+        sorts: list[dict[str, Any]] | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Notion APIに対してページネーションしながらページを逐次返す。"""
+        client = self._get_client()
         url = f"{NOTION_API_BASE}/databases/{db_id}/query"
-        all_results: list[dict[str, Any]] = []
         start_cursor: str | None = None
 
         while True:
@@ -54,85 +675,166 @@ class NotionBaseCollector:
                 body["sorts"] = sorts
             if start_cursor:
                 body["start_cursor"] = start_cursor
+            if page_size:
+                body["page_size"] = page_size
+
+            response = await self._request_with_retry(
+                client, "POST", url, json=body, params=await self._filter_properties(db_id)
+            )
+            data = response_json(response)
+            for page in data.get("results", []):
+                yield page
+
+            if data.get("has_more") and data.get("next_cursor"):
+                start_cursor = data["next_cursor"]
+            else:
+                break
+
+    async def _filter_properties(self, db_id: str) -> list[tuple[str, str]] | None:
+        """スキーマのプロパティに対応するfilter_propertiesクエリパラメータを返す。
+
+        filter_propertiesにはプロパティIDを指定する必要があるため、データベースの
+        定義を一度だけ取得し、プロパティ名からIDへの対応をキャッシュする。
+        """
+        if not self._project_properties or not self._SCHEMA.properties:
+            return None
+        if db_id not in self._property_ids:
+            client = self._get_client()
+            response = await self._request_with_retry(
+                client, "GET", f"{NOTION_API_BASE}/databases/{db_id}"
+            )
+            definitions = response_json(response).get("properties", {})
+            # IDはURLエンコード済みで返るため、二重エンコードを避けてデコードしておく
+            self._property_ids[db_id] = [
+                unquote(str(definitions[name]["id"]))
+                for name in self._SCHEMA.property_names
+                if name in definitions and "id" in definitions[name]
+            ]
+        return [("filter_properties", prop_id) for prop_id in self._property_ids[db_id]]
+
+    async def _request_with_retry(
+        self, client: httpx.AsyncClient, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """リトライ方針に従ってNotion APIへリクエストを送信する。
+
+        Raises:
+            CollectionError: リトライ対象外のエラー、または試行回数を使い切った場合
+            httpx.TransportError: 最終試行で通信エラーが発生した場合
+        """
+        policy = self._retry_policy
+        for attempt in range(policy.max_attempts):
+            is_last_attempt = attempt + 1 >= policy.max_attempts
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            try:
+                response = await client.request(method, url, headers=self._headers(), **kwargs)
+            except httpx.TransportError as e:
+                if is_last_attempt:
+                    raise
+                delay = policy.compute_delay(attempt)
+                logger.warning("Notion API通信エラー、%.1f秒後にリトライします: %s", delay, e)
+                await asyncio.sleep(delay)
+                continue
 
-            response = await client.post(url, headers=self._headers(), json=body)
-            if response.status_code != 200:
+            if response.status_code == 200:
+                return response
+            if is_last_attempt or not policy.is_retryable(response.status_code):
                 raise CollectionError(
                     source="notion",
                     message=f"Notion API エラー (HTTP {response.status_code}): {response.text}",
                 )
+            delay = policy.compute_delay(attempt, response.headers.get("Retry-After"))
+            logger.warning(
+                "Notion API エラー (HTTP %d)、%.1f秒後にリトライします",
+                response.status_code,
+                delay,
+            )
+            await asyncio.sleep(delay)
 
-            data = response.json()
-            results = data.get("results", [])
-            all_results.extend(results)
+        raise CollectionError(source="notion", message="Notion APIのリトライ回数が不正です")
 
-            if data.get("has_more") and data.get("next_cursor"):
-                start_cursor = data["next_cursor"]
-            else:
-                break
+    @staticmethod
+    def _build_terms_filter(
+        terms: list[str] | None, properties: tuple[tuple[str, str], ...]
+    ) -> dict[str, Any] | None:
+        """いずれかの語句を含むページに絞り込むcontains条件のorフィルタを構築する。
 
-        return all_results
+        Args:
+            terms: 語句のリスト。Noneまたは空の場合は絞り込まない
+            properties: (プロパティ名, プロパティ型) のタプル。型はtitleまたはrich_text
+
+        Returns:
+            filterオブジェクト。絞り込まない場合、または条件数が上限を超える場合はNone
+        """
+        if not terms or not properties:
+            return None
+        conditions: list[dict[str, Any]] = [
+            {"property": name, prop_type: {"contains": term}}
+            for term in terms
+            for name, prop_type in properties
+        ]
+        if len(conditions) > NOTION_MAX_FILTER_CONDITIONS:
+            return None
+        if len(conditions) == 1:
+            return conditions[0]
+        return {"or": conditions}
+
+    @staticmethod
+    def _combine_filters(*filters: dict[str, Any] | None) -> dict[str, Any] | None:
+        """複数のfilterオブジェクトをand条件で結合する。
+
+        Notionの複合フィルタはネスト2段までのため、and同士は平坦化する。
+        """
+        conditions: list[dict[str, Any]] = []
+        for filter_obj in filters:
+            if not filter_obj:
+                continue
+            if list(filter_obj) == ["and"]:
+                conditions.extend(filter_obj["and"])
+            else:
+                conditions.append(filter_obj)
+        if not conditions:
+            return None
+        if len(conditions) == 1:
+            return conditions[0]
+        return {"and": conditions}
 
     @staticmethod
     def _extract_title(props: dict[str, Any], key: str) -> str:
         """titleプロパティからテキストを抽出する。"""
-        prop = props.get(key, {})
-        title_list = prop.get("title", [])
-        if not title_list:
-            return ""
-        return "".join(item.get("plain_text", "") for item in title_list)
+        return extract_title(props.get(key, {}))
 
     @staticmethod
     def _extract_rich_text(props: dict[str, Any], key: str) -> str:
         """rich_textプロパティからテキストを抽出する。"""
-        prop = props.get(key, {})
-        rich_text_list = prop.get("rich_text", [])
-        if not rich_text_list:
-            return ""
-        return "".join(item.get("plain_text", "") for item in rich_text_list)
+        return extract_rich_text(props.get(key, {}))
 
     @staticmethod
     def _extract_url(props: dict[str, Any], key: str) -> str:
         """urlプロパティから値を抽出する。"""
-        prop = props.get(key, {})
-        return prop.get("url", "") or ""
+        return extract_url(props.get(key, {}))
 
     @staticmethod
     def _extract_date(props: dict[str, Any], key: str) -> str:
         """dateプロパティからstart日付を抽出する。"""
-        prop = props.get(key, {})
-        date_obj = prop.get("date")
-        if not date_obj:
-            return ""
-        return date_obj.get("start", "") or ""
+        return extract_date(props.get(key, {}))
 
     @staticmethod
     def _extract_multi_select(props: dict[str, Any], key: str) -> list[str]:
         """multi_selectプロパティから名前のリストを抽出する。"""
-        prop = props.get(key, {})
-        options = prop.get("multi_select", [])
-        return [opt.get("name", "") for opt in options if opt.get("name")]
+        return extract_multi_select(props.get(key, {}))
 
     @staticmethod
     def _extract_number(props: dict[str, Any], key: str) -> float | None:
         """numberプロパティから値を抽出する。"""
-        prop = props.get(key, {})
-        value = prop.get("number")
-        if value is None:
-            return None
-        return float(value)
+        return extract_number(props.get(key, {}))
 
     @staticmethod
     def _extract_checkbox(props: dict[str, Any], key: str) -> bool:
         """checkboxプロパティから値を抽出する。"""
-        prop = props.get(key, {})
-        return bool(prop.get("checkbox", False))
+        return extract_checkbox(props.get(key, {}))
 
     @staticmethod
     def _extract_select(props: dict[str, Any], key: str) -> str:
         """selectプロパティから名前を抽出する。"""
-        prop = props.get(key, {})
-        select = prop.get("select")
-        if not select:
-            return ""
-        return select.get("name", "") or ""
+        return extract_select(props.get(key, {}))
@@ -0,0 +1,96 @@
+"""Notionブロック（ページ本文）のMarkdown変換。"""
+
+from typing import Any
+
+# 子ブロックを取得した結果を格納するキー（Notion APIのレスポンスには含まれない）
+CHILDREN_KEY = "children"
+
+_HEADING_PREFIXES = {"heading_1": "# ", "heading_2": "## ", "heading_3": "### "}
+_LIST_PREFIXES = {"bulleted_list_item": "- ", "numbered_list_item": "1. "}
+
+
+def rich_text_to_markdown(rich_text: list[dict[str, Any]]) -> str:
+    """rich_text配列をMarkdownのインラインテキストに変換する。
+
+    リンクはMarkdownリンク、インラインコードはバッククォートで表現する。
+    """
+    parts: list[str] = []
+    for item in rich_text:
+        text = item.get("plain_text", "")
+        if not text:
+            continue
+        if (item.get("annotations") or {}).get("code"):
+            text = f"`{text}`"
+        href = item.get("href")
+        if href:
+            text = f"[{text}]({href})"
+        parts.append(text)
+    return "".join(parts)
+
+
+def block_plain_text(block: dict[str, Any]) -> str:
+    """ブロック自身のテキスト（子ブロックを除く）を返す。"""
+    value = block.get(block.get("type", "")) or {}
+    return "".join(item.get("plain_text", "") for item in value.get("rich_text") or [])
+
+
+def _block_lines(block: dict[str, Any], indent: str) -> list[str]:
+    """1ブロックとその子ブロックをMarkdownの行に変換する。"""
+    block_type = block.get("type", "")
+    value = block.get(block_type) or {}
+    text = rich_text_to_markdown(value.get("rich_text") or [])
+    child_indent = indent
+
+    if block_type in _HEADING_PREFIXES:
+        line = f"{_HEADING_PREFIXES[block_type]}{text}"
+    elif block_type in _LIST_PREFIXES:
+        line = f"{_LIST_PREFIXES[block_type]}{text}"
+        child_indent = indent + "  "
+    elif block_type == "to_do":
+        line = f"- [{'x' if value.get('checked') else ' '}] {text}"
+        child_indent = indent + "  "
+    elif block_type in ("quote", "callout"):
+        line = f"> {text}"
+    elif block_type == "code":
+        language = value.get("language", "")
+        code = "".join(item.get("plain_text", "") for item in value.get("rich_text") or [])
+        return [
+            f"{indent}```{language}",
+            *(f"{indent}{c}" for c in code.split("\n")),
+            f"{indent}```",
+        ]
+    elif block_type == "equation":
+        line = f"$${value.get('expression', '')}$$"
+    elif block_type == "divider":
+        line = "---"
+    else:
+        # paragraph・toggle等はテキストのみ、テキストを持たないブロックは子のみ出力する
+        line = text
+
+    lines = [f"{indent}{line}"] if line else []
+    for child in block.get(CHILDREN_KEY) or []:
+        lines.extend(_block_lines(child, child_indent))
+    return lines
+
+
+def blocks_to_markdown(blocks: list[dict[str, Any]]) -> str:
+    """ブロックのリストをMarkdown文字列に変換する。
+
+    Args:
+        blocks: Notion APIのブロックオブジェクトのリスト。子ブロックは ``children`` キーに格納
+
+    Returns:
+        Markdown文字列
+    """
+    lines: list[str] = []
+    for block in blocks:
+        lines.extend(_block_lines(block, ""))
+    return "\n".join(lines)
+
+
+def truncate_utf8(text: str, max_bytes: int) -> str:
+    """UTF-8でmax_bytes以内に収まるよう、文字の途中で切らずに切り詰める。"""
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode("utf-8", errors="ignore")
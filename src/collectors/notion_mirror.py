@@ -0,0 +1,220 @@
+"""Notionデータベースのローカルミラー。"""
+
+import json
+import operator
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from src.utils import fast_json
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    db_id TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    last_edited_time TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (db_id, page_id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    db_id TEXT PRIMARY KEY,
+    high_water_mark TEXT NOT NULL
+);
+"""
+
+_DATE_OPERATORS: dict[str, Callable[[str, str], bool]] = {
+    "equals": operator.eq,
+    "before": operator.lt,
+    "after": operator.gt,
+    "on_or_before": operator.le,
+    "on_or_after": operator.ge,
+}
+
+
+class NotionMirror:
+    """Notionデータベースのページをlast_edited_time基準でSQLiteに保持するミラー。
+
+    同期時は前回のハイウォーターマーク以降に編集されたページのみを取得してupsertし、
+    日付フィルタやソートはローカルで評価する。Notion APIはアーカイブ済みページを
+    返さないため、削除はミラーに反映されない。
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """DB接続をクローズする。"""
+        self._conn.close()
+
+    def high_water_mark(self, db_id: str) -> str | None:
+        """前回同期時の最大last_edited_timeを返す。未同期の場合はNone。"""
+        row = self._conn.execute(
+            "SELECT high_water_mark FROM sync_state WHERE db_id = ?", (db_id,)
+        ).fetchone()
+        return str(row[0]) if row else None
+
+    def upsert(self, db_id: str, pages: list[dict[str, Any]]) -> None:
+        """ページをupsertし、ハイウォーターマークを更新する。
+
+        Args:
+            db_id: データベースID
+            pages: Notion APIのページオブジェクトのリスト
+        """
+        if not pages:
+            return
+        rows = [
+            (db_id, str(page["id"]), str(page.get("last_edited_time", "")), json.dumps(page))
+            for page in pages
+            if page.get("id")
+        ]
+        latest = max((row[2] for row in rows), default="")
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO pages (db_id, page_id, last_edited_time, data) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (db_id, page_id) DO UPDATE SET "
+                "last_edited_time = excluded.last_edited_time, data = excluded.data",
+                rows,
+            )
+            current = self.high_water_mark(db_id)
+            if latest and (current is None or latest > current):
+                self._conn.execute(
+                    "INSERT INTO sync_state (db_id, high_water_mark) VALUES (?, ?) "
+                    "ON CONFLICT (db_id) DO UPDATE SET high_water_mark = excluded.high_water_mark",
+                    (db_id, latest),
+                )
+
+    def query(
+        self,
+        db_id: str,
+        filter_obj: dict[str, Any] | None = None,
+        sorts: list[dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """ミラー内のページに対してNotion形式のフィルタ・ソートをローカルで評価する。
+
+        Args:
+            db_id: データベースID
+            filter_obj: Notion Database Queryのfilterオブジェクト
+            sorts: Notion Database Queryのsortsリスト
+
+        Returns:
+            条件に一致したページのリスト
+        """
+        rows = self._conn.execute("SELECT data FROM pages WHERE db_id = ?", (db_id,))
+        pages: list[dict[str, Any]] = [fast_json.loads(row[0]) for row in rows]
+        if filter_obj:
+            pages = [page for page in pages if matches_filter(page, filter_obj)]
+        # 安定ソートを後ろの条件から順に適用し、複数キーのソートを再現する
+        for sort in reversed(sorts or []):
+            pages.sort(
+                key=lambda page: _sort_key(page, sort),
+                reverse=sort.get("direction") == "descending",
+            )
+        return pages
+
+
+def matches_filter(page: dict[str, Any], filter_obj: dict[str, Any]) -> bool:
+    """Notion形式のフィルタをページに対して評価する。
+
+    対応している条件: and/or、date・title・rich_text・url・checkbox・select・
+    multi_selectプロパティ、created_time/last_edited_timeタイムスタンプ。
+
+    Args:
+        page: Notion APIのページオブジェクト
+        filter_obj: Notion Database Queryのfilterオブジェクト
+
+    Returns:
+        条件に一致する場合True
+    """
+    if "and" in filter_obj:
+        return all(matches_filter(page, sub) for sub in filter_obj["and"])
+    if "or" in filter_obj:
+        return any(matches_filter(page, sub) for sub in filter_obj["or"])
+    if "timestamp" in filter_obj:
+        key = str(filter_obj["timestamp"])
+        return _match_date(page.get(key), filter_obj.get(key, {}))
+
+    prop = page.get("properties", {}).get(filter_obj.get("property", ""), {})
+    if "date" in filter_obj:
+        date_obj = prop.get("date") or {}
+        return _match_date(date_obj.get("start"), filter_obj["date"])
+    for text_type in ("title", "rich_text"):
+        if text_type in filter_obj:
+            text = "".join(item.get("plain_text", "") for item in prop.get(text_type) or [])
+            return _match_text(text, filter_obj[text_type])
+    if "url" in filter_obj:
+        return _match_text(prop.get("url") or "", filter_obj["url"])
+    if "checkbox" in filter_obj:
+        return bool(bool(prop.get("checkbox", False)) == filter_obj["checkbox"].get("equals"))
+    if "select" in filter_obj:
+        select = prop.get("select") or {}
+        return _match_text(select.get("name", "") or "", filter_obj["select"])
+    if "multi_select" in filter_obj:
+        names = [opt.get("name", "") for opt in prop.get("multi_select") or []]
+        condition = filter_obj["multi_select"]
+        if "contains" in condition:
+            return condition["contains"] in names
+        if "does_not_contain" in condition:
+            return condition["does_not_contain"] not in names
+        return _match_empty(bool(names), condition)
+    # 未対応の条件は除外せず、呼び出し側のクライアント側フィルタに委ねる
+    return True
+
+
+def _match_date(value: object, condition: dict[str, Any]) -> bool:
+    """date条件を評価する。日付のみの条件値は日付部分で比較する。"""
+    if not value:
+        return bool(condition.get("is_empty"))
+    text = str(value)
+    for op, target in condition.items():
+        compare = _DATE_OPERATORS.get(op)
+        if compare is None:
+            if op == "is_empty" and target:
+                return False
+            continue
+        target_str = str(target)
+        actual = text[: len(target_str)] if len(target_str) == 10 else text
+        if not compare(actual, target_str):
+            return False
+    return True
+
+
+def _match_text(text: str, condition: dict[str, Any]) -> bool:
+    """テキスト条件を評価する。Notionと同様に大文字小文字を区別しない。"""
+    lowered = text.lower()
+    if "contains" in condition:
+        return str(condition["contains"]).lower() in lowered
+    if "does_not_contain" in condition:
+        return str(condition["does_not_contain"]).lower() not in lowered
+    if "equals" in condition:
+        return lowered == str(condition["equals"]).lower()
+    if "starts_with" in condition:
+        return lowered.startswith(str(condition["starts_with"]).lower())
+    if "ends_with" in condition:
+        return lowered.endswith(str(condition["ends_with"]).lower())
+    return _match_empty(bool(text), condition)
+
+
+def _match_empty(has_value: bool, condition: dict[str, Any]) -> bool:
+    """is_empty / is_not_empty条件を評価する。"""
+    if condition.get("is_empty"):
+        return not has_value
+    if condition.get("is_not_empty"):
+        return has_value
+    return True
+
+
+def _sort_key(page: dict[str, Any], sort: dict[str, Any]) -> str:
+    """ソート条件に対応するページの比較キーを返す。"""
+    if "timestamp" in sort:
+        return str(page.get(str(sort["timestamp"]), ""))
+    prop = page.get("properties", {}).get(sort.get("property", ""), {})
+    if "date" in prop:
+        return str((prop.get("date") or {}).get("start", "") or "")
+    for text_type in ("title", "rich_text"):
+        if text_type in prop:
+            return "".join(item.get("plain_text", "") for item in prop[text_type] or [])
+    return ""
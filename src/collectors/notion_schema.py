@@ -0,0 +1,133 @@
+"""Notionデータベースの宣言的プロパティスキーマ。"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+type PropertyType = Literal[
+    "title",
+    "rich_text",
+    "url",
+    "date",
+    "multi_select",
+    "number",
+    "checkbox",
+    "select",
+]
+
+
+def extract_title(prop: dict[str, Any]) -> str:
+    """titleプロパティ値からテキストを抽出する。"""
+    return "".join(item.get("plain_text", "") for item in prop.get("title") or [])
+
+
+def extract_rich_text(prop: dict[str, Any]) -> str:
+    """rich_textプロパティ値からテキストを抽出する。"""
+    return "".join(item.get("plain_text", "") for item in prop.get("rich_text") or [])
+
+
+def extract_url(prop: dict[str, Any]) -> str:
+    """urlプロパティ値を抽出する。"""
+    return prop.get("url", "") or ""
+
+
+def extract_date(prop: dict[str, Any]) -> str:
+    """dateプロパティ値からstart日付を抽出する。"""
+    date_obj = prop.get("date")
+    if not date_obj:
+        return ""
+    return date_obj.get("start", "") or ""
+
+
+def extract_multi_select(prop: dict[str, Any]) -> list[str]:
+    """multi_selectプロパティ値から名前のリストを抽出する。"""
+    return [opt.get("name", "") for opt in prop.get("multi_select") or [] if opt.get("name")]
+
+
+def extract_number(prop: dict[str, Any]) -> float | None:
+    """numberプロパティ値を抽出する。"""
+    value = prop.get("number")
+    if value is None:
+        return None
+    return float(value)
+
+
+def extract_checkbox(prop: dict[str, Any]) -> bool:
+    """checkboxプロパティ値を抽出する。"""
+    return bool(prop.get("checkbox", False))
+
+
+def extract_select(prop: dict[str, Any]) -> str:
+    """selectプロパティ値から名前を抽出する。"""
+    select = prop.get("select")
+    if not select:
+        return ""
+    return select.get("name", "") or ""
+
+
+_EXTRACTORS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "title": extract_title,
+    "rich_text": extract_rich_text,
+    "url": extract_url,
+    "date": extract_date,
+    "multi_select": extract_multi_select,
+    "number": extract_number,
+    "checkbox": extract_checkbox,
+    "select": extract_select,
+}
+
+
+@dataclass(frozen=True)
+class PropertySpec:
+    """Notionプロパティと出力フィールドの対応定義。
+
+    Attributes:
+        name: Notion上のプロパティ名
+        type: プロパティ型
+        field: 抽出結果のフィールド名
+        searchable: queryのキーワード検索対象にするか（title/rich_textのみ）
+    """
+
+    name: str
+    type: PropertyType
+    field: str
+    searchable: bool = False
+
+
+class NotionSchema:
+    """データベースのプロパティ定義を一度だけコンパイルし、ページから値を抽出するスキーマ。
+
+    Args:
+        *properties: 抽出対象のプロパティ定義
+    """
+
+    def __init__(self, *properties: PropertySpec) -> None:
+        self.properties = properties
+        self._extractors = tuple(
+            (spec.field, spec.name, _EXTRACTORS[spec.type]) for spec in properties
+        )
+        self.search_properties: tuple[tuple[str, str], ...] = tuple(
+            (spec.name, spec.type)
+            for spec in properties
+            if spec.searchable and spec.type in ("title", "rich_text")
+        )
+        self.searchable_fields: tuple[str, ...] = tuple(
+            spec.field for spec in properties if spec.searchable
+        )
+
+    @property
+    def property_names(self) -> list[str]:
+        """スキーマが参照するNotionプロパティ名のリスト。"""
+        return [spec.name for spec in self.properties]
+
+    def extract(self, page: dict[str, Any]) -> dict[str, Any]:
+        """ページオブジェクトからスキーマのフィールドを抽出する。
+
+        Args:
+            page: Notion APIのページオブジェクト
+
+        Returns:
+            フィールド名をキーとする抽出結果
+        """
+        props = page.get("properties", {})
+        return {field: extract(props.get(name) or {}) for field, name, extract in self._extractors}
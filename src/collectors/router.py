@@ -0,0 +1,125 @@
+"""URLの種類に応じてCollectorを選ぶルーター。
+
+arXivの論文・GitHubのリポジトリを指すURLは、HTMLページを取得して本文を抽出する
+代わりに構造化APIのCollectorで取得する。応答が小さく、必要な情報（著者・
+アブストラクト・README等）を直接得られるため、転送量と解析の負荷を抑えられる。
+"""
+
+import logging
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from src.collectors.arxiv import ArxivCollector, parse_arxiv_id
+from src.collectors.base import CollectorProtocol
+from src.collectors.github import GitHubCollector
+from src.collectors.url_fetcher import URLFetcherCollector
+from src.errors import CollectionError
+from src.models.blog_post import CollectedData
+
+logger = logging.getLogger(__name__)
+
+_GITHUB_HOSTS = frozenset({"github.com", "www.github.com"})
+# リポジトリではないGitHubのトップレベルパス
+_GITHUB_RESERVED_OWNERS = frozenset(
+    {
+        "about", "collections", "enterprise", "events", "explore", "features", "login",
+        "marketplace", "notifications", "orgs", "pricing", "search", "settings", "sponsors",
+        "topics", "trending",
+    }
+)  # fmt: skip
+
+
+@dataclass(frozen=True)
+class Route:
+    """URLの振り分け先。
+
+    Attributes:
+        kind: 振り分け先（``arxiv`` / ``github`` / ``url``）
+        query: 振り分け先のCollectorに渡すクエリ
+    """
+
+    kind: str
+    query: str
+
+
+def route_url(url: str) -> Route:
+    """URLの振り分け先を決める。
+
+    arXivの論文ページ（abs・pdf・html）はarXiv ID、GitHubのリポジトリのトップページは
+    ``owner/repo`` に変換する。Issue・Pull Request等のページや、その他のURLは
+    HTML取得とする。
+    """
+    arxiv_id = parse_arxiv_id(url)
+    if arxiv_id is not None:
+        return Route(kind="arxiv", query=arxiv_id)
+
+    parsed = urlparse(url)
+    if (parsed.hostname or "").lower() in _GITHUB_HOSTS:
+        segments = [segment for segment in parsed.path.split("/") if segment]
+        if len(segments) == 2 and segments[0].lower() not in _GITHUB_RESERVED_OWNERS:
+            owner, repo = segments[0], segments[1].removesuffix(".git")
+            return Route(kind="github", query=f"{owner}/{repo}")
+    return Route(kind="url", query=url)
+
+
+class CollectorRouter:
+    """URLを構造化APIのCollectorまたはHTML取得に振り分けるCollector。
+
+    構造化APIでの取得に失敗した場合や結果が空の場合は、HTML取得にフォールバックする。
+    各Collectorは省略時、初めて使うときに生成する。
+
+    Args:
+        url_fetcher: HTML取得に使うCollector
+        github: GitHubリポジトリの取得に使うCollector
+        arxiv: arXiv論文の取得に使うCollector
+    """
+
+    def __init__(
+        self,
+        url_fetcher: CollectorProtocol | None = None,
+        github: CollectorProtocol | None = None,
+        arxiv: CollectorProtocol | None = None,
+    ) -> None:
+        self._collectors: dict[str, CollectorProtocol | None] = {
+            "url": url_fetcher,
+            "github": github,
+            "arxiv": arxiv,
+        }
+
+    def _collector(self, kind: str) -> CollectorProtocol:
+        collector = self._collectors.get(kind)
+        if collector is None:
+            if kind == "github":
+                collector = GitHubCollector()
+            elif kind == "arxiv":
+                collector = ArxivCollector()
+            else:
+                collector = URLFetcherCollector()
+            self._collectors[kind] = collector
+        return collector
+
+    async def collect(self, query: str, **kwargs: object) -> list[CollectedData]:
+        """URLの種類に応じたCollectorで内容を取得する。
+
+        Args:
+            query: 取得対象のURL
+            **kwargs: 振り分け先のCollectorに渡すパラメータ
+
+        Returns:
+            取得結果のリスト
+
+        Raises:
+            CollectionError: HTML取得に失敗した場合
+        """
+        route = route_url(query)
+        if route.kind != "url":
+            try:
+                results = await self._collector(route.kind).collect(route.query, **kwargs)
+            except CollectionError as e:
+                logger.warning(
+                    "%sでの取得に失敗したためHTMLを取得します: %s: %s", route.kind, query, e
+                )
+            else:
+                if results:
+                    return results
+        return await self._collector("url").collect(query, **kwargs)
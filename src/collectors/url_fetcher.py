@@ -1,31 +1,88 @@
 """URL取得Collector。"""
 
-import re
+import asyncio
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from urllib.parse import urlparse
 
 import httpx
+from dotenv import load_dotenv
 
+from src.collectors.html_text import HTMLTextExtractor, MainContentExtractor, extract_html
 from src.errors import CollectionError
 from src.models.blog_post import CollectedData
+from src.utils.http_cache import CachedResponse, HTTPCache, cache_key, is_storable
+from src.utils.streaming import DEFAULT_MAX_BYTES, read_capped
+
+# collect_manyで同時に取得するURL数の既定値
+DEFAULT_CONCURRENCY = 8
+# collect_manyで同一ホストに同時に送るリクエスト数の既定値
+DEFAULT_PER_HOST_CONCURRENCY = 2
+
+
+@dataclass(frozen=True)
+class URLFetchResult:
+    """collect_manyのURLごとの取得結果。
+
+    Attributes:
+        url: 取得対象のURL
+        data: 取得結果（失敗した場合はNone）
+        error: 失敗した場合のエラー
+    """
+
+    url: str
+    data: CollectedData | None = None
+    error: CollectionError | None = None
 
 
 class URLFetcherCollector:
-    """指定URLの内容を取得し、テキスト抽出するCollector。"""
+    """指定URLの内容を取得し、テキスト抽出するCollector。
 
-    def __init__(self, timeout: float = 30.0) -> None:
+    HTMLは既定でReadability方式により本文ブロックを選び、メニュー・フッター・
+    関連記事一覧等を除いた見出し付きの段落を返す。
+
+    ``cache`` （または環境変数 ``URL_FETCHER_CACHE_PATH``）を指定すると、
+    レスポンスのボディと抽出したテキストをディスクに保存する。Cache-Controlの
+    有効期間内は通信せずに返し、期限切れ後は条件付きリクエストで再検証する。
+
+    Args:
+        timeout: タイムアウト（秒）
+        max_bytes: 1ページあたりに読み込む最大バイト数。超えた分は受信しない
+        cache: レスポンスキャッシュ
+        main_content: Falseの場合、本文抽出を行わずページ全体のテキストを返す
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        cache: HTTPCache | None = None,
+        main_content: bool = True,
+    ) -> None:
+        load_dotenv()
+        cache_path = os.environ.get("URL_FETCHER_CACHE_PATH", "")
+        self._cache = cache or (HTTPCache(cache_path) if cache_path else None)
         self._timeout = timeout
+        self._max_bytes = max_bytes
+        self._main_content = main_content
 
     @staticmethod
     def _validate_url(url: str) -> None:
         """URLの安全性を検証する。"""
-        parsed = urlparse(url)
+        try:
+            parsed = urlparse(url)
+            hostname = parsed.hostname
+        except ValueError as e:
+            raise CollectionError(source="url_fetcher", message=f"不正なURL: {url}: {e}") from e
         if parsed.scheme not in ("http", "https"):
             raise CollectionError(
                 source="url_fetcher",
                 message=f"サポートされていないスキーム: {parsed.scheme}",
             )
-        if parsed.hostname in ("localhost", "127.0.0.1", "::1"):
+        if hostname in ("localhost", "127.0.0.1", "::1"):
             raise CollectionError(
                 source="url_fetcher",
                 message="ローカルホストへのアクセスは禁止されています",
@@ -36,56 +93,184 @@ class URLFetcherCollector:
 
         Args:
             query: 取得対象のURL
-            **kwargs: 未使用
+            **kwargs:
+                max_bytes: 読み込む最大バイト数（デフォルト: コンストラクタの指定値）
 
         Returns:
-            取得結果のリスト（1件）
+            取得結果のリスト（1件）。最大バイト数で打ち切った場合は ``truncated`` がTrue
 
         Raises:
             CollectionError: 取得に失敗した場合
         """
         url = query
         self._validate_url(url)
+        max_val = kwargs.get("max_bytes", self._max_bytes)
+        max_bytes = int(max_val) if isinstance(max_val, (int, str)) else self._max_bytes
+
         try:
             async with httpx.AsyncClient(timeout=self._timeout, follow_redirects=True) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+                return [await self._fetch(client, url, max_bytes)]
         except httpx.HTTPError as e:
             raise CollectionError(source="url_fetcher", message=str(e)) from e
 
-        content_type = response.headers.get("content-type", "")
-        if "html" in content_type:
-            text = self._extract_text_from_html(response.text)
-        else:
-            text = response.text
+    async def collect_many(self, urls: list[str], **kwargs: object) -> list[URLFetchResult]:
+        """複数のURLを1つのクライアントで並行に取得する。
 
-        title = self._extract_title(response.text) if "html" in content_type else url
+        すべてのURLを通信前に検証し、不正なURLはエラーの結果とする。1件の失敗で
+        全体を中断せず、URLごとに結果またはエラーを返す。
 
-        return [
-            CollectedData(
-                source="url_fetcher",
-                title=title,
-                url=url,
-                content=text,
-                collected_at=datetime.now(UTC),
+        Args:
+            urls: 取得対象のURLのリスト
+            **kwargs:
+                max_bytes: 1ページあたりに読み込む最大バイト数（デフォルト: コンストラクタの指定値）
+                concurrency: 全体で同時に取得するURL数（デフォルト: 8）
+                per_host: 同一ホストに同時に送るリクエスト数（デフォルト: 2）
+
+        Returns:
+            URLごとの取得結果のリスト（入力順）
+        """
+        max_val = kwargs.get("max_bytes", self._max_bytes)
+        max_bytes = int(max_val) if isinstance(max_val, (int, str)) else self._max_bytes
+        conc_val = kwargs.get("concurrency", DEFAULT_CONCURRENCY)
+        concurrency = int(conc_val) if isinstance(conc_val, (int, str)) else DEFAULT_CONCURRENCY
+        host_val = kwargs.get("per_host", DEFAULT_PER_HOST_CONCURRENCY)
+        per_host = (
+            int(host_val) if isinstance(host_val, (int, str)) else DEFAULT_PER_HOST_CONCURRENCY
+        )
+
+        errors: dict[int, CollectionError] = {}
+        for index, url in enumerate(urls):
+            try:
+                self._validate_url(url)
+            except CollectionError as e:
+                errors[index] = e
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        host_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max(1, per_host))
+        )
+
+        async def fetch_one(client: httpx.AsyncClient, url: str) -> URLFetchResult:
+            host = (urlparse(url).hostname or "").lower()
+            # 同一ホストの待ちで全体の枠を占有しないよう、ホストごとの枠を先に確保する
+            async with host_semaphores[host], semaphore:
+                try:
+                    return URLFetchResult(url=url, data=await self._fetch(client, url, max_bytes))
+                except httpx.HTTPError as e:
+                    error = CollectionError(source="url_fetcher", message=f"{url}: {e}")
+                except CollectionError as e:
+                    error = e
+            return URLFetchResult(url=url, error=error)
+
+        async with httpx.AsyncClient(
+            timeout=self._timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max(1, concurrency)),
+        ) as client:
+            fetched = await asyncio.gather(
+                *(fetch_one(client, url) for index, url in enumerate(urls) if index not in errors)
             )
+        valid = iter(fetched)
+        return [
+            URLFetchResult(url=url, error=errors[index]) if index in errors else next(valid)
+            for index, url in enumerate(urls)
         ]
 
+    async def _fetch(self, client: httpx.AsyncClient, url: str, max_bytes: int) -> CollectedData:
+        """検証済みのURLを取得する。キャッシュが有効なら通信を省略・条件付きにする。
+
+        Raises:
+            httpx.HTTPError: 通信に失敗した場合
+        """
+        key = cache_key(httpx.Request("GET", url))
+        cached = self._cached_page(key, max_bytes)
+        if cached is not None and cached.is_fresh():
+            return self._from_cache(url, cached)
+
+        async with client.stream(
+            "GET", url, headers=cached.conditional_headers() if cached else None
+        ) as response:
+            if response.status_code == 304 and cached is not None and self._cache:
+                refreshed = self._cache.refresh(key, response.headers) or cached
+                return self._from_cache(url, refreshed)
+            response.raise_for_status()
+            is_html = "html" in response.headers.get("content-type", "")
+            # HTMLは受信したチャンクから逐次テキストを抽出する
+            extractor: HTMLTextExtractor | MainContentExtractor | None = None
+            if is_html:
+                extractor = MainContentExtractor() if self._main_content else HTMLTextExtractor()
+            body = await read_capped(
+                response, max_bytes, on_text=extractor.feed if extractor else None
+            )
+
+        if extractor is not None:
+            extractor.close()
+            text = extractor.text
+            title = extractor.title or "Untitled"
+        else:
+            text = body.text
+            title = url
+
+        if self._cache is not None and is_storable(response.status_code, response.headers):
+            extracted = {
+                "title": title,
+                "content": text,
+                "truncated": body.truncated,
+                "main_content": self._main_content,
+            }
+            self._cache.put(
+                key,
+                url,
+                response.status_code,
+                response.headers,
+                body.content,
+                extracted=json.dumps(extracted, ensure_ascii=False),
+            )
+
+        return CollectedData(
+            source="url_fetcher",
+            title=title,
+            url=url,
+            content=text,
+            collected_at=datetime.now(UTC),
+            truncated=body.truncated,
+        )
+
+    def _cached_page(self, key: str, max_bytes: int) -> CachedResponse | None:
+        """同じ読み込み上限・抽出方式で取得した場合と同じ内容を返せるキャッシュを取得する。"""
+        if self._cache is None:
+            return None
+        cached = self._cache.get(key)
+        if cached is None or cached.extracted is None:
+            return None
+        extracted = json.loads(cached.extracted)
+        if extracted.get("main_content") != self._main_content:
+            return None
+        truncated = bool(extracted.get("truncated"))
+        size = len(cached.body)
+        if (truncated and size != max_bytes) or (not truncated and size > max_bytes):
+            return None
+        return cached
+
+    @staticmethod
+    def _from_cache(url: str, cached: CachedResponse) -> CollectedData:
+        """キャッシュに保存した抽出結果からCollectedDataを復元する。"""
+        extracted = json.loads(cached.extracted or "{}")
+        return CollectedData(
+            source="url_fetcher",
+            title=str(extracted.get("title", url)),
+            url=url,
+            content=str(extracted.get("content", "")),
+            collected_at=datetime.now(UTC),
+            truncated=bool(extracted.get("truncated")),
+        )
+
     @staticmethod
     def _extract_text_from_html(html: str) -> str:
         """HTMLからテキストを抽出する。"""
-        # scriptとstyleタグを除去
-        cleaned = re.sub(r"<(script|style)[^>]*>[\s\S]*?</\1>", "", html, flags=re.IGNORECASE)
-        # HTMLタグを除去
-        cleaned = re.sub(r"<[^>]+>", " ", cleaned)
-        # 連続する空白を整理
-        cleaned = re.sub(r"\s+", " ", cleaned)
-        return cleaned.strip()
+        return extract_html(html).text
 
     @staticmethod
     def _extract_title(html: str) -> str:
         """HTMLからtitleタグの内容を抽出する。"""
-        match = re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        return "Untitled"
+        return extract_html(html).title or "Untitled"
@@ -3,6 +3,7 @@
 from datetime import UTC, datetime
 from pathlib import Path
 
+from src.collectors.dedup import deduplicate
 from src.errors import DraftSaveError
 from src.models.blog_post import BlogPost, CollectedData, ContentType
 from src.models.template import ContentTemplate
@@ -41,16 +42,19 @@ class BlogPostGenerator:
         topic: str | None = None,
         source_url: str | None = None,
         collected_data: list[CollectedData] | None = None,
+        dedup: bool = True,
     ) -> str:
         """記事生成用のプロンプトコンテキストを構築する。
 
         スキル層（Claude LLM）が記事本文を生成するための情報を整理する。
+        複数ソースから届いた同じ記事は、URLとタイトル・本文の類似度で1件にまとめる。
 
         Args:
             template: コンテンツテンプレート
             topic: トピック
             source_url: 参照URL
             collected_data: 収集データ
+            dedup: 重複・類似する収集データをまとめるか
 
         Returns:
             プロンプトコンテキスト文字列
@@ -74,11 +78,15 @@ class BlogPostGenerator:
             parts.append(f"## 参照URL\n{source_url}\n")
         if collected_data:
             parts.append("## 収集データ")
+            if dedup:
+                collected_data = deduplicate(collected_data)
             for data in collected_data:
                 parts.append(f"### [{data.source}] {data.title}")
                 if data.url:
                     parts.append(f"URL: {data.url}")
                 parts.append(data.content[:2000])
+                if data.truncated or len(data.content) > 2000:
+                    parts.append("（以下省略）")
                 parts.append("")
 
         return "\n".join(parts)
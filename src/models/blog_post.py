@@ -55,6 +55,7 @@ class CollectedData(BaseModel):
     content: str
     collected_at: datetime
     published_date: str | None = None
+    truncated: bool = False
 
 
 class PublishResult(BaseModel):
@@ -0,0 +1,42 @@
+"""高速JSONデコードユーティリティ。
+
+orjsonがインストールされている場合はorjsonでデコードし、ない場合は標準ライブラリの
+jsonにフォールバックする。どちらの場合もデコードエラーはValueErrorのサブクラスになる。
+"""
+
+import importlib
+import importlib.util
+import json
+from types import ModuleType
+from typing import Any
+
+import httpx
+
+_orjson: ModuleType | None = (
+    importlib.import_module("orjson") if importlib.util.find_spec("orjson") is not None else None
+)
+
+
+def loads(data: bytes | str) -> Any:
+    """JSONをデコードする。
+
+    Args:
+        data: JSON文字列またはUTF-8のバイト列
+
+    Returns:
+        デコードされたオブジェクト
+
+    Raises:
+        ValueError: JSONとして不正な場合
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response: httpx.Response) -> Any:
+    """レスポンスボディをJSONとしてデコードする。``response.json()`` の高速版。
+
+    文字列への変換を挟まず、バイト列を直接デコードする。
+    """
+    return loads(response.content)
@@ -0,0 +1,351 @@
+"""HTTPレスポンスのディスクキャッシュ（RFC 9111の鮮度判定と条件付きリクエスト）。
+
+Cache-Controlのmax-age・Expiresで示された期間内は通信せずにキャッシュを返し、
+期限切れ後はETag/Last-Modifiedによる条件付きリクエストで再検証する。
+ヒューリスティックな鮮度（Last-Modifiedからの推定）は用いない。
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import httpx
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    extracted TEXT
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+# キャッシュの既定の最大サイズ（バイト）
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+# CachingTransportを通さずに送るリクエストに付ける拡張のキー
+BYPASS_CACHE = "bypass_http_cache"
+# ボディは展開済みで保存するため、転送・エンコーディングに関するヘッダーは保存しない
+_EXCLUDED_HEADERS = frozenset(
+    {
+        "content-encoding",
+        "content-length",
+        "transfer-encoding",
+        "connection",
+        "keep-alive",
+        "set-cookie",
+    }
+)
+
+
+def cache_directives(headers: Mapping[str, str]) -> dict[str, str | None]:
+    """Cache-Controlヘッダーをディレクティブ名（小文字）と値の辞書に変換する。"""
+    directives: dict[str, str | None] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, sep, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if sep else None
+    return directives
+
+
+def _http_date(value: str | None) -> float | None:
+    """HTTP日付をUNIX時間に変換する。解釈できない場合はNone。"""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: Mapping[str, str]) -> float:
+    """応答が鮮度を保つ秒数を返す。
+
+    max-ageを優先し、なければExpiresとDateの差を用いる。no-cacheの場合や
+    明示的な有効期限がない場合は0（毎回再検証）。
+    """
+    directives = cache_directives(headers)
+    if "no-cache" in directives:
+        return 0.0
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            return max(float(int(max_age)), 0.0)
+        except ValueError:
+            return 0.0
+    expires = _http_date(headers.get("expires"))
+    if expires is None:
+        return 0.0
+    date = _http_date(headers.get("date")) or time.time()
+    return max(expires - date, 0.0)
+
+
+def is_storable(status_code: int, headers: Mapping[str, str]) -> bool:
+    """応答をキャッシュに保存できるか判定する。
+
+    200応答のうち、no-store・``Vary: *`` でなく、検証子（ETag/Last-Modified）か
+    明示的な有効期限を持つものを保存する。
+    """
+    if status_code != 200:
+        return False
+    if "no-store" in cache_directives(headers) or headers.get("vary", "").strip() == "*":
+        return False
+    has_validator = "etag" in headers or "last-modified" in headers
+    return has_validator or freshness_lifetime(headers) > 0
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """キャッシュされたレスポンス。
+
+    Attributes:
+        url: リクエストURL
+        status_code: HTTPステータス
+        headers: レスポンスヘッダー（小文字のキー）
+        body: 展開済みのレスポンスボディ
+        stored_at: 保存・再検証した時刻（UNIX時間）
+        extracted: ボディから抽出した内容（利用側が任意の形式で保存する）
+    """
+
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+    extracted: str | None = None
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    def age(self, now: float | None = None) -> float:
+        """応答の経過秒数（Ageヘッダーと保存後の経過時間の和）を返す。"""
+        try:
+            initial = float(int(self.headers.get("age", "0")))
+        except ValueError:
+            initial = 0.0
+        return initial + max((now or time.time()) - self.stored_at, 0.0)
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """再検証せずに使える期間内か判定する。"""
+        return self.age(now) < freshness_lifetime(self.headers)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """再検証用の条件付きリクエストヘッダーを返す。"""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """キャッシュからhttpx.Responseを復元する。"""
+        return httpx.Response(
+            self.status_code, headers=self.headers, content=self.body, request=request
+        )
+
+
+def cache_key(request: httpx.Request) -> str:
+    """リクエストのキャッシュキーを返す。
+
+    同じURLでも認証情報やAcceptで応答が変わるため、これらをキーに含める。
+    認証情報はハッシュ化し、トークン自体は保存しない。
+    """
+    authorization = request.headers.get("authorization", "")
+    identity = hashlib.sha256(authorization.encode("utf-8")).hexdigest() if authorization else ""
+    parts = [request.method, str(request.url), request.headers.get("accept", ""), identity]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _storable_headers(headers: httpx.Headers) -> dict[str, str]:
+    return {
+        key.lower(): value for key, value in headers.items() if key.lower() not in _EXCLUDED_HEADERS
+    }
+
+
+class HTTPCache:
+    """SQLiteに保存するHTTPレスポンスキャッシュ。
+
+    合計サイズがmax_bytesを超えると、最終アクセスの古いエントリから削除する（LRU）。
+
+    Args:
+        path: SQLiteファイルのパス（``:memory:`` でメモリ上）
+        max_bytes: ボディと抽出内容の合計サイズの上限（バイト）
+    """
+
+    def __init__(self, path: Path | str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "extracted" not in columns:
+            # 抽出内容の列がない旧形式のファイルを移行する
+            with self._conn:
+                self._conn.execute("ALTER TABLE responses ADD COLUMN extracted TEXT")
+        self._max_bytes = max_bytes
+
+    def close(self) -> None:
+        """DB接続をクローズする。"""
+        self._conn.close()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """キャッシュを取得し、最終アクセス時刻を更新する。"""
+        row = self._conn.execute(
+            "SELECT url, status_code, headers, body, stored_at, extracted "
+            "FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        with self._conn:
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return CachedResponse(
+            url=str(row[0]),
+            status_code=int(row[1]),
+            headers=json.loads(row[2]),
+            body=bytes(row[3]),
+            stored_at=float(row[4]),
+            extracted=row[5],
+        )
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        status_code: int,
+        headers: httpx.Headers,
+        body: bytes,
+        extracted: str | None = None,
+    ) -> None:
+        """レスポンスを保存し、上限を超えた分を削除する。"""
+        now = time.time()
+        size = len(body) + (len(extracted.encode("utf-8")) if extracted else 0)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status_code, headers, body, size, stored_at, accessed_at, extracted) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    status_code,
+                    json.dumps(_storable_headers(headers)),
+                    body,
+                    size,
+                    now,
+                    now,
+                    extracted,
+                ),
+            )
+        self._evict()
+
+    def refresh(self, key: str, headers: httpx.Headers) -> CachedResponse | None:
+        """304応答のヘッダーでキャッシュを更新し、更新後のエントリを返す。"""
+        cached = self.get(key)
+        if cached is None:
+            return None
+        merged = {**cached.headers, **_storable_headers(headers)}
+        with self._conn:
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, stored_at = ? WHERE key = ?",
+                (json.dumps(merged), time.time(), key),
+            )
+        return CachedResponse(
+            url=cached.url,
+            status_code=cached.status_code,
+            headers=merged,
+            body=cached.body,
+            stored_at=time.time(),
+            extracted=cached.extracted,
+        )
+
+    def total_size(self) -> int:
+        """保存されているボディと抽出内容の合計サイズを返す。"""
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return int(row[0])
+
+    def _evict(self) -> None:
+        """合計サイズがmax_bytes以下になるまで、最終アクセスの古い順に削除する。"""
+        excess = self.total_size() - self._max_bytes
+        if excess <= 0:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        victims: list[tuple[str]] = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+            victims.append((key,))
+            excess -= int(size)
+        with self._conn:
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """GETリクエストをキャッシュから返すトランスポート。
+
+    鮮度の期間内は通信せずにキャッシュを返し、期限切れ後は条件付きヘッダーを付与して
+    304応答ならキャッシュのボディを返す。保存の可否は ``is_storable`` に従う。
+    保存時はボディ全体を読み込むため、受信を途中で打ち切るリクエストは拡張
+    ``BYPASS_CACHE`` を付けてキャッシュを通さず、呼び出し側でキャッシュする。
+
+    Args:
+        cache: レスポンスキャッシュ
+        transport: 実際の通信を行うトランスポート（省略時はAsyncHTTPTransport）
+    """
+
+    def __init__(self, cache: HTTPCache, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self._cache = cache
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET" or request.extensions.get(BYPASS_CACHE):
+            return await self._transport.handle_async_request(request)
+
+        key = cache_key(request)
+        cached = self._cache.get(key)
+        if cached is not None:
+            if cached.is_fresh():
+                return cached.to_response(request)
+            request.headers.update(cached.conditional_headers())
+
+        response = await self._transport.handle_async_request(request)
+        if response.status_code == 304 and cached is not None:
+            await response.aclose()
+            refreshed = self._cache.refresh(key, response.headers) or cached
+            return refreshed.to_response(request)
+
+        if not is_storable(response.status_code, response.headers):
+            return response
+
+        body = await response.aread()
+        self._cache.put(key, str(request.url), response.status_code, response.headers, body)
+        return httpx.Response(
+            response.status_code,
+            headers=_storable_headers(response.headers),
+            content=body,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,37 @@
+"""非同期レート制限ユーティリティ。"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """トークンバケット方式の非同期レートリミッター。
+
+    複数のタスクから共有でき、待機中のタスクは到着順にトークンを取得する。
+
+    Args:
+        rate: 1秒あたりに補充するトークン数
+        capacity: バケットの最大トークン数（バースト許容量）
+    """
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rateは正の値である必要があります")
+        self._rate = rate
+        self._capacity = max(1, capacity)
+        self._tokens = float(self._capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """トークンを1つ取得する。トークンがない場合は補充されるまで待機する。"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
@@ -0,0 +1,63 @@
+"""HTTPリクエストのリトライ方針。"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+# 一時的な障害とみなすHTTPステータス（409はNotionの競合エラー）
+RETRYABLE_STATUS_CODES = frozenset({409, 429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """指数バックオフ（フルジッター）とRetry-Afterに基づくリトライ方針。
+
+    Attributes:
+        max_attempts: 初回を含む最大試行回数
+        base_delay: バックオフの基準待機時間（秒）
+        max_delay: バックオフの上限待機時間（秒）。Retry-Afterには適用しない
+        retryable_status_codes: リトライ対象のHTTPステータス
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    retryable_status_codes: frozenset[int] = field(default=RETRYABLE_STATUS_CODES)
+
+    def is_retryable(self, status_code: int) -> bool:
+        """ステータスコードがリトライ対象か判定する。"""
+        return status_code in self.retryable_status_codes
+
+    def compute_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """次の試行までの待機時間を計算する。
+
+        Args:
+            attempt: 失敗した試行の番号（0始まり）
+            retry_after: レスポンスのRetry-Afterヘッダー値（秒数またはHTTP日付）
+
+        Returns:
+            待機時間（秒）
+        """
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return server_delay
+        backoff = min(self.max_delay, self.base_delay * (2**attempt))
+        return random.uniform(0, backoff)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-Afterヘッダーを待機秒数に変換する。解釈できない場合はNone。"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
@@ -0,0 +1,75 @@
+"""上限付きのHTTPレスポンス読み込み。"""
+
+import codecs
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+
+# 既定の読み込み上限（バイト）
+DEFAULT_MAX_BYTES = 512 * 1024
+
+
+@dataclass(frozen=True)
+class CappedText:
+    """上限付きで読み込んだテキスト。
+
+    Attributes:
+        text: デコード済みのテキスト
+        truncated: 上限に達して以降を読み込まなかったか
+        content: 読み込んだボディのバイト列
+    """
+
+    text: str
+    truncated: bool
+    content: bytes = b""
+
+
+async def read_capped(
+    response: httpx.Response,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    on_text: Callable[[str], object] | None = None,
+) -> CappedText:
+    """ストリーミング中のレスポンスを最大max_bytesまで読み込み、テキストにデコードする。
+
+    上限に達した時点で以降のボディは受信しない。``client.stream()`` で取得した
+    レスポンスに対して使用する。
+
+    Args:
+        response: ストリーミング中のレスポンス
+        max_bytes: 読み込む最大バイト数（Content-Encoding展開後）
+        on_text: 指定時、デコードしたテキストを受信したチャンクごとに渡す
+
+    Returns:
+        デコードしたテキスト・切り詰めの有無・読み込んだバイト列
+    """
+    encoding = response.charset_encoding or "utf-8"
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    raw: list[bytes] = []
+    parts: list[str] = []
+
+    def emit(text: str) -> None:
+        if text:
+            parts.append(text)
+            if on_text is not None:
+                on_text(text)
+
+    total = 0
+    truncated = False
+    async for chunk in response.aiter_bytes():
+        if total + len(chunk) > max_bytes:
+            # 途中で切れたマルチバイト文字はデコーダー内に残り、出力されない
+            raw.append(chunk[: max_bytes - total])
+            emit(decoder.decode(raw[-1]))
+            truncated = True
+            break
+        raw.append(chunk)
+        emit(decoder.decode(chunk))
+        total += len(chunk)
+    if not truncated:
+        emit(decoder.decode(b"", final=True))
+    return CappedText(text="".join(parts), truncated=truncated, content=b"".join(raw))
@@ -0,0 +1,212 @@
+"""ArxivCollectorのテスト。"""
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from src.collectors.arxiv import ArxivCache, ArxivCollector, parse_arxiv_id, split_version
+from src.errors import CollectionError
+from src.utils.rate_limit import TokenBucket
+
+API_URL = "https://export.arxiv.org/api/query"
+
+
+def _entry(arxiv_id: str, title: str) -> str:
+    return f"""
+  <entry>
+    <id>http://arxiv.org/abs/{arxiv_id}</id>
+    <published>2024-01-22T18:59:59Z</published>
+    <title>{title}</title>
+    <summary>  We propose a new
+      method for testing.  </summary>
+    <author><name>Alice Example</name></author>
+    <author><name>Bob Example</name></author>
+    <arxiv:comment>10 pages</arxiv:comment>
+    <category term="cs.CL" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>"""
+
+
+def _feed(*entries: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">'
+        f"{''.join(entries)}\n</feed>"
+    )
+
+
+class TestParseArxivId:
+    """parse_arxiv_idのテスト。"""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2401.12345", "2401.12345"),
+            ("arXiv:2401.12345v2", "2401.12345v2"),
+            ("https://arxiv.org/abs/2401.12345", "2401.12345"),
+            ("https://arxiv.org/pdf/2401.12345v3.pdf", "2401.12345v3"),
+            ("https://arxiv.org/html/2401.12345v1/", "2401.12345v1"),
+            ("http://arxiv.org/abs/cs/0112017", "cs/0112017"),
+            ("https://arxiv.org/list/cs.CL/recent", None),
+            ("https://example.com/abs/2401.12345", None),
+            ("not an id", None),
+        ],
+    )
+    def test_parse(self, value: str, expected: str | None) -> None:
+        assert parse_arxiv_id(value) == expected
+
+
+def _fast_collector(cache: ArxivCache | None = None, api_url: str | None = None) -> ArxivCollector:
+    """リクエスト間隔の待機をほぼなくしたCollectorを生成する。"""
+    return ArxivCollector(
+        cache=cache, rate_limiter=TokenBucket(rate=1000, capacity=10), api_url=api_url
+    )
+
+
+class TestArxivCollector:
+    """ArxivCollectorのテスト。"""
+
+    async def test_collect_paper(self, respx_mock: object) -> None:
+        """Atomフィードから論文のメタデータを取得できる。"""
+        import respx as respx_lib
+
+        route = respx_lib.get(API_URL).mock(
+            return_value=httpx.Response(200, text=_feed(_entry("2401.12345v1", "Test Paper")))
+        )
+
+        results = await ArxivCollector().collect("https://arxiv.org/abs/2401.12345")
+
+        assert route.calls[0].request.url.params["id_list"] == "2401.12345"
+        assert len(results) == 1
+        assert results[0].source == "arxiv"
+        assert results[0].title == "Test Paper"
+        assert results[0].url == "https://arxiv.org/abs/2401.12345v1"
+        assert results[0].published_date == "2024-01-22"
+        assert "Authors: Alice Example, Bob Example" in results[0].content
+        assert "Categories: cs.CL, cs.LG" in results[0].content
+        assert "We propose a new method for testing." in results[0].content
+
+    async def test_error_entry_ignored(self, respx_mock: object) -> None:
+        """APIのエラーentryは結果に含めない。"""
+        import respx as respx_lib
+
+        respx_lib.get(API_URL).mock(
+            return_value=httpx.Response(
+                200, text=_feed(_entry("http://arxiv.org/api/errors#incorrect_id", "Error"))
+            )
+        )
+
+        assert await ArxivCollector().collect("2401.99999") == []
+
+    async def test_invalid_id_raises(self) -> None:
+        with pytest.raises(CollectionError):
+            await ArxivCollector().collect("https://example.com/paper")
+
+    async def test_http_error_raises(self, respx_mock: object) -> None:
+        import respx as respx_lib
+
+        respx_lib.get(API_URL).mock(return_value=httpx.Response(503))
+        with pytest.raises(CollectionError):
+            await ArxivCollector().collect("2401.12345")
+
+    async def test_collect_many_batches_id_list(self, respx_mock: object) -> None:
+        """キャッシュにないIDをbatch_size件ずつid_listで問い合わせ、入力順に返す。"""
+        import respx as respx_lib
+
+        entries = {
+            "2401.00001": _entry("2401.00001v2", "Paper One"),
+            "2401.00002": _entry("2401.00002v1", "Paper Two"),
+            "2401.00003": _entry("2401.00003v1", "Paper Three"),
+        }
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            ids = request.url.params["id_list"].split(",")
+            return httpx.Response(
+                200, text=_feed(*(entries[split_version(i)[0]] for i in ids if i in entries))
+            )
+
+        route = respx_lib.get(API_URL).mock(side_effect=respond)
+
+        results = await _fast_collector().collect_many(
+            ["2401.00003", "arXiv:2401.00001", "https://arxiv.org/abs/2401.00002", "9999.99999"],
+            batch_size=2,
+        )
+
+        assert [call.request.url.params["id_list"] for call in route.calls] == [
+            "2401.00003,2401.00001",
+            "2401.00002,9999.99999",
+        ]
+        assert route.calls[0].request.url.params["max_results"] == "2"
+        assert [result.title for result in results] == ["Paper Three", "Paper One", "Paper Two"]
+
+    async def test_cache_by_id_and_version(self, respx_mock: object) -> None:
+        """取得結果をIDとバージョンで保存し、再取得しない。"""
+        import respx as respx_lib
+
+        route = respx_lib.get(API_URL).mock(
+            return_value=httpx.Response(200, text=_feed(_entry("2401.12345v2", "Cached Paper")))
+        )
+        collector = _fast_collector(cache=ArxivCache(":memory:"))
+
+        await collector.collect("2401.12345")
+        latest = await collector.collect("2401.12345")
+        versioned = await collector.collect("2401.12345v2")
+
+        assert route.call_count == 1
+        assert latest[0].title == versioned[0].title == "Cached Paper"
+
+    async def test_stale_latest_version_refetched(self, respx_mock: object) -> None:
+        """バージョン指定のない取得は、期限を過ぎた最新版を使わない。"""
+        import respx as respx_lib
+
+        route = respx_lib.get(API_URL).mock(
+            return_value=httpx.Response(200, text=_feed(_entry("2401.12345v1", "Paper")))
+        )
+        collector = _fast_collector(cache=ArxivCache(":memory:", latest_ttl=0))
+
+        await collector.collect("2401.12345")
+        await collector.collect("2401.12345")
+        await collector.collect("2401.12345v1")
+
+        assert route.call_count == 2
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    """id_listに応じたAtomフィードを分割して返すスタブサーバー。"""
+
+    def do_GET(self) -> None:  # noqa: N802
+        ids = parse_qs(urlparse(self.path).query)["id_list"][0].split(",")
+        body = _feed(*(_entry(f"{i}v1", f"Paper {i}") for i in ids)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/atom+xml")
+        self.end_headers()
+        # 受信しながら解析できることを確かめるため、小さなチャンクで送る
+        for start in range(0, len(body), 64):
+            self.wfile.write(body[start : start + 64])
+            self.wfile.flush()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def feed_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/query"
+    server.shutdown()
+    server.server_close()
+
+
+class TestArxivCollectorWithFeedServer:
+    """ローカルのスタブサーバーに対するArxivCollectorのテスト。"""
+
+    async def test_streamed_feed_parsed(self, feed_server: str) -> None:
+        collector = _fast_collector(api_url=feed_server)
+        results = await collector.collect_many(["2401.00001", "2401.00002"])
+        assert [result.title for result in results] == ["Paper 2401.00001", "Paper 2401.00002"]
@@ -0,0 +1,195 @@
+"""ArxivFullTextCollectorのテスト。"""
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.collectors.arxiv import ArxivCache
+from src.collectors.arxiv_fulltext import (
+    ArxivFullTextCollector,
+    PaperDocument,
+    allocate_budget,
+    classify_heading,
+    split_sections,
+)
+from src.errors import CollectionError
+from src.generators.blog_post import BlogPostGenerator
+from src.utils.rate_limit import TokenBucket
+
+HTML_URL = "https://arxiv.org/html/"
+
+PAPER_HTML = """<!DOCTYPE html><html><head><title>Tiny Model: A Paper</title></head><body>
+<article class="ltx_document">
+<h1 class="ltx_title ltx_title_document">Tiny Model: A Small Language Model</h1>
+<div class="ltx_abstract"><h6 class="ltx_title ltx_title_abstract">Abstract</h6>
+<p class="ltx_p">We present Tiny Model, a compact language model.</p></div>
+<section class="ltx_section" id="S1">
+<h2 class="ltx_title ltx_title_section"><span class="ltx_tag">1 </span>Introduction</h2>
+<p>Large models are expensive.</p></section>
+<section class="ltx_section" id="S2">
+<h2 class="ltx_title ltx_title_section"><span class="ltx_tag">2 </span>Tiny Model</h2>
+<p>We minimize the loss <math alttext="\\mathcal{L}=\\sum_{i}x_{i}"><mi>L</mi><mo>=</mo></math>
+over the pretraining corpus.</p>
+<section class="ltx_subsection"><h3>2.1 Architecture</h3><p>A 22-layer transformer.</p></section>
+</section>
+<section class="ltx_section" id="S3">
+<h2 class="ltx_title ltx_title_section"><span class="ltx_tag">3 </span>Experiments</h2>
+<table><tr><td>Model</td><td>Accuracy</td></tr><tr><td>Tiny</td><td>61.2</td></tr></table>
+<h3>3.1 Ablation</h3><p>Removing the loss term hurts accuracy.</p></section>
+<section class="ltx_section" id="S4">
+<h2 class="ltx_title ltx_title_section"><span class="ltx_tag">4 </span>Conclusion</h2>
+<p>Small models are useful.</p></section>
+<section class="ltx_bibliography"><h2>References</h2><p>[1] Someone. A paper.</p></section>
+</article></body></html>
+"""
+
+
+def _collector(cache: ArxivCache | None = None) -> ArxivFullTextCollector:
+    return ArxivFullTextCollector(cache=cache, rate_limiter=TokenBucket(rate=1000, capacity=10))
+
+
+class TestSplitSections:
+    """split_sectionsのテスト。"""
+
+    def test_splits_by_heading_offsets(self) -> None:
+        body = PAPER_HTML.encode("utf-8")
+        title, sections = split_sections(body)
+
+        assert title == "Tiny Model: A Small Language Model"
+        assert [(section.kind, section.title) for section in sections] == [
+            ("abstract", "Abstract"),
+            ("introduction", "Introduction"),
+            ("method", "Tiny Model"),
+            ("experiments", "Experiments"),
+            ("conclusion", "Conclusion"),
+        ]
+        for section, following in zip(sections, sections[1:], strict=False):
+            assert section.end == following.start
+        method = sections[2]
+        assert body[method.start : method.end].startswith(b"<h2")
+        assert b"Architecture" in body[method.start : method.end]
+
+    def test_extracts_section_text(self) -> None:
+        _, sections = split_sections(PAPER_HTML.encode("utf-8"))
+        texts = {section.kind: section.text for section in sections}
+
+        assert texts["abstract"] == "We present Tiny Model, a compact language model."
+        assert "$\\mathcal{L}=\\sum_{i}x_{i}$" in texts["method"]
+        assert "2.1 Architecture A 22-layer transformer." in texts["method"]
+        assert "Tiny 61.2" in texts["experiments"]
+        assert "Ablation" in texts["experiments"]
+        assert "Someone" not in " ".join(texts.values())
+
+    @pytest.mark.parametrize(
+        ("heading", "kind"),
+        [
+            ("Related Work", "related_work"),
+            ("Experimental Setup", "experiments"),
+            ("Limitations", "conclusion"),
+            ("Our Approach", "method"),
+            ("Acknowledgements", "references"),
+            ("Scaling Laws", "other"),
+        ],
+    )
+    def test_classify_heading(self, heading: str, kind: str) -> None:
+        assert classify_heading(heading) == kind
+
+
+class TestAllocateBudget:
+    """allocate_budgetのテスト。"""
+
+    def test_short_sections_leave_budget_to_long_ones(self) -> None:
+        assert allocate_budget([100, 5000, 5000], 3000) == [100, 1450, 1450]
+
+    def test_all_fit(self) -> None:
+        assert allocate_budget([10, 20], 100) == [10, 20]
+
+
+class TestArxivFullTextCollector:
+    """ArxivFullTextCollectorのテスト。"""
+
+    async def test_collect_template_sections(self, respx_mock: object) -> None:
+        """テンプレートに必要な章のみを文書順に返す。"""
+        import respx as respx_lib
+
+        respx_lib.get(f"{HTML_URL}2401.12345").mock(
+            return_value=httpx.Response(200, text=PAPER_HTML)
+        )
+
+        results = await _collector().collect("2401.12345", content_type="cv")
+
+        assert len(results) == 1
+        assert results[0].source == "arxiv_fulltext"
+        assert results[0].title == "Tiny Model: A Small Language Model"
+        headings = [line for line in results[0].content.splitlines() if line.startswith("## ")]
+        assert headings == ["## Abstract", "## Tiny Model", "## Experiments"]
+        assert results[0].truncated is False
+
+    async def test_collect_within_char_budget(self, respx_mock: object) -> None:
+        import respx as respx_lib
+
+        respx_lib.get(f"{HTML_URL}2401.12345").mock(
+            return_value=httpx.Response(200, text=PAPER_HTML)
+        )
+
+        results = await _collector().collect(
+            "2401.12345", sections="method,experiments", char_budget=60
+        )
+
+        body = [line for line in results[0].content.splitlines() if not line.startswith("## ")]
+        assert sum(len(line) for line in body) <= 60
+        assert results[0].truncated is True
+
+    async def test_sections_survive_prompt_dedup(
+        self, respx_mock: object, tmp_project_dir: Path
+    ) -> None:
+        """取得した章はプロンプト構築時の重複除去でまとめられず、すべて残る。"""
+        import respx as respx_lib
+
+        respx_lib.get(f"{HTML_URL}2401.12345").mock(
+            return_value=httpx.Response(200, text=PAPER_HTML)
+        )
+
+        results = await _collector().collect("2401.12345", sections="abstract,method,conclusion")
+        generator = BlogPostGenerator(base_dir=tmp_project_dir)
+        context = generator.build_prompt_context(
+            generator.get_template("weekly-ai-news"), collected_data=results
+        )
+
+        for text in ("compact language model", "22-layer transformer", "Small models are useful"):
+            assert text in context
+
+    async def test_cached_document_not_refetched(self, respx_mock: object) -> None:
+        """分割済みの論文をバージョンごとに保存し、再取得しない。"""
+        import respx as respx_lib
+
+        respx_lib.get(f"{HTML_URL}2401.12345").mock(
+            return_value=httpx.Response(301, headers={"Location": f"{HTML_URL}2401.12345v2"})
+        )
+        route = respx_lib.get(f"{HTML_URL}2401.12345v2").mock(
+            return_value=httpx.Response(200, text=PAPER_HTML)
+        )
+        cache = ArxivCache(":memory:")
+        collector = _collector(cache)
+
+        document = await collector.fetch_document("https://arxiv.org/abs/2401.12345")
+        await collector.collect("2401.12345")
+        await collector.collect("2401.12345v2", sections="conclusion")
+
+        assert document.arxiv_id == "2401.12345v2"
+        assert route.call_count == 1
+        stored = cache.get("2401.12345v2", kind="fulltext")
+        assert stored is not None
+        assert PaperDocument.from_json(stored) == document
+
+    async def test_invalid_id_raises(self) -> None:
+        with pytest.raises(CollectionError):
+            await _collector().collect("https://example.com/paper")
+
+    async def test_http_error_raises(self, respx_mock: object) -> None:
+        import respx as respx_lib
+
+        respx_lib.get(f"{HTML_URL}2401.12345").mock(return_value=httpx.Response(404))
+        with pytest.raises(CollectionError):
+            await _collector().collect("2401.12345")
@@ -0,0 +1,189 @@
+"""dedupのテスト。"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.collectors.dedup import (
+    canonicalize_url,
+    cluster_duplicates,
+    deduplicate,
+    jaccard,
+    minhash_signature,
+    shingles,
+)
+from src.models.blog_post import CollectedData
+
+
+def _item(
+    title: str, content: str = "", url: str | None = None, source: str = "test"
+) -> CollectedData:
+    """テスト用のCollectedDataを生成する。"""
+    return CollectedData(
+        source=source,
+        title=title,
+        url=url,
+        content=content,
+        collected_at=datetime.now(UTC),
+    )
+
+
+class TestCanonicalizeUrl:
+    """canonicalize_urlのテスト。"""
+
+    def test_strips_tracking_params_and_fragment(self) -> None:
+        url = "https://Example.com/news/123/?utm_source=x&id=5&fbclid=abc#top"
+        assert canonicalize_url(url) == "https://example.com/news/123?id=5"
+
+    def test_trailing_slash_and_default_port(self) -> None:
+        assert canonicalize_url("https://example.com:443/a/") == canonicalize_url(
+            "https://example.com/a"
+        )
+
+    def test_query_order_normalized(self) -> None:
+        assert canonicalize_url("https://example.com/?b=2&a=1") == "https://example.com?a=1&b=2"
+
+    def test_unwraps_google_redirect(self) -> None:
+        url = (
+            "https://www.google.com/url?rct=j&sa=t"
+            "&url=https://example.com/article%3Futm_medium%3Demail&ct=ga"
+        )
+        assert canonicalize_url(url) == "https://example.com/article"
+
+    def test_non_http_returned_as_is(self) -> None:
+        assert canonicalize_url(" not a url ") == "not a url"
+
+
+class TestMinHash:
+    """シングル・MinHashのテスト。"""
+
+    def test_shingles_normalize_width_and_case(self) -> None:
+        assert shingles("ＧＰＴ-5") == shingles("gpt 5")
+
+    def test_identical_sets_have_identical_signature(self) -> None:
+        a = shingles("Transformerの新しいアーキテクチャ")
+        assert minhash_signature(a) == minhash_signature(set(a))
+
+    def test_empty_set_has_empty_signature(self) -> None:
+        assert minhash_signature(set()) == ()
+
+    def test_jaccard(self) -> None:
+        assert jaccard({"a", "b"}, {"b", "c"}) == 1 / 3
+        assert jaccard(set(), {"a"}) == 0.0
+
+
+class TestDeduplicate:
+    """deduplicate / cluster_duplicatesのテスト。"""
+
+    def test_same_canonical_url_merged(self) -> None:
+        items = [
+            _item("記事A", url="https://example.com/a?utm_source=alert"),
+            _item("全く別のタイトル", url="https://example.com/a/"),
+        ]
+        assert cluster_duplicates(items) == [[0, 1]]
+
+    def test_near_duplicate_titles_merged(self) -> None:
+        items = [
+            _item("Google releases Gemini 3 with improved reasoning and multimodal capabilities"),
+            _item("Anthropic、Claudeの新機能を公開 エージェント性能を強化"),
+            _item(
+                "Google releases Gemini 3, with improved reasoning and multimodal capabilities"
+                " - The Verge"
+            ),
+        ]
+        assert cluster_duplicates(items) == [[0, 2], [1]]
+
+    def test_near_duplicate_content_merged(self) -> None:
+        summary = "大規模言語モデルの推論コストを半分にする新しい量子化手法が提案された。"
+        items = [
+            _item("量子化で推論コストを半減する新手法", content=summary, source="notion_news"),
+            _item(
+                "推論コストを半減する量子化の新手法が登場",
+                content=summary + "\nAuthor: Jane",
+                source="notion_medium",
+            ),
+        ]
+        assert cluster_duplicates(items) == [[0, 1]]
+
+    def test_similar_content_with_distinct_titles_kept(self) -> None:
+        summary = "大規模言語モデルの推論コストを半分にする新しい量子化手法が提案された。"
+        items = [
+            _item("ニュースA", content=summary),
+            _item("Medium記事B", content=summary),
+        ]
+        assert cluster_duplicates(items) == [[0], [1]]
+
+    def test_identical_metadata_lines_not_treated_as_body(self) -> None:
+        boilerplate = "Source: TechCrunch\nTags: AI, LLM, Startup"
+        items = [
+            _item("OpenAI、新モデルGPT-5を発表", content=boilerplate, source="notion_news"),
+            _item("Anthropic、Claude 5をリリース", content=boilerplate, source="notion_news"),
+            _item("Mistral、資金調達を完了", content=boilerplate, source="notion_news"),
+        ]
+        assert cluster_duplicates(items) == [[0], [1], [2]]
+
+    @pytest.mark.parametrize(
+        ("title_a", "title_b"),
+        [
+            ("openai/whisper", "openai/whisper.cpp"),
+            ("langchain-ai/langchain", "langchain-ai/langchainjs"),
+            ("meta-llama/llama", "meta-llama/llama3"),
+            ("OpenAI releases GPT-4.1", "OpenAI releases GPT-4.5"),
+            ("Attention Is All You Need", "Attention Is Not All You Need"),
+        ],
+    )
+    def test_similar_titles_with_different_urls_kept(self, title_a: str, title_b: str) -> None:
+        items = [
+            _item(title_a, content="First project body text.", url="https://example.com/a"),
+            _item(title_b, content="Another unrelated description.", url="https://example.com/b"),
+        ]
+        assert cluster_duplicates(items) == [[0], [1]]
+
+    def test_placeholder_titles_not_compared(self) -> None:
+        items = [
+            _item("Untitled", content="Source: TechCrunch"),
+            _item("Untitled", content="Source: The Verge"),
+        ]
+        assert cluster_duplicates(items) == [[0], [1]]
+
+    def test_abstract_and_full_text_of_same_paper_kept(self) -> None:
+        abstract = " ".join(f"abstract{i}" for i in range(150))
+        method = " ".join(f"method{i}" for i in range(800))
+        items = [
+            _item(
+                "Tiny Model: A Small Language Model",
+                content=f"# Tiny Model\n\nAuthors: Jane Doe\n\n## Abstract\n{abstract}",
+                url="https://arxiv.org/abs/2401.12345v1",
+                source="arxiv",
+            ),
+            _item(
+                "Tiny Model: A Small Language Model",
+                content=f"## Abstract\n{abstract}\n\n## Method\n{method}",
+                url="https://arxiv.org/html/2401.12345v1",
+                source="arxiv_fulltext",
+            ),
+        ]
+        assert len(deduplicate(items)) == 2
+
+    def test_similar_titles_and_bodies_with_different_urls_merged(self) -> None:
+        body = "大規模言語モデルの推論コストを半分にする新しい量子化手法が提案された。"
+        items = [
+            _item("量子化で推論コストを半減", content=body, url="https://news.example.com/1"),
+            _item("量子化で推論コストを半減", content=body, url="https://blog.example.com/2"),
+        ]
+        assert cluster_duplicates(items) == [[0, 1]]
+
+    def test_different_items_kept(self) -> None:
+        items = [
+            _item("OpenAI、新モデルGPT-5を発表", content="推論性能が向上"),
+            _item("OpenAI、新モデルGPT-4oを発表", content="音声対応を強化"),
+        ]
+        assert len(deduplicate(items)) == 2
+
+    def test_keeps_longest_content_in_first_position(self) -> None:
+        items = [
+            _item("短い", content="a", url="https://example.com/x"),
+            _item("別記事", content="unrelated text body", url="https://example.com/y"),
+            _item("長い", content="a much longer body", url="https://example.com/x/"),
+        ]
+        assert [item.title for item in deduplicate(items)] == ["長い", "別記事"]
@@ -1,6 +1,7 @@
 """GitHubCollectorのテスト。"""
 
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 import pytest
@@ -207,3 +208,463 @@ class TestGitHubCollector:
         collector = GitHubCollector(token="test-token")
         with pytest.raises(CollectionError):
             await collector.collect("invalid/repo")
+
+    async def test_readme_and_commits_fetched_concurrently(self, respx_mock: object) -> None:
+        """README・コミットはリポジトリ情報の応答を待たずに取得される。"""
+        import asyncio
+
+        import respx as respx_lib
+
+        started: set[str] = set()
+        both_started = asyncio.Event()
+
+        def record(name: str) -> None:
+            started.add(name)
+            if {"readme", "commits"} <= started:
+                both_started.set()
+
+        async def repo_response(request: httpx.Request) -> httpx.Response:
+            await asyncio.wait_for(both_started.wait(), timeout=1.0)
+            return httpx.Response(200, json={"full_name": "owner/repo", "default_branch": "dev"})
+
+        def readme_response(request: httpx.Request) -> httpx.Response:
+            record("readme")
+            return httpx.Response(200, text="README content")
+
+        def commits_response(request: httpx.Request) -> httpx.Response:
+            record("commits")
+            return httpx.Response(200, json=[{"commit": {"message": "Initial commit"}}])
+
+        respx_lib.get("https://api.github.com/repos/owner/repo").mock(side_effect=repo_response)
+        respx_lib.get("https://api.github.com/repos/owner/repo/readme").mock(
+            side_effect=readme_response
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/commits").mock(
+            side_effect=commits_response
+        )
+        tree_route = respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/dev").mock(
+            return_value=httpx.Response(200, json={"tree": [{"path": "src", "type": "tree"}]})
+        )
+
+        collector = GitHubCollector(token="test-token")
+        results = await collector.collect("owner/repo")
+
+        assert tree_route.call_count == 1
+        assert "README content" in results[0].content
+        assert "Initial commit" in results[0].content
+        assert "src/" in results[0].content
+
+    async def test_optional_parts_transport_error_tolerated(self, respx_mock: object) -> None:
+        """README・コミットの通信エラーは無視してリポジトリ情報を返す。"""
+        import respx as respx_lib
+
+        respx_lib.get("https://api.github.com/repos/owner/repo").mock(
+            return_value=httpx.Response(
+                200, json={"full_name": "owner/repo", "default_branch": "main"}
+            )
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/readme").mock(
+            side_effect=httpx.ConnectError("connection reset")
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/commits").mock(
+            side_effect=httpx.ReadTimeout("timeout")
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/main").mock(
+            return_value=httpx.Response(200, json={"tree": []})
+        )
+
+        collector = GitHubCollector(token="test-token")
+        results = await collector.collect("owner/repo")
+
+        assert results[0].title == "owner/repo"
+        assert "README" not in results[0].content
+        assert "Recent Commits" not in results[0].content
+
+    async def test_cache_revalidates_with_etag(self, respx_mock: object) -> None:
+        """キャッシュ指定時、2回目は条件付きリクエストで304をキャッシュから補う。"""
+        import respx as respx_lib
+
+        from src.utils.http_cache import HTTPCache
+
+        repo_route = respx_lib.get("https://api.github.com/repos/owner/repo")
+        repo_route.side_effect = [
+            httpx.Response(
+                200,
+                json={"full_name": "owner/repo", "stargazers_count": 7, "default_branch": "main"},
+                headers={"ETag": '"repo-v1"'},
+            ),
+            httpx.Response(304, headers={"ETag": '"repo-v1"'}),
+        ]
+        respx_lib.get("https://api.github.com/repos/owner/repo/readme").mock(
+            return_value=httpx.Response(404)
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/commits").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/main").mock(
+            return_value=httpx.Response(200, json={"tree": []})
+        )
+
+        collector = GitHubCollector(token="test-token", cache=HTTPCache(":memory:"))
+        await collector.collect("owner/repo")
+        results = await collector.collect("owner/repo")
+
+        assert repo_route.calls[1].request.headers["if-none-match"] == '"repo-v1"'
+        assert "Stars: 7" in results[0].content
+
+    async def test_long_readme_is_truncated(self, respx_mock: object) -> None:
+        """長いREADMEは最大文字数で切り詰め、truncatedを立てる。"""
+        import respx as respx_lib
+
+        from src.collectors.github import README_MAX_CHARS
+
+        respx_lib.get("https://api.github.com/repos/owner/repo").mock(
+            return_value=httpx.Response(
+                200, json={"full_name": "owner/repo", "default_branch": "main"}
+            )
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/readme").mock(
+            return_value=httpx.Response(200, text="a" * (README_MAX_CHARS * 10))
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/commits").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/main").mock(
+            return_value=httpx.Response(200, json={"tree": []})
+        )
+
+        collector = GitHubCollector(token="test-token")
+        results = await collector.collect("owner/repo")
+
+        assert "a" * README_MAX_CHARS in results[0].content
+        assert "a" * (README_MAX_CHARS + 1) not in results[0].content
+        assert results[0].truncated is True
+
+    async def test_cached_readme_download_stops_at_cap(self, respx_mock: object) -> None:
+        """キャッシュ指定時もREADMEは上限で受信を打ち切り、打ち切った内容で再検証する。"""
+        import respx as respx_lib
+
+        from src.collectors.github import README_MAX_BYTES, README_MAX_CHARS
+        from src.utils.http_cache import HTTPCache
+
+        sent_chunks = 0
+
+        async def readme_body() -> AsyncIterator[bytes]:
+            nonlocal sent_chunks
+            for _ in range(100):
+                sent_chunks += 1
+                yield b"a" * 1000
+
+        respx_lib.get("https://api.github.com/repos/owner/repo").mock(
+            return_value=httpx.Response(
+                200, json={"full_name": "owner/repo", "default_branch": "main"}
+            )
+        )
+        readme_route = respx_lib.get("https://api.github.com/repos/owner/repo/readme")
+        readme_route.side_effect = [
+            httpx.Response(200, content=readme_body(), headers={"ETag": '"readme-v1"'}),
+            httpx.Response(304, headers={"ETag": '"readme-v1"'}),
+        ]
+        respx_lib.get("https://api.github.com/repos/owner/repo/commits").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/main").mock(
+            return_value=httpx.Response(200, json={"tree": []})
+        )
+
+        collector = GitHubCollector(token="test-token", cache=HTTPCache(":memory:"))
+        first = await collector.collect("owner/repo")
+        second = await collector.collect("owner/repo")
+
+        assert sent_chunks <= README_MAX_BYTES // 1000 + 1
+        assert readme_route.calls[1].request.headers["if-none-match"] == '"readme-v1"'
+        for results in (first, second):
+            assert "a" * README_MAX_CHARS in results[0].content
+            assert results[0].truncated is True
+
+
+def _graphql_repo(name: str, readme: str | None = "# README") -> dict:
+    """GraphQLのrepositoryノードを生成する。"""
+    return {
+        "nameWithOwner": name,
+        "description": f"{name} description",
+        "url": f"https://github.com/{name}",
+        "stargazerCount": 42,
+        "forkCount": 3,
+        "primaryLanguage": {"name": "Python"},
+        "defaultBranchRef": {
+            "name": "main",
+            "target": {"history": {"nodes": [{"messageHeadline": "Initial commit"}]}},
+        },
+        "readmeMd": {"text": readme} if readme else None,
+        "readmeLowerMd": None,
+        "readmeRst": None,
+        "readmePlain": None,
+        "tree": {
+            "entries": [{"name": "src", "type": "tree"}, {"name": "setup.py", "type": "blob"}]
+        },
+    }
+
+
+class TestGitHubCollectorCollectMany:
+    """collect_manyのテスト。"""
+
+    async def test_graphql_single_query(self, respx_mock: object) -> None:
+        """トークンがある場合、1回のGraphQLクエリで複数リポジトリを取得する。"""
+        import json
+
+        import respx as respx_lib
+
+        route = respx_lib.post("https://api.github.com/graphql").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "r0": _graphql_repo("owner/a"),
+                        "r1": None,
+                        "r2": _graphql_repo("owner/c", readme=None),
+                        "rateLimit": {"cost": 1, "remaining": 4999},
+                    },
+                    "errors": [{"type": "NOT_FOUND", "path": ["r1"], "message": "not found"}],
+                },
+            )
+        )
+
+        collector = GitHubCollector(token="test-token")
+        results = await collector.collect_many(["owner/a", "owner/missing", "owner/c/"])
+
+        assert [r.title for r in results] == ["owner/a", "owner/c"]
+        assert "Stars: 42 | Forks: 3 | Language: Python" in results[0].content
+        assert "## README\n# README" in results[0].content
+        assert "src/\nsetup.py" in results[0].content
+        assert "- Initial commit" in results[0].content
+        assert "README" not in results[1].content
+        assert route.call_count == 1
+        variables = json.loads(route.calls[0].request.content)["variables"]
+        assert variables["owner2"] == "owner"
+        assert variables["name2"] == "c"
+
+    async def test_graphql_batches_by_node_budget(self, respx_mock: object) -> None:
+        """ノード数の予算を超える場合はクエリを分割する。"""
+        import json
+
+        import respx as respx_lib
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            variables = json.loads(request.content)["variables"]
+            count = len(variables) // 2
+            data = {
+                f"r{i}": _graphql_repo(f"{variables[f'owner{i}']}/{variables[f'name{i}']}")
+                for i in range(count)
+            }
+            return httpx.Response(200, json={"data": data})
+
+        route = respx_lib.post("https://api.github.com/graphql").mock(side_effect=respond)
+
+        collector = GitHubCollector(token="test-token")
+        repos = [f"owner/repo{i}" for i in range(5)]
+        results = await collector.collect_many(repos, node_budget=24)
+
+        assert [r.title for r in results] == repos
+        assert route.call_count == 3
+
+    async def test_graphql_tree_respects_max_entries(self, respx_mock: object) -> None:
+        """ディレクトリ構造はcollectと同じtree_max_entriesで切り詰める。"""
+        import respx as respx_lib
+
+        respx_lib.post("https://api.github.com/graphql").mock(
+            return_value=httpx.Response(200, json={"data": {"r0": _graphql_repo("owner/a")}})
+        )
+
+        collector = GitHubCollector(token="test-token")
+        results = await collector.collect_many(["owner/a"], tree_max_entries=1)
+
+        assert "```\nsrc/\n```" in results[0].content
+        assert "setup.py" not in results[0].content
+
+    async def test_graphql_error_raises(self, respx_mock: object) -> None:
+        """クエリ全体のエラーはCollectionErrorになる。"""
+        import respx as respx_lib
+
+        respx_lib.post("https://api.github.com/graphql").mock(
+            return_value=httpx.Response(200, json={"errors": [{"message": "Bad credentials"}]})
+        )
+
+        collector = GitHubCollector(token="test-token")
+        with pytest.raises(CollectionError, match="Bad credentials"):
+            await collector.collect_many(["owner/a"])
+
+    async def test_rest_fallback_without_token(
+        self, respx_mock: object, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """トークン未設定時はREST APIで収集し、失敗したリポジトリは除く。"""
+        import respx as respx_lib
+
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setattr("src.collectors.github.load_dotenv", lambda: None)
+        respx_lib.get("https://api.github.com/repos/owner/a").mock(
+            return_value=httpx.Response(
+                200, json={"full_name": "owner/a", "default_branch": "main"}
+            )
+        )
+        respx_lib.get("https://api.github.com/repos/owner/a/readme").mock(
+            return_value=httpx.Response(404)
+        )
+        respx_lib.get("https://api.github.com/repos/owner/a/commits").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        respx_lib.get("https://api.github.com/repos/owner/a/git/trees/main").mock(
+            return_value=httpx.Response(200, json={"tree": []})
+        )
+        respx_lib.get("https://api.github.com/repos/owner/missing").mock(
+            return_value=httpx.Response(404)
+        )
+        respx_lib.get(url__regex=r"https://api.github.com/repos/owner/missing/.*").mock(
+            return_value=httpx.Response(404)
+        )
+        graphql = respx_lib.post("https://api.github.com/graphql")
+
+        collector = GitHubCollector(token="")
+        results = await collector.collect_many(["owner/a", "owner/missing"])
+
+        assert [r.title for r in results] == ["owner/a"]
+        assert graphql.call_count == 0
+
+
+class TestGitHubCollectorBoundedTree:
+    """段階取得モードのディレクトリ構造のテスト。"""
+
+    @staticmethod
+    def _mock_repo() -> None:
+        import respx as respx_lib
+
+        respx_lib.get("https://api.github.com/repos/owner/repo").mock(
+            return_value=httpx.Response(
+                200, json={"full_name": "owner/repo", "default_branch": "main"}
+            )
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/readme").mock(
+            return_value=httpx.Response(404)
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/commits").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+    async def test_walks_levels_up_to_depth(self, respx_mock: object) -> None:
+        """指定の深さまで階層ごとに取得し、大きなディレクトリは件数で要約する。"""
+        import respx as respx_lib
+
+        self._mock_repo()
+        root = respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/main").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "tree": [
+                        {"path": "README.md", "type": "blob", "sha": "r"},
+                        {"path": "src", "type": "tree", "sha": "src-sha"},
+                        {"path": "vendor", "type": "tree", "sha": "vendor-sha"},
+                    ]
+                },
+            )
+        )
+        respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/src-sha").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "tree": [
+                        {"path": "main.py", "type": "blob", "sha": "m"},
+                        {"path": "pkg", "type": "tree", "sha": "pkg-sha"},
+                    ]
+                },
+            )
+        )
+        vendor_entries = [{"path": f"f{i}.js", "type": "blob", "sha": str(i)} for i in range(60)]
+        vendor_entries.append({"path": "lib", "type": "tree", "sha": "lib"})
+        respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/vendor-sha").mock(
+            return_value=httpx.Response(200, json={"tree": vendor_entries})
+        )
+        pkg = respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/pkg-sha")
+
+        collector = GitHubCollector(token="test-token")
+        results = await collector.collect("owner/repo", tree_depth=2)
+
+        assert "recursive" not in root.calls[0].request.url.params
+        assert pkg.call_count == 0
+        assert (
+            "```\nREADME.md\nsrc/\nsrc/main.py\nsrc/pkg/\nvendor/ (60 files, 1 dirs)\n```"
+            in results[0].content
+        )
+
+    async def test_stops_at_entry_budget(self, respx_mock: object) -> None:
+        """エントリ数の上限に達したら以降のディレクトリは取得しない。"""
+        import respx as respx_lib
+
+        self._mock_repo()
+        respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/main").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "tree": [
+                        {"path": "a", "type": "tree", "sha": "a-sha"},
+                        {"path": "b.py", "type": "blob", "sha": "b"},
+                        {"path": "c.py", "type": "blob", "sha": "c"},
+                    ]
+                },
+            )
+        )
+        child = respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/a-sha")
+
+        collector = GitHubCollector(token="test-token")
+        results = await collector.collect("owner/repo", tree_depth=3, tree_max_entries=2)
+
+        assert child.call_count == 0
+        assert "```\na/\nb.py\n```" in results[0].content
+
+    @pytest.mark.parametrize(
+        ("top_dirs", "max_entries", "child_files", "child_calls"),
+        [(30, 40, 2, 6), (40, 200, 50, 4)],
+    )
+    async def test_fetches_directories_in_small_batches(
+        self,
+        respx_mock: object,
+        top_dirs: int,
+        max_entries: int,
+        child_files: int,
+        child_calls: int,
+    ) -> None:
+        """ディレクトリは少数ずつ取得し、上限に達したら残りは取得しない。"""
+        import respx as respx_lib
+
+        self._mock_repo()
+        root = respx_lib.get("https://api.github.com/repos/owner/repo/git/trees/main").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "tree": [
+                        {"path": f"d{i:02d}", "type": "tree", "sha": f"d{i:02d}-sha"}
+                        for i in range(top_dirs)
+                    ]
+                },
+            )
+        )
+        children = respx_lib.get(
+            url__regex=r"https://api.github.com/repos/owner/repo/git/trees/d\d+-sha"
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "tree": [
+                        {"path": f"f{i}.py", "type": "blob", "sha": str(i)}
+                        for i in range(child_files)
+                    ]
+                },
+            )
+        )
+
+        collector = GitHubCollector(token="test-token")
+        results = await collector.collect("owner/repo", tree_depth=2, tree_max_entries=max_entries)
+
+        assert root.call_count == 1
+        assert children.call_count == child_calls
+        tree = results[0].content.split("```\n")[1].split("\n```")[0]
+        assert len(tree.splitlines()) == max_entries
@@ -0,0 +1,131 @@
+"""html_textのテスト。"""
+
+from src.collectors.html_text import (
+    HTMLTextExtractor,
+    MainContentExtractor,
+    extract_html,
+    extract_main_content,
+)
+
+
+class TestHTMLTextExtractor:
+    """HTMLTextExtractorのテスト。"""
+
+    def test_extracts_text_and_title(self) -> None:
+        result = extract_html(
+            "<html><head><title> My  Page </title></head>"
+            "<body><h1>Heading</h1><p>Hello <b>World</b></p></body></html>"
+        )
+        assert result.title == "My Page"
+        assert "Heading Hello World" in result.text
+
+    def test_skips_script_style_nav_footer(self) -> None:
+        result = extract_html(
+            "<body><nav><a href='/'>Home</a></nav>"
+            "<script>if (a < b) { alert('</p>'); }</script>"
+            "<style>p { color: red; }</style>"
+            "<p>Article</p><footer>Copyright</footer></body>"
+        )
+        assert result.text == "Article"
+
+    def test_decodes_character_references(self) -> None:
+        assert extract_html("<p>A &amp; B &lt;C&gt;</p>").text == "A & B <C>"
+
+    def test_missing_title(self) -> None:
+        assert extract_html("<p>No title</p>").title is None
+
+    def test_feed_in_chunks(self) -> None:
+        html = "<title>Split</title><script>var x = '<p>';</script><p>Body text</p>"
+        extractor = HTMLTextExtractor()
+        for i in range(0, len(html), 3):
+            extractor.feed(html[i : i + 3])
+        extractor.close()
+        assert extractor.title == "Split"
+        assert "Body text" in extractor.text
+        assert "var x" not in extractor.text
+
+
+PAGE = """
+<html><head><title>新しいモデル | Tech News</title></head><body>
+<header><div class="logo">Tech News</div>
+<nav><a href="/">Home</a><a href="/ai">AI</a></nav></header>
+<div id="cookie-banner">We use cookies to improve your experience.
+<a href="/privacy">Privacy</a></div>
+<div class="sidebar"><ul>
+<li><a href="/a">Popular article number one about many things</a></li>
+<li><a href="/b">Popular article number two about other things</a></li>
+</ul></div>
+<article class="post">
+<h1>新しいモデルが発表されました</h1>
+<p>本日、研究チームは新しい大規模言語モデルを発表しました。このモデルは、推論性能、
+コード生成、多言語対応の各分野で大幅な改善を示しています。</p>
+<h2>主な特徴</h2>
+<p>新モデルは、従来のモデルと比較して、長い文脈の処理能力が向上し、
+より正確な回答を生成できるようになりました。また、推論コストも削減されています。</p>
+<ul><li>コンテキスト長が2倍に拡大</li><li>推論速度が30%向上</li></ul>
+<div class="related"><h3>関連記事</h3><ul>
+<li><a href="/x">前モデルのベンチマーク結果を詳しく解説する記事</a></li>
+</ul></div>
+</article>
+<footer>Copyright 2026 Tech News. All rights reserved.</footer>
+</body></html>
+"""
+
+
+class TestMainContentExtractor:
+    """MainContentExtractorのテスト。"""
+
+    def test_selects_article_block(self) -> None:
+        result = extract_main_content(PAGE)
+        assert result.title == "新しいモデル | Tech News"
+        assert result.text.startswith("# 新しいモデルが発表されました\n\n本日、研究チームは")
+        assert "## 主な特徴" in result.text
+        assert "- コンテキスト長が2倍に拡大\n- 推論速度が30%向上" in result.text
+        for boilerplate in ("Home", "cookies", "Popular article", "関連記事", "Copyright"):
+            assert boilerplate not in result.text
+
+    def test_smaller_than_full_text(self) -> None:
+        assert len(extract_main_content(PAGE).text) < len(extract_html(PAGE).text) * 0.8
+
+    def test_falls_back_to_all_paragraphs(self) -> None:
+        html = "<body><nav>Menu</nav><h1>Title</h1><p>Short</p><footer>x</footer></body>"
+        assert extract_main_content(html).text == "# Title\n\nShort"
+
+    def test_page_wrapped_in_form(self) -> None:
+        html = (
+            "<body><form id='aspnetForm' action='/post'><input type='hidden' name='v'>"
+            "<div class='content'><h1>Title</h1>"
+            "<p>First paragraph, with enough words to count here.</p>"
+            "<p>Second paragraph, also long enough to be scored.</p></div>"
+            "<button>Submit</button></form></body>"
+        )
+        assert extract_main_content(html).text == (
+            "# Title\n\nFirst paragraph, with enough words to count here.\n\n"
+            "Second paragraph, also long enough to be scored."
+        )
+
+    def test_falls_back_when_selected_block_is_empty(self) -> None:
+        html = (
+            "<body><div class='post'><div class='share'>"
+            "<p>Share this story, with friends, on every network.</p></div></div>"
+            "<h1>Title</h1></body>"
+        )
+        assert extract_main_content(html).text == "# Title"
+
+    def test_unclosed_paragraphs_and_void_tags(self) -> None:
+        html = (
+            "<div class='content'><p>First paragraph, with enough words to count here."
+            "<p>Second paragraph<br>continues, with a line break in the middle.<img src=x>"
+            "</div>"
+        )
+        assert extract_main_content(html).text == (
+            "First paragraph, with enough words to count here.\n\n"
+            "Second paragraph continues, with a line break in the middle."
+        )
+
+    def test_feed_in_chunks(self) -> None:
+        extractor = MainContentExtractor()
+        for i in range(0, len(PAGE), 7):
+            extractor.feed(PAGE[i : i + 7])
+        extractor.close()
+        assert extractor.text == extract_main_content(PAGE).text
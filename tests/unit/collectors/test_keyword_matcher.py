@@ -0,0 +1,74 @@
+"""keyword_matcherのテスト。"""
+
+import pytest
+
+from src.collectors.keyword_matcher import (
+    And,
+    KeywordMatcher,
+    Not,
+    Or,
+    Term,
+    compile_query,
+    parse_query,
+)
+
+
+class TestParseQuery:
+    """parse_queryのテスト。"""
+
+    def test_words_form_phrase(self) -> None:
+        assert parse_query("machine learning") == Term("machine learning")
+
+    def test_precedence(self) -> None:
+        assert parse_query("LLM OR agent AND NOT robotics") == Or(
+            (Term("LLM"), And((Term("agent"), Not(Term("robotics")))))
+        )
+
+    def test_parentheses_and_quotes(self) -> None:
+        assert parse_query('("AND gate" OR NAND) circuit') == And(
+            (Or((Term("AND gate"), Term("NAND"))), Term("circuit"))
+        )
+
+    def test_lowercase_operators_are_words(self) -> None:
+        assert parse_query("research and development") == Term("research and development")
+
+    def test_empty_query(self) -> None:
+        assert parse_query("  ") is None
+
+    @pytest.mark.parametrize("query", ["(LLM", "LLM AND", "NOT", '"open', "LLM )"])
+    def test_invalid_query_raises(self, query: str) -> None:
+        with pytest.raises(ValueError):
+            parse_query(query)
+
+
+class TestKeywordMatcher:
+    """KeywordMatcherのテスト。"""
+
+    def test_match_returns_matching_topics(self) -> None:
+        matcher = KeywordMatcher(
+            {
+                "llm": "LLM OR 大規模言語モデル",
+                "agent": "agent AND NOT robotics",
+                "vision": "画像認識",
+            }
+        )
+        assert matcher.match("新しいLLM Agentのフレームワーク") == ["llm", "agent"]
+        assert matcher.match("Robotics agent の研究") == []
+
+    def test_overlapping_terms_all_found(self) -> None:
+        matcher = KeywordMatcher({"a": "LLM agent", "b": "LLM", "c": "agents"})
+        assert matcher.found_terms("multi llm agents") == {"llm agent", "llm", "agents"}
+        assert matcher.match("multi llm agents") == ["a", "b", "c"]
+
+    def test_empty_expression_matches_everything(self) -> None:
+        assert KeywordMatcher({"all": ""}).match("anything") == ["all"]
+
+    def test_required_terms(self) -> None:
+        matcher = KeywordMatcher({"a": "(LLM OR GPT) AND NOT ad", "b": "Gemini agent"})
+        assert matcher.required_terms() == ["GPT", "Gemini agent", "LLM"]
+
+    def test_required_terms_none_for_negation_only(self) -> None:
+        assert KeywordMatcher({"a": "LLM", "b": "NOT ad"}).required_terms() is None
+
+    def test_compile_query_cached(self) -> None:
+        assert compile_query("LLM AND agent") is compile_query("LLM AND agent")
@@ -0,0 +1,124 @@
+"""NotionAggregateCollectorのテスト。"""
+
+import pytest
+import respx
+from httpx import Response
+
+from src.collectors.notion_aggregate import NotionAggregateCollector
+from src.collectors.notion_news import NotionNewsCollector
+from src.collectors.notion_paper import NotionPaperCollector
+from src.errors import CollectionError
+from src.utils.rate_limit import TokenBucket
+
+NEWS_QUERY_URL = "https://api.notion.com/v1/databases/news-db/query"
+PAPER_QUERY_URL = "https://api.notion.com/v1/databases/paper-db/query"
+
+
+def _news_page(title: str) -> dict:
+    return {
+        "properties": {
+            "Title": {"title": [{"plain_text": title}]},
+            "Summary": {"rich_text": [{"plain_text": "概要"}]},
+            "Date": {"date": {"start": "2026-02-18"}},
+        }
+    }
+
+
+def _paper_page(title: str) -> dict:
+    return {
+        "properties": {
+            "タイトル": {"title": [{"plain_text": title}]},
+            "概要": {"rich_text": [{"plain_text": "概要"}]},
+        }
+    }
+
+
+def _response(pages: list[dict]) -> Response:
+    return Response(200, json={"results": pages, "has_more": False, "next_cursor": None})
+
+
+class TestNotionAggregateCollector:
+    """NotionAggregateCollectorのテスト。"""
+
+    @respx.mock
+    async def test_collect_merges_results_in_order(self) -> None:
+        """全Collectorの結果が登録順に連結される。"""
+        respx.post(NEWS_QUERY_URL).mock(return_value=_response([_news_page("ニュース")]))
+        respx.post(PAPER_QUERY_URL).mock(return_value=_response([_paper_page("論文")]))
+
+        aggregate = NotionAggregateCollector(
+            [
+                NotionNewsCollector(token="secret_test", news_db_id="news-db"),
+                NotionPaperCollector(token="secret_test", paper_db_id="paper-db"),
+            ]
+        )
+        async with aggregate:
+            results = await aggregate.collect("")
+
+        assert [(r.source, r.title) for r in results] == [
+            ("notion_news", "ニュース"),
+            ("notion_paper", "論文"),
+        ]
+
+    def test_rate_limiter_shared(self) -> None:
+        """全Collectorに同じレートリミッターが設定される。"""
+        limiter = TokenBucket(rate=3.0, capacity=3)
+        news = NotionNewsCollector(token="secret_test", news_db_id="news-db")
+        paper = NotionPaperCollector(token="secret_test", paper_db_id="paper-db")
+
+        NotionAggregateCollector([news, paper], rate_limiter=limiter)
+
+        assert news._rate_limiter is limiter
+        assert paper._rate_limiter is limiter
+
+    @respx.mock
+    async def test_error_propagates(self) -> None:
+        """いずれかのCollectorが失敗した場合CollectionErrorが発生する。"""
+        respx.post(NEWS_QUERY_URL).mock(return_value=_response([]))
+        respx.post(PAPER_QUERY_URL).mock(return_value=Response(400, text="error"))
+
+        aggregate = NotionAggregateCollector(
+            [
+                NotionNewsCollector(token="secret_test", news_db_id="news-db"),
+                NotionPaperCollector(token="secret_test", paper_db_id="paper-db"),
+            ]
+        )
+        with pytest.raises(CollectionError, match="400"):
+            await aggregate.collect("")
+        await aggregate.aclose()
+
+    async def test_from_env_skips_unconfigured(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """DB IDが未設定のCollectorはスキップされ、HTTPクライアントが共有される。"""
+        monkeypatch.setattr("src.collectors.notion_base.load_dotenv", lambda: None)
+        monkeypatch.setattr("src.collectors.notion_news.load_dotenv", lambda: None)
+        monkeypatch.setattr("src.collectors.notion_paper.load_dotenv", lambda: None)
+        monkeypatch.setattr("src.collectors.notion_medium.load_dotenv", lambda: None)
+        monkeypatch.setenv("NOTION_NEWS_DB_ID", "news-db")
+        monkeypatch.setenv("NOTION_PAPER_DB_ID", "")
+        monkeypatch.setenv("NOTION_MEDIUM_DB_ID", "medium-db")
+
+        aggregate = NotionAggregateCollector.from_env(token="secret_test")
+
+        sources = [c._SOURCE for c in aggregate._collectors]
+        assert sources == ["notion_news", "notion_medium"]
+        assert aggregate._collectors[0]._client is aggregate._collectors[1]._client
+        await aggregate.aclose()
+
+    def test_from_env_missing_token_creates_no_client(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """トークン未設定で生成に失敗した場合、HTTPクライアントを生成しない。"""
+        monkeypatch.setattr("src.collectors.notion_base.load_dotenv", lambda: None)
+        monkeypatch.setattr("src.collectors.notion_news.load_dotenv", lambda: None)
+        monkeypatch.delenv("NOTION_TOKEN", raising=False)
+        monkeypatch.setenv("NOTION_NEWS_DB_ID", "news-db")
+        created: list[object] = []
+        monkeypatch.setattr(
+            "src.collectors.notion_aggregate.create_notion_client",
+            lambda: created.append(object()),
+        )
+
+        with pytest.raises(CollectionError, match="NOTION_TOKEN"):
+            NotionAggregateCollector.from_env()
+
+        assert created == []
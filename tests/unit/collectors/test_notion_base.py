@@ -1,10 +1,37 @@
 """NotionBaseCollectorのテスト。"""
 
+from datetime import date
+
+import httpx
 import pytest
+import respx
 
-from src.collectors.notion_base import NotionBaseCollector
+from src.collectors.keyword_matcher import compile_query
+from src.collectors.notion_base import (
+    NotionBaseCollector,
+    create_notion_client,
+    split_date_range,
+)
+from src.collectors.notion_schema import NotionSchema, PropertySpec
 from src.errors import CollectionError
 
+NOTION_DB_URL = "https://api.notion.com/v1/databases/test-db"
+
+
+class _BookmarkCollector(NotionBaseCollector):
+    """スキーマ宣言のみで定義したテスト用Collector。"""
+
+    _SOURCE = "notion_bookmark"
+    _SCHEMA = NotionSchema(
+        PropertySpec("Name", "title", "title", searchable=True),
+        PropertySpec("Memo", "rich_text", "memo", searchable=True),
+        PropertySpec("Tags", "multi_select", "tags"),
+        PropertySpec("URL", "url", "url"),
+        PropertySpec("Date", "date", "published_date"),
+    )
+    _CONTENT_FIELDS = (("memo", None), ("tags", "Tags"))
+    _db_id = "test-db"
+
 
 class TestNotionBaseCollector:
     """NotionBaseCollectorのテスト。"""
@@ -110,3 +137,174 @@ class TestNotionBaseCollector:
         """selectがnullの場合、空文字が返る。"""
         props = {"Status": {"select": None}}
         assert NotionBaseCollector._extract_select(props, "Status") == ""
+
+    def test_build_terms_filter(self) -> None:
+        """語句がcontains条件のorフィルタに変換される。"""
+        filter_obj = NotionBaseCollector._build_terms_filter(
+            compile_query("LLM").required_terms(), (("Title", "title"), ("Summary", "rich_text"))
+        )
+        assert filter_obj == {
+            "or": [
+                {"property": "Title", "title": {"contains": "LLM"}},
+                {"property": "Summary", "rich_text": {"contains": "LLM"}},
+            ]
+        }
+
+    def test_build_terms_filter_expression(self) -> None:
+        """検索式は必要条件の語句のorに変換される。"""
+        filter_obj = NotionBaseCollector._build_terms_filter(
+            compile_query("(LLM OR GPT) AND NOT 広告").required_terms(), (("Title", "title"),)
+        )
+        assert filter_obj == {
+            "or": [
+                {"property": "Title", "title": {"contains": "GPT"}},
+                {"property": "Title", "title": {"contains": "LLM"}},
+            ]
+        }
+
+    def test_build_terms_filter_negation_only(self) -> None:
+        """NOTのみの検索式はサーバー側で絞り込まない。"""
+        terms = compile_query("NOT 広告").required_terms()
+        assert NotionBaseCollector._build_terms_filter(terms, (("Title", "title"),)) is None
+
+    def test_build_terms_filter_no_terms(self) -> None:
+        """語句がない場合はフィルタを生成しない。"""
+        assert NotionBaseCollector._build_terms_filter(None, (("Title", "title"),)) is None
+        assert NotionBaseCollector._build_terms_filter([], (("Title", "title"),)) is None
+
+    def test_combine_filters_flattens_and(self) -> None:
+        """and同士の結合は平坦化される。"""
+        date_filter = {
+            "and": [
+                {"property": "Date", "date": {"on_or_after": "2026-02-15"}},
+                {"property": "Date", "date": {"before": "2026-02-22"}},
+            ]
+        }
+        keyword_filter = {"property": "Title", "title": {"contains": "LLM"}}
+        combined = NotionBaseCollector._combine_filters(date_filter, keyword_filter, None)
+        assert combined == {"and": [*date_filter["and"], keyword_filter]}
+
+    def test_combine_filters_single(self) -> None:
+        """条件が1つの場合はそのまま返す。"""
+        date_filter = {"property": "Date", "date": {"on_or_after": "2026-02-15"}}
+        assert NotionBaseCollector._combine_filters(date_filter, None) == date_filter
+        assert NotionBaseCollector._combine_filters(None) is None
+
+
+class TestNotionBaseCollectorClient:
+    """共有HTTPクライアントのライフサイクルのテスト。"""
+
+    async def test_client_reused(self) -> None:
+        """同一インスタンス内でクライアントが再利用される。"""
+        collector = NotionBaseCollector(token="secret_test")
+        client = collector._get_client()
+        assert collector._get_client() is client
+        await collector.aclose()
+        assert client.is_closed
+
+    async def test_async_with_closes_owned_client(self) -> None:
+        """async withを抜けると自身が生成したクライアントがクローズされる。"""
+        async with NotionBaseCollector(token="secret_test") as collector:
+            client = collector._get_client()
+        assert client.is_closed
+
+    async def test_shared_client_not_closed(self) -> None:
+        """外部から渡したクライアントはaclose()でクローズされない。"""
+        shared = create_notion_client()
+        first = NotionBaseCollector(token="secret_test", client=shared)
+        second = NotionBaseCollector(token="secret_test", client=shared)
+        assert first._get_client() is second._get_client() is shared
+        await first.aclose()
+        assert not shared.is_closed
+        await shared.aclose()
+
+    def test_create_notion_client(self) -> None:
+        """keep-alive設定付きのクライアントが生成される。"""
+        client = create_notion_client(timeout=10.0)
+        assert isinstance(client, httpx.AsyncClient)
+        assert client.timeout.read == 10.0
+
+
+class TestNotionBaseCollectorSchema:
+    """スキーマ宣言による変換とプロパティ射影のテスト。"""
+
+    @respx.mock
+    async def test_declarative_collector(self) -> None:
+        """スキーマ宣言のみのCollectorでCollectedDataに変換できる。"""
+        page = {
+            "properties": {
+                "Name": {"title": [{"plain_text": "ブックマーク"}]},
+                "Memo": {"rich_text": [{"plain_text": "メモ本文"}]},
+                "Tags": {"multi_select": [{"name": "AI"}]},
+                "URL": {"url": "https://example.com"},
+                "Date": {"date": {"start": "2026-02-18"}},
+            }
+        }
+        respx.post(f"{NOTION_DB_URL}/query").mock(
+            return_value=httpx.Response(
+                200, json={"results": [page], "has_more": False, "next_cursor": None}
+            )
+        )
+
+        collector = _BookmarkCollector(token="secret_test")
+        results = await collector.collect("メモ")
+
+        assert len(results) == 1
+        assert results[0].source == "notion_bookmark"
+        assert results[0].title == "ブックマーク"
+        assert results[0].content == "メモ本文\nTags: AI"
+        assert results[0].url == "https://example.com"
+        assert results[0].published_date == "2026-02-18"
+
+    @respx.mock
+    async def test_filter_properties_projection(self) -> None:
+        """スキーマのプロパティIDがfilter_propertiesとして送信され、定義取得は1回のみ。"""
+        definition = respx.get(NOTION_DB_URL).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "properties": {
+                        "Name": {"id": "title"},
+                        "Memo": {"id": "a%3Bb"},
+                        "Tags": {"id": "tg"},
+                        "URL": {"id": "ur"},
+                        "Date": {"id": "dt"},
+                        "Unused": {"id": "zz"},
+                    }
+                },
+            )
+        )
+        query = respx.post(f"{NOTION_DB_URL}/query").mock(
+            return_value=httpx.Response(
+                200, json={"results": [], "has_more": False, "next_cursor": None}
+            )
+        )
+
+        collector = _BookmarkCollector(token="secret_test", project_properties=True)
+        await collector.collect("")
+        await collector.collect("")
+
+        assert definition.call_count == 1
+        assert query.call_count == 2
+        params = query.calls[0].request.url.params.get_list("filter_properties")
+        assert params == ["title", "a;b", "tg", "ur", "dt"]
+
+
+class TestSplitDateRange:
+    """split_date_rangeのテスト。"""
+
+    def test_splits_into_contiguous_windows(self) -> None:
+        windows = split_date_range(date(2026, 1, 1), date(2026, 1, 11), 3)
+        assert windows == [
+            (date(2026, 1, 1), date(2026, 1, 4)),
+            (date(2026, 1, 4), date(2026, 1, 7)),
+            (date(2026, 1, 7), date(2026, 1, 11)),
+        ]
+
+    def test_shards_capped_by_days(self) -> None:
+        windows = split_date_range(date(2026, 1, 1), date(2026, 1, 3), 10)
+        assert len(windows) == 2
+
+    def test_single_shard_returns_whole_range(self) -> None:
+        start, end = date(2026, 1, 1), date(2026, 2, 1)
+        assert split_date_range(start, end, 1) == [(start, end)]
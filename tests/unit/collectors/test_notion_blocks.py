@@ -0,0 +1,57 @@
+"""notion_blocksのテスト。"""
+
+from src.collectors.notion_blocks import blocks_to_markdown, rich_text_to_markdown, truncate_utf8
+
+
+def _block(block_type: str, text: str = "", **extra: object) -> dict:
+    """テスト用のブロックを生成する。"""
+    return {
+        "type": block_type,
+        block_type: {"rich_text": [{"plain_text": text}] if text else [], **extra},
+    }
+
+
+class TestRichTextToMarkdown:
+    """rich_text_to_markdownのテスト。"""
+
+    def test_link_and_code(self) -> None:
+        rich_text = [
+            {"plain_text": "論文", "href": "https://arxiv.org/abs/1234"},
+            {"plain_text": "と"},
+            {"plain_text": "torch", "annotations": {"code": True}},
+        ]
+        assert rich_text_to_markdown(rich_text) == "[論文](https://arxiv.org/abs/1234)と`torch`"
+
+
+class TestBlocksToMarkdown:
+    """blocks_to_markdownのテスト。"""
+
+    def test_headings_and_paragraphs(self) -> None:
+        blocks = [_block("heading_2", "手法"), _block("paragraph", "本文です")]
+        assert blocks_to_markdown(blocks) == "## 手法\n本文です"
+
+    def test_nested_list_indented(self) -> None:
+        parent = _block("bulleted_list_item", "親")
+        parent["children"] = [_block("bulleted_list_item", "子")]
+        assert blocks_to_markdown([parent]) == "- 親\n  - 子"
+
+    def test_code_block(self) -> None:
+        blocks = [_block("code", "print(1)\nprint(2)", language="python")]
+        assert blocks_to_markdown(blocks) == "```python\nprint(1)\nprint(2)\n```"
+
+    def test_to_do_and_divider(self) -> None:
+        blocks = [_block("to_do", "確認", checked=True), {"type": "divider", "divider": {}}]
+        assert blocks_to_markdown(blocks) == "- [x] 確認\n---"
+
+    def test_empty_block_skipped(self) -> None:
+        assert blocks_to_markdown([_block("paragraph"), _block("paragraph", "a")]) == "a"
+
+
+class TestTruncateUtf8:
+    """truncate_utf8のテスト。"""
+
+    def test_does_not_split_multibyte_character(self) -> None:
+        assert truncate_utf8("あいう", 7) == "あい"
+
+    def test_short_text_unchanged(self) -> None:
+        assert truncate_utf8("abc", 10) == "abc"
@@ -0,0 +1,136 @@
+"""NotionMirrorのテスト。"""
+
+import json
+from pathlib import Path
+
+import respx
+from httpx import Response
+
+from src.collectors.notion_mirror import NotionMirror, matches_filter
+from src.collectors.notion_news import NotionNewsCollector
+
+NOTION_DB_QUERY_URL = "https://api.notion.com/v1/databases/test-news-db-id/query"
+
+
+def _make_page(
+    page_id: str,
+    title: str = "ニュース",
+    date: str = "2026-02-18",
+    last_edited_time: str = "2026-02-18T10:00:00.000Z",
+) -> dict:
+    """テスト用のNotionページデータを生成する。"""
+    return {
+        "id": page_id,
+        "last_edited_time": last_edited_time,
+        "properties": {
+            "Title": {"title": [{"plain_text": title}]},
+            "Summary": {"rich_text": [{"plain_text": f"{title}の概要"}]},
+            "URL": {"url": f"https://example.com/{page_id}"},
+            "Date": {"date": {"start": date}},
+        },
+    }
+
+
+def _make_query_response(pages: list[dict]) -> dict:
+    return {"results": pages, "has_more": False, "next_cursor": None}
+
+
+class TestNotionMirror:
+    """NotionMirrorのテスト。"""
+
+    def test_upsert_updates_high_water_mark(self, tmp_path: Path) -> None:
+        """upsertで最大last_edited_timeがハイウォーターマークになる。"""
+        mirror = NotionMirror(tmp_path / "mirror.db")
+        assert mirror.high_water_mark("db") is None
+
+        mirror.upsert(
+            "db",
+            [
+                _make_page("p1", last_edited_time="2026-02-18T10:00:00.000Z"),
+                _make_page("p2", last_edited_time="2026-02-19T10:00:00.000Z"),
+            ],
+        )
+        assert mirror.high_water_mark("db") == "2026-02-19T10:00:00.000Z"
+
+    def test_upsert_replaces_existing_page(self, tmp_path: Path) -> None:
+        """同じページIDはupsertで上書きされる。"""
+        mirror = NotionMirror(tmp_path / "mirror.db")
+        mirror.upsert("db", [_make_page("p1", title="旧タイトル")])
+        mirror.upsert(
+            "db",
+            [_make_page("p1", title="新タイトル", last_edited_time="2026-02-20T00:00:00.000Z")],
+        )
+
+        pages = mirror.query("db")
+        assert len(pages) == 1
+        assert pages[0]["properties"]["Title"]["title"][0]["plain_text"] == "新タイトル"
+
+    def test_query_filters_and_sorts_locally(self, tmp_path: Path) -> None:
+        """date filterとsortsがローカルで評価される。"""
+        mirror = NotionMirror(tmp_path / "mirror.db")
+        mirror.upsert(
+            "db",
+            [
+                _make_page("old", date="2026-01-01"),
+                _make_page("mid", date="2026-02-16"),
+                _make_page("new", date="2026-02-20"),
+            ],
+        )
+
+        pages = mirror.query(
+            "db",
+            filter_obj={"property": "Date", "date": {"on_or_after": "2026-02-15"}},
+            sorts=[{"property": "Date", "direction": "descending"}],
+        )
+        assert [p["id"] for p in pages] == ["new", "mid"]
+
+    def test_matches_filter_compound(self) -> None:
+        """and/orとrich_text containsを評価できる。"""
+        page = _make_page("p1", title="LLMの進化", date="2026-02-18")
+        filter_obj = {
+            "and": [
+                {"property": "Date", "date": {"before": "2026-02-22"}},
+                {
+                    "or": [
+                        {"property": "Title", "title": {"contains": "llm"}},
+                        {"property": "Summary", "rich_text": {"contains": "robot"}},
+                    ]
+                },
+            ]
+        }
+        assert matches_filter(page, filter_obj)
+        assert not matches_filter(page, {"property": "Date", "date": {"after": "2026-02-18"}})
+
+
+class TestNotionMirrorSync:
+    """Collectorからのミラー同期のテスト。"""
+
+    @respx.mock
+    async def test_incremental_sync(self, tmp_path: Path) -> None:
+        """2回目以降はハイウォーターマーク以降の差分のみを要求する。"""
+        route = respx.post(NOTION_DB_QUERY_URL)
+        route.side_effect = [
+            Response(200, json=_make_query_response([_make_page("p1", title="初回")])),
+            Response(
+                200,
+                json=_make_query_response(
+                    [_make_page("p2", title="差分", last_edited_time="2026-02-19T00:00:00.000Z")]
+                ),
+            ),
+        ]
+
+        mirror = NotionMirror(tmp_path / "mirror.db")
+        collector = NotionNewsCollector(
+            token="secret_test", news_db_id="test-news-db-id", mirror=mirror
+        )
+        first = await collector.collect("", date_from="2026-02-01")
+        second = await collector.collect("", date_from="2026-02-01")
+
+        first_body = json.loads(respx.calls[0].request.content)
+        second_body = json.loads(respx.calls[1].request.content)
+        assert "filter" not in first_body
+        assert second_body["filter"]["last_edited_time"] == {
+            "on_or_after": "2026-02-18T10:00:00.000Z"
+        }
+        assert [r.title for r in first] == ["初回"]
+        assert sorted(r.title for r in second) == ["初回", "差分"]
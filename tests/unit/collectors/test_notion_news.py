@@ -1,11 +1,13 @@
 """NotionNewsCollectorのテスト。"""
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
 from src.collectors.notion_news import NotionNewsCollector
 from src.errors import CollectionError
+from src.utils.retry import RetryPolicy
 
 NOTION_DB_QUERY_URL = "https://api.notion.com/v1/databases/test-news-db-id/query"
 
@@ -245,3 +247,308 @@ class TestNotionNewsCollector:
         import json
         body = json.loads(request.content)
         assert body["sorts"] == [{"property": "Date", "direction": "descending"}]
+
+    @respx.mock
+    async def test_keyword_filter_sent_in_request(self) -> None:
+        """queryがサーバー側のcontainsフィルタとして送信される。"""
+        respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(200, json=_make_query_response([]))
+        )
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        await collector.collect("LLM", date_from="2026-02-15")
+
+        request = respx.calls[0].request
+        import json
+        body = json.loads(request.content)
+        date_filter, keyword_filter = body["filter"]["and"]
+        assert date_filter["date"]["on_or_after"] == "2026-02-15"
+        assert {"property": "Title", "title": {"contains": "LLM"}} in keyword_filter["or"]
+        assert {"property": "Snippet", "rich_text": {"contains": "LLM"}} in keyword_filter["or"]
+
+    @respx.mock
+    async def test_collect_stream_yields_before_next_page(self) -> None:
+        """collect_streamは次のカーソルページを待たずに結果を返す。"""
+        route = respx.post(NOTION_DB_QUERY_URL)
+        route.side_effect = [
+            Response(
+                200,
+                json=_make_query_response(
+                    [_make_page(title="ニュース1")], has_more=True, next_cursor="cursor1"
+                ),
+            ),
+            Response(200, json=_make_query_response([_make_page(title="ニュース2")])),
+        ]
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        stream = collector.collect_stream("")
+
+        first = await anext(stream)
+        assert first.title == "ニュース1"
+        assert route.call_count == 1
+
+        rest = [item async for item in stream]
+        assert [item.title for item in rest] == ["ニュース2"]
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_retry_keeps_fetched_pages(self) -> None:
+        """途中のページで429が返ってもリトライし、取得済みのページを保持する。"""
+        route = respx.post(NOTION_DB_QUERY_URL)
+        route.side_effect = [
+            Response(
+                200,
+                json=_make_query_response(
+                    [_make_page(title="ニュース1")], has_more=True, next_cursor="cursor1"
+                ),
+            ),
+            Response(429, headers={"Retry-After": "0"}, json={"message": "rate limited"}),
+            Response(502, text="Bad Gateway"),
+            Response(200, json=_make_query_response([_make_page(title="ニュース2")])),
+        ]
+
+        collector = NotionNewsCollector(
+            token="secret_test",
+            news_db_id="test-news-db-id",
+            retry_policy=RetryPolicy(base_delay=0.0),
+        )
+        results = await collector.collect("")
+
+        assert [r.title for r in results] == ["ニュース1", "ニュース2"]
+        assert route.call_count == 4
+        import json
+
+        retried_body = json.loads(respx.calls[3].request.content)
+        assert retried_body["start_cursor"] == "cursor1"
+
+    @respx.mock
+    async def test_retry_exhausted_raises(self) -> None:
+        """リトライ回数を使い切るとCollectionErrorが発生する。"""
+        route = respx.post(NOTION_DB_QUERY_URL).mock(return_value=Response(503, text="down"))
+
+        collector = NotionNewsCollector(
+            token="secret_test",
+            news_db_id="test-news-db-id",
+            retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0),
+        )
+        with pytest.raises(CollectionError, match="503"):
+            await collector.collect("")
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_non_retryable_error_not_retried(self) -> None:
+        """リトライ対象外のエラーは即座にCollectionErrorになる。"""
+        route = respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(400, json={"message": "validation_error"})
+        )
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        with pytest.raises(CollectionError, match="400"):
+            await collector.collect("")
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_transport_error_retried(self) -> None:
+        """通信エラーもリトライされる。"""
+        route = respx.post(NOTION_DB_QUERY_URL)
+        route.side_effect = [
+            httpx.ConnectError("connection reset"),
+            Response(200, json=_make_query_response([_make_page(title="ニュース1")])),
+        ]
+
+        collector = NotionNewsCollector(
+            token="secret_test",
+            news_db_id="test-news-db-id",
+            retry_policy=RetryPolicy(base_delay=0.0),
+        )
+        results = await collector.collect("")
+
+        assert [r.title for r in results] == ["ニュース1"]
+
+    @respx.mock
+    async def test_shards_split_date_range(self) -> None:
+        """shards指定時、重複のない日付区間ごとにクエリされる。"""
+        route = respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(200, json=_make_query_response([]))
+        )
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        await collector.collect("", date_from="2026-01-01", date_to="2026-01-31", shards=3)
+
+        import json
+        windows = []
+        for call in route.calls:
+            conditions = json.loads(call.request.content)["filter"]["and"]
+            windows.append(
+                (conditions[0]["date"]["on_or_after"], conditions[1]["date"]["before"])
+            )
+        assert sorted(windows) == [
+            ("2026-01-01", "2026-01-11"),
+            ("2026-01-11", "2026-01-21"),
+            ("2026-01-21", "2026-01-31"),
+        ]
+
+    @respx.mock
+    async def test_shards_merged_newest_first_without_duplicates(self) -> None:
+        """区間ごとの結果が日付の降順で連結され、重複ページは除かれる。"""
+        import json
+
+        def respond(request: httpx.Request) -> Response:
+            conditions = json.loads(request.content)["filter"]["and"]
+            start = conditions[0]["date"]["on_or_after"]
+            pages = {
+                "2026-01-01": [_make_page(title="古い", date="2026-01-05")],
+                "2026-01-11": [_make_page(title="中間", date="2026-01-15")],
+                "2026-01-21": [
+                    _make_page(title="新しい", date="2026-01-25"),
+                    _make_page(title="中間", date="2026-01-15"),
+                ],
+            }[start]
+            for page in pages:
+                page["id"] = page["properties"]["Title"]["title"][0]["plain_text"]
+            return Response(200, json=_make_query_response(pages))
+
+        respx.post(NOTION_DB_QUERY_URL).mock(side_effect=respond)
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        results = await collector.collect(
+            "", date_from="2026-01-01", date_to="2026-01-31", shards=3
+        )
+
+        assert [r.title for r in results] == ["新しい", "中間", "古い"]
+
+    @respx.mock
+    async def test_shards_without_date_to_leaves_latest_open(self) -> None:
+        """date_to未指定時、最新の区間は上限なしでクエリされる。"""
+        route = respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(200, json=_make_query_response([]))
+        )
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        await collector.collect("", days=30, shards=2)
+
+        import json
+        filters = [json.loads(call.request.content)["filter"] for call in route.calls]
+        assert len(filters) == 2
+        assert sum("and" not in f for f in filters) == 1
+
+    @respx.mock
+    async def test_max_items_stops_pagination(self) -> None:
+        """max_itemsに達した時点で以降のページを取得しない。"""
+        route = respx.post(NOTION_DB_QUERY_URL)
+        route.side_effect = [
+            Response(
+                200,
+                json=_make_query_response(
+                    [_make_page(title="ニュース1"), _make_page(title="ニュース2")],
+                    has_more=True,
+                    next_cursor="cursor1",
+                ),
+            ),
+            Response(200, json=_make_query_response([_make_page(title="ニュース3")])),
+        ]
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        results = await collector.collect("", max_items=2)
+
+        import json
+        body = json.loads(route.calls[0].request.content)
+        assert body["page_size"] == 2
+        assert [r.title for r in results] == ["ニュース1", "ニュース2"]
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_max_items_continues_until_enough_match(self) -> None:
+        """クライアント側で除外された分は次のページから補う。"""
+        route = respx.post(NOTION_DB_QUERY_URL)
+        route.side_effect = [
+            Response(
+                200,
+                json=_make_query_response(
+                    [_make_page(title="AI記事"), _make_page(title="その他", summary="無関係")],
+                    has_more=True,
+                    next_cursor="cursor1",
+                ),
+            ),
+            Response(200, json=_make_query_response([_make_page(title="AI記事2")])),
+        ]
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        results = await collector.collect("AI", max_items=2)
+
+        assert [r.title for r in results] == ["AI記事", "AI記事2"]
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_page_size_capped_at_api_maximum(self) -> None:
+        """page_sizeはAPIの上限100を超えない。"""
+        route = respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(200, json=_make_query_response([]))
+        )
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        await collector.collect("", max_items=500)
+
+        import json
+        assert json.loads(route.calls[0].request.content)["page_size"] == 100
+
+    @respx.mock
+    async def test_keyword_expression(self) -> None:
+        """AND/NOTを含む検索式がクライアント側で評価される。"""
+        respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(
+                200,
+                json=_make_query_response(
+                    [
+                        _make_page(title="LLMエージェント", summary="agent framework"),
+                        _make_page(title="LLMの広告", summary="agent 広告"),
+                        _make_page(title="LLM入門", summary="basics"),
+                    ]
+                ),
+            )
+        )
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        results = await collector.collect("LLM AND agent AND NOT 広告")
+
+        assert [r.title for r in results] == ["LLMエージェント"]
+
+    async def test_invalid_keyword_expression_raises(self) -> None:
+        """不正な検索式はCollectionErrorになる。"""
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        with pytest.raises(CollectionError, match="検索式"):
+            await collector.collect("(LLM")
+
+    @respx.mock
+    async def test_collect_topics_single_fetch(self) -> None:
+        """複数トピックを1回の取得で振り分ける。"""
+        route = respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(
+                200,
+                json=_make_query_response(
+                    [
+                        _make_page(title="GPT-5発表", summary="OpenAIのLLM"),
+                        _make_page(title="Gemini更新", summary="Googleのマルチモーダル"),
+                        _make_page(title="ロボット", summary="強化学習"),
+                    ]
+                ),
+            )
+        )
+
+        collector = NotionNewsCollector(token="secret_test", news_db_id="test-news-db-id")
+        buckets = await collector.collect_topics(
+            {"llm": "LLM OR Gemini", "openai": "OpenAI", "cv": "画像認識"}
+        )
+
+        assert [r.title for r in buckets["llm"]] == ["GPT-5発表", "Gemini更新"]
+        assert [r.title for r in buckets["openai"]] == ["GPT-5発表"]
+        assert buckets["cv"] == []
+        assert route.call_count == 1
+
+        import json
+        body = json.loads(route.calls[0].request.content)
+        terms = {
+            condition[next(key for key in condition if key != "property")]["contains"]
+            for condition in body["filter"]["and"][1]["or"]
+        }
+        assert terms == {"LLM", "Gemini", "OpenAI", "画像認識"}
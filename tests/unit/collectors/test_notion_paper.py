@@ -6,6 +6,7 @@ from httpx import Response
 
 from src.collectors.notion_paper import NotionPaperCollector
 from src.errors import CollectionError
+from src.utils.retry import RetryPolicy
 
 NOTION_DB_QUERY_URL = "https://api.notion.com/v1/databases/test-paper-db-id/query"
 
@@ -110,7 +111,11 @@ class TestNotionPaperCollector:
             return_value=Response(500, json={"message": "Internal Server Error"})
         )
 
-        collector = NotionPaperCollector(token="secret_test", paper_db_id="test-paper-db-id")
+        collector = NotionPaperCollector(
+            token="secret_test",
+            paper_db_id="test-paper-db-id",
+            retry_policy=RetryPolicy(base_delay=0.0),
+        )
         with pytest.raises(CollectionError, match="500"):
             await collector.collect("")
 
@@ -155,3 +160,122 @@ class TestNotionPaperCollector:
         results = await collector.collect("")
 
         assert results[0].url == "https://arxiv.org/abs/2401.12345"
+
+    @respx.mock
+    async def test_keyword_filter_sent_in_request(self) -> None:
+        """queryが公開日フィルタとand結合されて送信される。"""
+        respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(200, json=_make_query_response([]))
+        )
+
+        collector = NotionPaperCollector(token="secret_test", paper_db_id="test-paper-db-id")
+        await collector.collect("Transformer")
+
+        import json
+
+        body = json.loads(respx.calls[0].request.content)
+        date_filter, keyword_filter = body["filter"]["and"]
+        assert date_filter["property"] == "公開日"
+        assert [c["property"] for c in keyword_filter["or"]] == ["タイトル", "日本語訳", "概要"]
+
+    @respx.mock
+    async def test_fetch_body_appends_markdown_for_top_n(self) -> None:
+        """fetch_body指定時、先頭N件のみ本文をMarkdownでcontentに追加する。"""
+        pages = [_make_page(title="Paper A"), _make_page(title="Paper B")]
+        pages[0]["id"] = "page-a"
+        pages[1]["id"] = "page-b"
+        respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(200, json=_make_query_response(pages))
+        )
+        body_route = respx.get("https://api.notion.com/v1/blocks/page-a/children").mock(
+            return_value=Response(
+                200,
+                json=_make_query_response(
+                    [
+                        {
+                            "id": "block-1",
+                            "type": "heading_2",
+                            "has_children": False,
+                            "heading_2": {"rich_text": [{"plain_text": "メモ"}]},
+                        },
+                        {
+                            "id": "block-2",
+                            "type": "bulleted_list_item",
+                            "has_children": True,
+                            "bulleted_list_item": {"rich_text": [{"plain_text": "要点"}]},
+                        },
+                    ]
+                ),
+            )
+        )
+        child_route = respx.get("https://api.notion.com/v1/blocks/block-2/children").mock(
+            return_value=Response(
+                200,
+                json=_make_query_response(
+                    [
+                        {
+                            "id": "block-3",
+                            "type": "paragraph",
+                            "has_children": False,
+                            "paragraph": {"rich_text": [{"plain_text": "詳細"}]},
+                        }
+                    ]
+                ),
+            )
+        )
+
+        collector = NotionPaperCollector(token="secret_test", paper_db_id="test-paper-db-id")
+        results = await collector.collect("", fetch_body=1)
+
+        assert results[0].content == "Transformer architecture\n\n## メモ\n- 要点\n  詳細"
+        assert results[1].content == "Transformer architecture"
+        assert body_route.call_count == 1
+        assert child_route.call_count == 1
+
+    @respx.mock
+    async def test_fetch_body_respects_depth_and_byte_cap(self) -> None:
+        """本文は指定の深さまでしか再帰せず、バイト数上限で切り詰められる。"""
+        page = _make_page()
+        page["id"] = "page-a"
+        respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(200, json=_make_query_response([page]))
+        )
+        respx.get("https://api.notion.com/v1/blocks/page-a/children").mock(
+            return_value=Response(
+                200,
+                json=_make_query_response(
+                    [
+                        {
+                            "id": "block-1",
+                            "type": "paragraph",
+                            "has_children": True,
+                            "paragraph": {"rich_text": [{"plain_text": "あ" * 100}]},
+                        }
+                    ]
+                ),
+            )
+        )
+        child_route = respx.get("https://api.notion.com/v1/blocks/block-1/children")
+
+        collector = NotionPaperCollector(token="secret_test", paper_db_id="test-paper-db-id")
+        results = await collector.collect("", fetch_body=1, body_max_depth=1, body_max_bytes=30)
+
+        assert results[0].content == "Transformer architecture\n\n" + "あ" * 10
+        assert child_route.call_count == 0
+
+    @respx.mock
+    async def test_fetch_body_failure_keeps_item(self) -> None:
+        """本文の取得に失敗してもプロパティのみの結果を返す。"""
+        page = _make_page()
+        page["id"] = "page-a"
+        respx.post(NOTION_DB_QUERY_URL).mock(
+            return_value=Response(200, json=_make_query_response([page]))
+        )
+        respx.get("https://api.notion.com/v1/blocks/page-a/children").mock(
+            return_value=Response(404, json={"message": "not found"})
+        )
+
+        collector = NotionPaperCollector(token="secret_test", paper_db_id="test-paper-db-id")
+        results = await collector.collect("", fetch_body=1)
+
+        assert results[0].content == "Transformer architecture"
@@ -0,0 +1,64 @@
+"""NotionSchemaのテスト。"""
+
+from src.collectors.notion_schema import NotionSchema, PropertySpec
+
+
+def _make_page() -> dict:
+    return {
+        "properties": {
+            "Name": {"title": [{"plain_text": "Hello "}, {"plain_text": "World"}]},
+            "Memo": {"rich_text": [{"plain_text": "メモ"}]},
+            "Tags": {"multi_select": [{"name": "AI"}, {"name": "LLM"}]},
+            "Score": {"number": 4},
+            "Done": {"checkbox": True},
+            "Status": {"select": None},
+            "Link": {"url": None},
+            "Date": {"date": {"start": "2026-02-17"}},
+        }
+    }
+
+
+class TestNotionSchema:
+    """NotionSchemaのテスト。"""
+
+    def test_extract_all_types(self) -> None:
+        """各プロパティ型がフィールド名で抽出される。"""
+        schema = NotionSchema(
+            PropertySpec("Name", "title", "name"),
+            PropertySpec("Memo", "rich_text", "memo"),
+            PropertySpec("Tags", "multi_select", "tags"),
+            PropertySpec("Score", "number", "score"),
+            PropertySpec("Done", "checkbox", "done"),
+            PropertySpec("Status", "select", "status"),
+            PropertySpec("Link", "url", "url"),
+            PropertySpec("Date", "date", "published_date"),
+        )
+
+        assert schema.extract(_make_page()) == {
+            "name": "Hello World",
+            "memo": "メモ",
+            "tags": ["AI", "LLM"],
+            "score": 4.0,
+            "done": True,
+            "status": "",
+            "url": "",
+            "published_date": "2026-02-17",
+        }
+
+    def test_missing_property(self) -> None:
+        """ページに存在しないプロパティは空値になる。"""
+        schema = NotionSchema(PropertySpec("Missing", "title", "missing"))
+        assert schema.extract({"properties": {}}) == {"missing": ""}
+
+    def test_search_properties(self) -> None:
+        """searchableなtitle/rich_textのみが検索対象になる。"""
+        schema = NotionSchema(
+            PropertySpec("Name", "title", "name", searchable=True),
+            PropertySpec("Memo", "rich_text", "memo", searchable=True),
+            PropertySpec("Tags", "multi_select", "tags", searchable=True),
+            PropertySpec("Link", "url", "url"),
+        )
+
+        assert schema.search_properties == (("Name", "title"), ("Memo", "rich_text"))
+        assert schema.searchable_fields == ("name", "memo", "tags")
+        assert schema.property_names == ["Name", "Memo", "Tags", "Link"]
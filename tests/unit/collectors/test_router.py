@@ -0,0 +1,78 @@
+"""CollectorRouterのテスト。"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.collectors.router import CollectorRouter, Route, route_url
+from src.errors import CollectionError
+from src.models.blog_post import CollectedData
+
+
+class _StubCollector:
+    """呼び出しを記録するCollector。"""
+
+    def __init__(self, source: str, fail: bool = False) -> None:
+        self.source = source
+        self.fail = fail
+        self.queries: list[str] = []
+
+    async def collect(self, query: str, **kwargs: object) -> list[CollectedData]:
+        self.queries.append(query)
+        if self.fail:
+            raise CollectionError(source=self.source, message="failed")
+        return [
+            CollectedData(
+                source=self.source, title=query, content="", collected_at=datetime.now(UTC)
+            )
+        ]
+
+
+class TestRouteUrl:
+    """route_urlのテスト。"""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://arxiv.org/abs/2401.12345v2", Route("arxiv", "2401.12345v2")),
+            ("https://arxiv.org/pdf/2401.12345.pdf", Route("arxiv", "2401.12345")),
+            ("https://github.com/owner/repo", Route("github", "owner/repo")),
+            ("https://github.com/owner/repo.git/", Route("github", "owner/repo")),
+            (
+                "https://github.com/owner/repo/issues/1",
+                Route("url", "https://github.com/owner/repo/issues/1"),
+            ),
+            ("https://github.com/topics/llm", Route("url", "https://github.com/topics/llm")),
+            ("https://example.com/post", Route("url", "https://example.com/post")),
+        ],
+    )
+    def test_route(self, url: str, expected: Route) -> None:
+        assert route_url(url) == expected
+
+
+class TestCollectorRouter:
+    """CollectorRouterのテスト。"""
+
+    async def test_dispatches_by_url(self) -> None:
+        url_fetcher = _StubCollector("url_fetcher")
+        github = _StubCollector("github")
+        arxiv = _StubCollector("arxiv")
+        router = CollectorRouter(url_fetcher=url_fetcher, github=github, arxiv=arxiv)
+
+        await router.collect("https://github.com/owner/repo")
+        await router.collect("https://arxiv.org/abs/2401.12345")
+        await router.collect("https://example.com/post")
+
+        assert github.queries == ["owner/repo"]
+        assert arxiv.queries == ["2401.12345"]
+        assert url_fetcher.queries == ["https://example.com/post"]
+
+    async def test_falls_back_to_html_on_failure(self) -> None:
+        url_fetcher = _StubCollector("url_fetcher")
+        github = _StubCollector("github", fail=True)
+        router = CollectorRouter(url_fetcher=url_fetcher, github=github)
+
+        results = await router.collect("https://github.com/owner/repo")
+
+        assert results[0].source == "url_fetcher"
+        assert url_fetcher.queries == ["https://github.com/owner/repo"]
@@ -1,11 +1,23 @@
 """URLFetcherCollectorのテスト。"""
 
+import asyncio
+
 import httpx
 import pytest
 
 from src.collectors.url_fetcher import URLFetcherCollector
 from src.errors import CollectionError
 
+ARTICLE_HTML = (
+    "<html><head><title>発表</title></head><body>"
+    "<div class='cookie-banner'>当サイトはCookieを使用しています。<a href='/p'>詳細</a></div>"
+    "<article><h1>新モデル発表</h1>"
+    "<p>本日、研究チームは新しい大規模言語モデルを発表しました。推論性能、コード生成、"
+    "多言語対応の各分野で改善を示しています。</p>"
+    "<p>新モデルは長い文脈の処理能力が向上し、より正確な回答を生成できるようになりました。</p>"
+    "</article><footer>Copyright</footer></body></html>"
+)
+
 
 class TestURLFetcherCollector:
     """URLFetcherCollectorのテスト。"""
@@ -65,6 +77,93 @@ class TestURLFetcherCollector:
         with pytest.raises(CollectionError):
             await collector.collect("https://example.com/404")
 
+    async def test_cache_serves_fresh_page_without_request(self, respx_mock: object) -> None:
+        """有効期間内のページはキャッシュから抽出済みのテキストを返す。"""
+        import respx as respx_lib
+
+        from src.utils.http_cache import HTTPCache
+
+        route = respx_lib.get("https://example.com/article").mock(
+            return_value=httpx.Response(
+                200,
+                text="<title>Cached</title><p>Body</p>",
+                headers={"content-type": "text/html", "cache-control": "max-age=600"},
+            )
+        )
+
+        collector = URLFetcherCollector(cache=HTTPCache(":memory:"))
+        await collector.collect("https://example.com/article")
+        results = await collector.collect("https://example.com/article")
+
+        assert route.call_count == 1
+        assert results[0].title == "Cached"
+        assert results[0].content == "Body"
+
+    async def test_cache_revalidates_stale_page(self, respx_mock: object) -> None:
+        """期限切れのページは条件付きリクエストで再検証し、304ならキャッシュを返す。"""
+        import respx as respx_lib
+
+        from src.utils.http_cache import HTTPCache
+
+        route = respx_lib.get("https://example.com/article")
+        route.side_effect = [
+            httpx.Response(
+                200,
+                text="<title>Page</title><p>Body</p>",
+                headers={"content-type": "text/html", "etag": '"v1"'},
+            ),
+            httpx.Response(304, headers={"etag": '"v1"'}),
+        ]
+
+        collector = URLFetcherCollector(cache=HTTPCache(":memory:"))
+        await collector.collect("https://example.com/article")
+        results = await collector.collect("https://example.com/article")
+
+        assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+        assert results[0].title == "Page"
+        assert "Body" in results[0].content
+
+    async def test_cache_not_used_for_larger_max_bytes(self, respx_mock: object) -> None:
+        """切り詰めて保存したページは、より大きな上限での取得に使わない。"""
+        import respx as respx_lib
+
+        from src.utils.http_cache import HTTPCache
+
+        route = respx_lib.get("https://example.com/large.txt").mock(
+            return_value=httpx.Response(
+                200,
+                text="x" * 5000,
+                headers={"content-type": "text/plain", "cache-control": "max-age=600"},
+            )
+        )
+
+        collector = URLFetcherCollector(max_bytes=1000, cache=HTTPCache(":memory:"))
+        await collector.collect("https://example.com/large.txt")
+        results = await collector.collect("https://example.com/large.txt", max_bytes=10000)
+
+        assert route.call_count == 2
+        assert len(results[0].content) == 5000
+
+    async def test_collect_extracts_main_content(self, respx_mock: object) -> None:
+        """HTMLは本文ブロックのみを返し、main_content=Falseならページ全体を返す。"""
+        import respx as respx_lib
+
+        respx_lib.get("https://example.com/article").mock(
+            return_value=httpx.Response(
+                200,
+                text=ARTICLE_HTML,
+                headers={"content-type": "text/html"},
+            )
+        )
+
+        main = await URLFetcherCollector().collect("https://example.com/article")
+        full = await URLFetcherCollector(main_content=False).collect("https://example.com/article")
+
+        assert "Cookieを使用しています" not in main[0].content
+        assert "Cookieを使用しています" in full[0].content
+        assert "本日、研究チームは" in main[0].content
+        assert len(main[0].content) < len(full[0].content)
+
     def test_extract_text_from_html(self) -> None:
         """HTMLからテキストを正しく抽出できる。"""
         html = (
@@ -76,6 +175,11 @@ class TestURLFetcherCollector:
         assert "Content" in text
         assert "var x=1" not in text
 
+    def test_extract_text_skips_navigation(self) -> None:
+        """nav・footerの内容は抽出しない。"""
+        html = "<body><nav>Menu</nav><p>Content</p><footer>Copyright</footer></body>"
+        assert URLFetcherCollector._extract_text_from_html(html) == "Content"
+
     def test_extract_title(self) -> None:
         """HTMLからタイトルを正しく抽出できる。"""
         html = "<html><head><title>My Title</title></head></html>"
@@ -87,3 +191,141 @@ class TestURLFetcherCollector:
         html = "<html><body>No title</body></html>"
         title = URLFetcherCollector._extract_title(html)
         assert title == "Untitled"
+
+    async def test_collect_truncates_at_max_bytes(self, respx_mock: object) -> None:
+        """最大バイト数を超える本文は打ち切り、truncatedを立てる。"""
+        import respx as respx_lib
+
+        respx_lib.get("https://example.com/large.txt").mock(
+            return_value=httpx.Response(
+                200,
+                text="x" * 5000,
+                headers={"content-type": "text/plain"},
+            )
+        )
+
+        collector = URLFetcherCollector(max_bytes=1000)
+        results = await collector.collect("https://example.com/large.txt")
+
+        assert results[0].content == "x" * 1000
+        assert results[0].truncated is True
+
+        results = await collector.collect("https://example.com/large.txt", max_bytes=10000)
+        assert len(results[0].content) == 5000
+        assert results[0].truncated is False
+
+
+class TestURLFetcherCollectMany:
+    """URLFetcherCollector.collect_manyのテスト。"""
+
+    async def test_returns_results_and_errors_per_url(self, respx_mock: object) -> None:
+        """失敗したURLはエラーとして返し、他のURLの結果は返す。"""
+        import respx as respx_lib
+
+        respx_lib.get("https://example.com/a").mock(
+            return_value=httpx.Response(
+                200, text="<title>A</title><p>Body A</p>", headers={"content-type": "text/html"}
+            )
+        )
+        respx_lib.get("https://example.com/missing").mock(return_value=httpx.Response(404))
+        respx_lib.get("https://example.org/b").mock(
+            return_value=httpx.Response(200, text="Body B", headers={"content-type": "text/plain"})
+        )
+
+        collector = URLFetcherCollector()
+        results = await collector.collect_many(
+            [
+                "https://example.com/a",
+                "ftp://example.com/file",
+                "https://example.com/missing",
+                "https://example.org/b",
+            ]
+        )
+
+        assert [result.url for result in results] == [
+            "https://example.com/a",
+            "ftp://example.com/file",
+            "https://example.com/missing",
+            "https://example.org/b",
+        ]
+        assert results[0].data is not None and results[0].data.title == "A"
+        assert results[1].data is None and isinstance(results[1].error, CollectionError)
+        assert results[2].data is None and isinstance(results[2].error, CollectionError)
+        assert results[3].data is not None and results[3].data.content == "Body B"
+
+    async def test_invalid_urls_rejected_before_any_request(self, respx_mock: object) -> None:
+        """不正なURLは通信せずにエラーとする。"""
+        import respx as respx_lib
+
+        route = respx_lib.get("https://example.com/a").mock(
+            return_value=httpx.Response(200, text="ok", headers={"content-type": "text/plain"})
+        )
+
+        collector = URLFetcherCollector()
+        results = await collector.collect_many(["http://localhost/admin", "https://example.com/a"])
+
+        assert results[0].error is not None
+        assert results[1].error is None
+        assert route.call_count == 1
+
+    async def test_limits_concurrency_per_host(self, respx_mock: object) -> None:
+        """ホストごとの同時リクエスト数をper_host以下に抑え、待ちの間も他ホストを並行に取得する。"""
+        import respx as respx_lib
+
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def slow_response(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+            total = sum(active.values())
+            peak["total"] = max(peak.get("total", 0), total)
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200, text="ok", headers={"content-type": "text/plain"})
+
+        respx_lib.get(url__regex=r"https://\w+\.example\.com/.*").mock(side_effect=slow_response)
+
+        urls = [f"https://same.example.com/{i}" for i in range(8)]
+        urls += [f"https://host{i}.example.com/" for i in range(8)]
+        collector = URLFetcherCollector()
+        results = await collector.collect_many(urls, concurrency=8, per_host=2)
+
+        assert all(result.data is not None for result in results)
+        assert peak["same.example.com"] == 2
+        assert peak["total"] == 8
+
+    @pytest.mark.parametrize("option", ["concurrency", "per_host"])
+    async def test_zero_concurrency_treated_as_one(self, respx_mock: object, option: str) -> None:
+        """同時実行数に0を指定しても停止せず、1件ずつ取得する。"""
+        import respx as respx_lib
+
+        respx_lib.get(url__regex=r"https://example\.com/.*").mock(
+            return_value=httpx.Response(200, text="ok", headers={"content-type": "text/plain"})
+        )
+
+        collector = URLFetcherCollector()
+        results = await asyncio.wait_for(
+            collector.collect_many(
+                ["https://example.com/a", "https://example.com/b"], **{option: 0}
+            ),
+            timeout=5,
+        )
+
+        assert all(result.data is not None for result in results)
+
+    async def test_malformed_url_is_per_url_error(self, respx_mock: object) -> None:
+        """URLとして解析できない入力は、そのURLのみエラーの結果とする。"""
+        import respx as respx_lib
+
+        respx_lib.get("https://example.com/ok").mock(
+            return_value=httpx.Response(200, text="ok", headers={"content-type": "text/plain"})
+        )
+
+        collector = URLFetcherCollector()
+        results = await collector.collect_many(["http://[::1", "https://example.com/ok"])
+
+        assert results[0].error is not None
+        assert "不正なURL" in str(results[0].error)
+        assert results[1].data is not None
@@ -53,6 +53,45 @@ class TestBlogPostGenerator:
             assert "テストデータ" in context
             assert "テストコンテンツ" in context
 
+        def test_duplicate_collected_data_merged(self, tmp_project_dir: Path) -> None:
+            """同じURLの収集データは1件にまとめられる。"""
+            gen = BlogPostGenerator(base_dir=tmp_project_dir)
+            template = gen.get_template("weekly-ai-news")
+            data = [
+                CollectedData(
+                    source=source,
+                    title=f"{source}の記事",
+                    url=url,
+                    content="テストコンテンツ",
+                    collected_at=datetime.now(UTC),
+                )
+                for source, url in [
+                    ("notion_news", "https://example.com/a?utm_source=alert"),
+                    ("web_search", "https://example.com/a/"),
+                ]
+            ]
+            context = gen.build_prompt_context(template, collected_data=data)
+            assert context.count("https://example.com/a") == 1
+
+            context = gen.build_prompt_context(template, collected_data=data, dedup=False)
+            assert context.count("https://example.com/a") == 2
+
+        def test_truncated_collected_data_marked(self, tmp_project_dir: Path) -> None:
+            """切り詰めた収集データには省略の注記が付く。"""
+            gen = BlogPostGenerator(base_dir=tmp_project_dir)
+            template = gen.get_template("weekly-ai-news")
+            data = [
+                CollectedData(
+                    source="url_fetcher",
+                    title="長い記事",
+                    content="本文",
+                    collected_at=datetime.now(UTC),
+                    truncated=True,
+                )
+            ]
+            context = gen.build_prompt_context(template, collected_data=data)
+            assert "（以下省略）" in context
+
     class TestGenerate:
         """generateのテスト。"""
 
@@ -0,0 +1,34 @@
+"""fast_jsonのテスト。"""
+
+import httpx
+import pytest
+
+from src.utils import fast_json
+
+
+class TestLoads:
+    """loadsのテスト。"""
+
+    def test_decodes_bytes_and_str(self) -> None:
+        data = '{"title": "ニュース", "tags": ["AI"], "count": 1}'
+        expected = {"title": "ニュース", "tags": ["AI"], "count": 1}
+        assert fast_json.loads(data) == expected
+        assert fast_json.loads(data.encode("utf-8")) == expected
+
+    def test_invalid_json_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            fast_json.loads(b"{invalid")
+
+    def test_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(fast_json, "_orjson", None)
+        assert fast_json.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        with pytest.raises(ValueError):
+            fast_json.loads(b"{invalid")
+
+
+class TestResponseJson:
+    """response_jsonのテスト。"""
+
+    def test_matches_httpx_json(self) -> None:
+        response = httpx.Response(200, json={"results": [{"id": "p1"}], "has_more": False})
+        assert fast_json.response_json(response) == response.json()
@@ -0,0 +1,241 @@
+"""http_cacheのテスト。"""
+
+import httpx
+import respx
+
+from src.utils.http_cache import (
+    CachedResponse,
+    CachingTransport,
+    HTTPCache,
+    cache_key,
+    freshness_lifetime,
+    is_storable,
+)
+
+URL = "https://api.github.com/repos/owner/repo"
+
+
+def _client(cache: HTTPCache) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=CachingTransport(cache))
+
+
+class TestCacheKey:
+    """cache_keyのテスト。"""
+
+    def test_key_depends_on_auth_and_accept(self) -> None:
+        base = httpx.Request("GET", URL)
+        authed = httpx.Request("GET", URL, headers={"Authorization": "Bearer a"})
+        other = httpx.Request("GET", URL, headers={"Authorization": "Bearer b"})
+        raw = httpx.Request("GET", URL, headers={"Accept": "application/vnd.github.v3.raw"})
+        keys = {cache_key(request) for request in (base, authed, other, raw)}
+        assert len(keys) == 4
+
+    def test_key_does_not_contain_token(self) -> None:
+        request = httpx.Request("GET", URL, headers={"Authorization": "Bearer secret"})
+        assert "secret" not in cache_key(request)
+
+
+class TestFreshness:
+    """鮮度判定のテスト。"""
+
+    def test_max_age_preferred_over_expires(self) -> None:
+        headers = {
+            "cache-control": "public, max-age=60",
+            "date": "Mon, 05 Jan 2026 00:00:00 GMT",
+            "expires": "Mon, 05 Jan 2026 01:00:00 GMT",
+        }
+        assert freshness_lifetime(headers) == 60
+
+    def test_expires_relative_to_date(self) -> None:
+        headers = {
+            "date": "Mon, 05 Jan 2026 00:00:00 GMT",
+            "expires": "Mon, 05 Jan 2026 01:00:00 GMT",
+        }
+        assert freshness_lifetime(headers) == 3600
+
+    def test_no_cache_and_missing_expiry_are_stale(self) -> None:
+        assert freshness_lifetime({"cache-control": "no-cache, max-age=60"}) == 0
+        assert freshness_lifetime({"etag": '"v1"'}) == 0
+        assert freshness_lifetime({"expires": "0"}) == 0
+
+    def test_is_fresh_accounts_for_age(self) -> None:
+        cached = CachedResponse(
+            url=URL,
+            status_code=200,
+            headers={"cache-control": "max-age=100", "age": "30"},
+            body=b"",
+            stored_at=1000.0,
+        )
+        assert cached.is_fresh(now=1060.0)
+        assert not cached.is_fresh(now=1080.0)
+
+    def test_is_storable(self) -> None:
+        assert is_storable(200, {"etag": '"v1"'})
+        assert is_storable(200, {"cache-control": "max-age=60"})
+        assert not is_storable(200, {})
+        assert not is_storable(200, {"etag": '"v1"', "cache-control": "no-store"})
+        assert not is_storable(200, {"etag": '"v1"', "vary": "*"})
+        assert not is_storable(404, {"etag": '"v1"'})
+
+
+class TestCachingTransport:
+    """CachingTransportのテスト。"""
+
+    @respx.mock
+    async def test_replays_cached_body_on_304(self) -> None:
+        """2回目は条件付きリクエストを送り、304ならキャッシュのボディを返す。"""
+        route = respx.get(URL)
+        route.side_effect = [
+            httpx.Response(200, json={"full_name": "owner/repo"}, headers={"ETag": '"v1"'}),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+        ]
+        cache = HTTPCache(":memory:")
+
+        async with _client(cache) as client:
+            first = await client.get(URL)
+            second = await client.get(URL)
+
+        assert first.json() == {"full_name": "owner/repo"}
+        assert second.status_code == 200
+        assert second.json() == {"full_name": "owner/repo"}
+        assert "if-none-match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+
+    @respx.mock
+    async def test_modified_response_replaces_cache(self) -> None:
+        """200応答ならキャッシュを更新する。"""
+        route = respx.get(URL)
+        route.side_effect = [
+            httpx.Response(
+                200, text="old", headers={"Last-Modified": "Mon, 01 Jan 2026 00:00:00 GMT"}
+            ),
+            httpx.Response(200, text="new", headers={"ETag": '"v2"'}),
+            httpx.Response(304),
+        ]
+        cache = HTTPCache(":memory:")
+
+        async with _client(cache) as client:
+            await client.get(URL)
+            await client.get(URL)
+            third = await client.get(URL)
+
+        assert route.calls[1].request.headers["if-modified-since"] == (
+            "Mon, 01 Jan 2026 00:00:00 GMT"
+        )
+        assert route.calls[2].request.headers["if-none-match"] == '"v2"'
+        assert third.text == "new"
+
+    @respx.mock
+    async def test_response_without_validator_not_cached(self) -> None:
+        """ETag/Last-Modifiedのない応答は保存しない。"""
+        route = respx.get(URL).mock(return_value=httpx.Response(200, text="body"))
+        cache = HTTPCache(":memory:")
+
+        async with _client(cache) as client:
+            await client.get(URL)
+            await client.get(URL)
+
+        assert cache.total_size() == 0
+        assert "if-none-match" not in route.calls[1].request.headers
+
+    @respx.mock
+    async def test_fresh_response_served_without_request(self) -> None:
+        """max-ageの期間内は通信せずにキャッシュを返す。"""
+        route = respx.get(URL).mock(
+            return_value=httpx.Response(
+                200, text="body", headers={"Cache-Control": "max-age=3600", "ETag": '"v1"'}
+            )
+        )
+        cache = HTTPCache(":memory:")
+
+        async with _client(cache) as client:
+            await client.get(URL)
+            second = await client.get(URL)
+
+        assert route.call_count == 1
+        assert second.text == "body"
+
+    @respx.mock
+    async def test_different_identity_not_shared(self) -> None:
+        """認証情報が異なるリクエストではキャッシュを共有しない。"""
+        route = respx.get(URL).mock(
+            return_value=httpx.Response(200, text="body", headers={"ETag": '"v1"'})
+        )
+        cache = HTTPCache(":memory:")
+
+        async with _client(cache) as client:
+            await client.get(URL, headers={"Authorization": "Bearer a"})
+            await client.get(URL, headers={"Authorization": "Bearer b"})
+
+        assert "if-none-match" not in route.calls[1].request.headers
+
+    @respx.mock
+    async def test_post_not_cached(self) -> None:
+        """GET以外はキャッシュしない。"""
+        respx.post(URL).mock(return_value=httpx.Response(200, text="ok", headers={"ETag": '"x"'}))
+        cache = HTTPCache(":memory:")
+
+        async with _client(cache) as client:
+            await client.post(URL)
+
+        assert cache.total_size() == 0
+
+
+class TestHTTPCacheEviction:
+    """HTTPCacheのサイズ上限のテスト。"""
+
+    def test_least_recently_used_evicted(self) -> None:
+        cache = HTTPCache(":memory:", max_bytes=10)
+        headers = httpx.Headers({"ETag": '"x"'})
+        cache.put("a", "https://example.com/a", 200, headers, b"aaaa")
+        cache.put("b", "https://example.com/b", 200, headers, b"bbbb")
+        assert cache.get("a") is not None
+        cache.put("c", "https://example.com/c", 200, headers, b"cccc")
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.total_size() <= 10
+
+    def test_extracted_kept_on_refresh(self) -> None:
+        cache = HTTPCache(":memory:")
+        key = "a"
+        cache.put(key, URL, 200, httpx.Headers({"ETag": '"x"'}), b"body", extracted="text")
+        refreshed = cache.refresh(key, httpx.Headers({"ETag": '"x"', "Cache-Control": "max-age=5"}))
+        assert refreshed is not None
+        assert refreshed.extracted == "text"
+        assert refreshed.headers["cache-control"] == "max-age=5"
+        assert cache.total_size() == len(b"body") + len(b"text")
+
+    def test_migrates_file_without_extracted_column(self, tmp_path: object) -> None:
+        import sqlite3
+        from pathlib import Path
+
+        path = Path(str(tmp_path)) / "old.sqlite3"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE responses (key TEXT PRIMARY KEY, url TEXT NOT NULL, "
+            "status_code INTEGER NOT NULL, headers TEXT NOT NULL, body BLOB NOT NULL, "
+            "size INTEGER NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("INSERT INTO responses VALUES ('a', ?, 200, '{}', x'00', 1, 0, 0)", (URL,))
+        conn.commit()
+        conn.close()
+
+        cached = HTTPCache(path).get("a")
+        assert cached is not None
+        assert cached.extracted is None
+
+    def test_persists_to_disk(self, tmp_path: object) -> None:
+        from pathlib import Path
+
+        path = Path(str(tmp_path)) / "cache" / "http.sqlite3"
+        cache = HTTPCache(path)
+        cache.put("a", "https://example.com/a", 200, httpx.Headers({"ETag": '"x"'}), b"body")
+        cache.close()
+
+        reopened = HTTPCache(path)
+        cached = reopened.get("a")
+        assert cached is not None
+        assert cached.body == b"body"
+        assert cached.etag == '"x"'
@@ -0,0 +1,33 @@
+"""TokenBucketのテスト。"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.rate_limit import TokenBucket
+
+
+class TestTokenBucket:
+    """TokenBucketのテスト。"""
+
+    async def test_burst_within_capacity(self) -> None:
+        """capacity分までは待機せずに取得できる。"""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.1
+
+    async def test_waits_for_refill(self) -> None:
+        """トークン枯渇時は補充されるまで待機する。"""
+        bucket = TokenBucket(rate=20.0, capacity=1)
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+        # 1件目は即時、残り2件は1/20秒ずつ待つ
+        assert time.monotonic() - start >= 0.09
+
+    def test_invalid_rate_raises(self) -> None:
+        """rateが0以下の場合はValueErrorが発生する。"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
@@ -0,0 +1,42 @@
+"""RetryPolicyのテスト。"""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+from src.utils.retry import RetryPolicy, parse_retry_after
+
+
+class TestRetryPolicy:
+    """RetryPolicyのテスト。"""
+
+    def test_is_retryable(self) -> None:
+        """429と5xxはリトライ対象、4xxは対象外。"""
+        policy = RetryPolicy()
+        assert policy.is_retryable(429)
+        assert policy.is_retryable(502)
+        assert not policy.is_retryable(400)
+        assert not policy.is_retryable(404)
+
+    def test_compute_delay_honors_retry_after(self) -> None:
+        """Retry-Afterがある場合はその秒数を待機する。"""
+        policy = RetryPolicy(max_delay=1.0)
+        assert policy.compute_delay(0, "5") == 5.0
+
+    def test_compute_delay_jitter_bounds(self) -> None:
+        """バックオフは0〜base_delay*2^attemptの範囲（上限max_delay）。"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        for attempt in range(6):
+            delay = policy.compute_delay(attempt)
+            assert 0 <= delay <= min(4.0, 2**attempt)
+
+    def test_parse_retry_after_http_date(self) -> None:
+        """HTTP日付形式のRetry-Afterを秒数に変換できる。"""
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert delay is not None
+        assert 25 <= delay <= 30
+
+    def test_parse_retry_after_invalid(self) -> None:
+        """解釈できない値はNoneになる。"""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
@@ -0,0 +1,82 @@
+"""streamingのテスト。"""
+
+from collections.abc import AsyncIterator
+
+import httpx
+
+from src.utils.streaming import read_capped
+
+
+def _client(chunks: list[bytes], sent: list[bytes], content_type: str) -> httpx.AsyncClient:
+    """チャンクを順に返し、送出したチャンクをsentに記録するクライアントを作る。"""
+
+    async def body() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            sent.append(chunk)
+            yield chunk
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": content_type}, content=body())
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestReadCapped:
+    """read_cappedのテスト。"""
+
+    async def test_reads_whole_body_within_limit(self) -> None:
+        sent: list[bytes] = []
+        async with (
+            _client([b"hello ", b"world"], sent, "text/plain") as client,
+            client.stream("GET", "https://example.com/") as response,
+        ):
+            result = await read_capped(response, max_bytes=11)
+        assert result.text == "hello world"
+        assert result.truncated is False
+
+    async def test_stops_reading_at_limit(self) -> None:
+        sent: list[bytes] = []
+        chunks = [b"a" * 10, b"b" * 10, b"c" * 10, b"d" * 10]
+        async with (
+            _client(chunks, sent, "text/plain") as client,
+            client.stream("GET", "https://example.com/") as response,
+        ):
+            result = await read_capped(response, max_bytes=15)
+        assert result.text == "a" * 10 + "b" * 5
+        assert result.truncated is True
+        assert len(sent) < len(chunks)
+
+    async def test_drops_partial_multibyte_character(self) -> None:
+        sent: list[bytes] = []
+        # 「日本語」はUTF-8で9バイト。4バイト目で切ると2文字目が途中になる
+        async with (
+            _client(["日本語".encode()], sent, "text/plain; charset=utf-8") as client,
+            client.stream("GET", "https://example.com/") as response,
+        ):
+            result = await read_capped(response, max_bytes=4)
+        assert result.text == "日"
+        assert result.truncated is True
+
+    async def test_decodes_with_declared_charset(self) -> None:
+        sent: list[bytes] = []
+        async with (
+            _client(
+                ["ニュース".encode("shift_jis")], sent, "text/html; charset=shift_jis"
+            ) as client,
+            client.stream("GET", "https://example.com/") as response,
+        ):
+            result = await read_capped(response, max_bytes=1024)
+        assert result.text == "ニュース"
+
+    async def test_passes_decoded_chunks_to_callback(self) -> None:
+        sent: list[bytes] = []
+        received: list[str] = []
+        data = "日本語".encode()
+        # マルチバイト文字の途中で分割したチャンクでも文字単位で渡す
+        async with (
+            _client([data[:4], data[4:]], sent, "text/plain; charset=utf-8") as client,
+            client.stream("GET", "https://example.com/") as response,
+        ):
+            result = await read_capped(response, on_text=received.append)
+        assert received == ["日", "本語"]
+        assert result.text == "日本語"